@@ -74,9 +74,10 @@ from .exceptions import (
 )
 from .group import Group
 from .group_helpers import build_group_state_from_players
+from .history import StateHistory
 from .models import DeviceInfo, PlayerStatus
 from .normalize import normalize_device_info
-from .player import NotificationPlaybackResult, Player
+from .player import NotificationPlaybackResult, Player, PlayerUpdate, fleet_updates
 from .polling import PollingStrategy, TrackChangeDetector, fetch_parallel
 from .profiles import (
     PROFILES,
@@ -94,6 +95,8 @@ __all__ = [
     # Player and Group
     "Player",
     "NotificationPlaybackResult",
+    "PlayerUpdate",
+    "fleet_updates",
     "Group",
     # Exceptions
     "WiiMError",
@@ -127,6 +130,7 @@ __all__ = [
     # State Synchronization
     "StateSynchronizer",
     "GroupStateSynchronizer",
+    "StateHistory",
     # Device Profiles
     "DeviceProfile",
     "get_device_profile",
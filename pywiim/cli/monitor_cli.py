@@ -178,7 +178,7 @@ class PlayerMonitor:
     async def setup(self) -> None:
         """Initialize monitor and detect capabilities."""
         print("🔧 Initializing monitor...")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # Detect capabilities
         await self.player.client._detect_capabilities()
@@ -208,7 +208,7 @@ class PlayerMonitor:
                 def upnp_callback(event_data: dict[str, Any] | None = None, service_type: str | None = None):
                     # Track that UPnP event was received (even if no state change)
                     self.upnp_event_count += 1
-                    self.last_upnp_event_time = time.time()
+                    self.last_upnp_event_time = time.monotonic()
 
                     # Log UPnP event reception
                     _LOGGER.info(
@@ -312,7 +312,7 @@ class PlayerMonitor:
         if self.player.client.capabilities.get("supports_presets", False):
             try:
                 self.last_preset_count = await self.player.client.get_max_preset_slots()
-                self.last_preset_check = time.time()
+                self.last_preset_check = time.monotonic()
             except Exception:
                 pass  # Don't fail if preset count fetch fails
 
@@ -325,7 +325,7 @@ class PlayerMonitor:
 
         # Use player.role as source of truth (updated by refresh() via _synchronize_group_state())
         self.previous_role = self.player.role  # Initialize previous_role to avoid false positives
-        self.last_group_info_check = time.time()  # Initialize check time
+        self.last_group_info_check = time.monotonic()  # Initialize check time
 
         self.on_state_changed()
 
@@ -442,7 +442,7 @@ class PlayerMonitor:
                 self.on_state_changed(source="polling")
 
                 # Conditional fetching (less frequent data)
-                now = time.time()
+                now = time.monotonic()
 
                 # Device info (every 60s)
                 if self.strategy and self.strategy.should_fetch_configuration(self.last_device_info_check, now=now):
@@ -1331,7 +1331,7 @@ class PlayerMonitor:
         if self.start_time is None:
             return
 
-        duration = time.time() - self.start_time
+        duration = time.monotonic() - self.start_time
         duration_min = int(duration // 60)
         duration_sec = int(duration % 60)
 
@@ -1355,7 +1355,7 @@ class PlayerMonitor:
             print("\n📨 UPnP Events:")
             print(f"   • Total events received: {self.upnp_event_count}")
             if self.last_upnp_event_time and self.start_time:
-                time_since_last = time.time() - self.last_upnp_event_time
+                time_since_last = time.monotonic() - self.last_upnp_event_time
                 if time_since_last < 60:
                     print(f"   • Last event: {int(time_since_last)}s ago")
                 else:
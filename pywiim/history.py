@@ -0,0 +1,226 @@
+"""Bounded ring buffer of merged-state transitions.
+
+StateHistory records each change of the merged play_state, volume, mute, source
+and track signature produced by StateSynchronizer, together with which source
+(http/upnp/propagated/optimistic) won the merge for each field. Storage is
+array-backed with small-int encoded fields, so recording a transition costs a
+handful of array writes - cheap enough to leave on permanently for debugging
+state flapping without DEBUG logging.
+
+Example:
+    ```python
+    for entry in player.state_history.last(10):
+        print(entry["timestamp"], entry["play_state"], entry["winners"])
+    ```
+"""
+
+from __future__ import annotations
+
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .state import SynchronizedState, TimestampedField
+
+__all__ = ["StateHistory", "DEFAULT_HISTORY_SIZE", "HISTORY_SOURCES"]
+
+# Default number of transitions kept per player
+DEFAULT_HISTORY_SIZE = 128
+
+# Winning-source codes (index = code, 0 = no data)
+HISTORY_SOURCES: tuple[str | None, ...] = (None, "http", "upnp", "propagated", "optimistic")
+_SOURCE_CODES: dict[str, int] = {name: code for code, name in enumerate(HISTORY_SOURCES) if name}
+_OTHER_SOURCE_CODE = 15
+
+# Fields whose winning source is recorded, packed 4 bits each (in this order)
+_WINNER_FIELDS: tuple[str, ...] = ("play_state", "volume", "source", "title")
+
+# Label table limit: play_state/source strings are interned to one byte
+_MAX_LABELS = 255
+
+
+class StateHistory:
+    """Fixed-size ring buffer of merged-state transitions."""
+
+    def __init__(self, capacity: int = DEFAULT_HISTORY_SIZE) -> None:
+        """Initialize state history.
+
+        Args:
+            capacity: Maximum number of transitions kept (oldest are overwritten).
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be greater than 0")
+
+        self.capacity = capacity
+        self._timestamps = array("d", [0.0]) * capacity
+        self._play_state = array("B", bytes(capacity))  # label index, 0 = None
+        self._source = array("B", bytes(capacity))  # label index, 0 = None
+        self._volume = array("b", [-1]) * capacity  # 0-100, -1 = None
+        self._muted = array("b", [-1]) * capacity  # 0/1, -1 = None
+        self._track = array("L", [0]) * capacity  # CRC32 of title|artist|album, 0 = None
+        self._winners = array("H", bytes(2 * capacity))  # 4 bits per _WINNER_FIELDS entry
+
+        self._labels: list[str | None] = [None]
+        self._label_index: dict[str, int] = {}
+        self._track_labels: OrderedDict[int, str] = OrderedDict()
+
+        self._next = 0
+        self._count = 0
+        self._last_key: tuple[int, int, int, int, int] | None = None
+        self.total_recorded = 0
+
+    def __len__(self) -> int:
+        """Number of transitions currently stored."""
+        return self._count
+
+    def _intern(self, value: Any) -> int:
+        """Map a string value to a one-byte label index."""
+        if value is None:
+            return 0
+        text = str(value)
+        index = self._label_index.get(text)
+        if index is None:
+            if len(self._labels) >= _MAX_LABELS:
+                return _MAX_LABELS  # Table full - recorded as "other"
+            index = len(self._labels)
+            self._labels.append(text)
+            self._label_index[text] = index
+        return index
+
+    def _label(self, index: int) -> str | None:
+        """Reverse of _intern."""
+        if index < len(self._labels):
+            return self._labels[index]
+        return "other"
+
+    @staticmethod
+    def _encode_volume(value: Any) -> int:
+        """Encode volume as 0-100 (-1 for unknown)."""
+        if value is None:
+            return -1
+        try:
+            volume = float(value)
+        except (TypeError, ValueError):
+            return -1
+        if isinstance(value, float) and 0.0 <= volume <= 1.0:
+            volume *= 100
+        return max(0, min(100, int(round(volume))))
+
+    @staticmethod
+    def _encode_muted(value: Any) -> int:
+        """Encode mute as 0/1 (-1 for unknown)."""
+        if value is None:
+            return -1
+        return 1 if value else 0
+
+    def _encode_track(self, state: SynchronizedState) -> int:
+        """Encode title/artist/album into a 32-bit track signature."""
+        parts = [state.title, state.artist, state.album]
+        values = [field.value if field and field.value else "" for field in parts]
+        if not any(values):
+            return 0
+        label = " - ".join(str(v) for v in (values[1], values[0]) if v) or str(values[2])
+        signature = zlib.crc32("|".join(str(v) for v in values).encode("utf-8")) or 1
+        if signature not in self._track_labels:
+            self._track_labels[signature] = label
+            while len(self._track_labels) > self.capacity:
+                self._track_labels.popitem(last=False)
+        return signature
+
+    @staticmethod
+    def _encode_winners(state: SynchronizedState) -> int:
+        """Pack winning-source codes for _WINNER_FIELDS into 16 bits."""
+        packed = 0
+        for shift, field_name in enumerate(_WINNER_FIELDS):
+            field: TimestampedField | None = getattr(state, field_name)
+            code = 0
+            if field is not None:
+                code = _SOURCE_CODES.get(field.source, _OTHER_SOURCE_CODE)
+            packed |= code << (4 * shift)
+        return packed
+
+    def record(self, state: SynchronizedState, timestamp: float | None = None) -> bool:
+        """Record the merged state if it differs from the last recorded transition.
+
+        Args:
+            state: Merged state after a StateSynchronizer merge.
+            timestamp: Wall-clock time of the merge, for display (defaults to now).
+
+        Returns:
+            True if a new transition was recorded.
+        """
+        key = (
+            self._intern(state.play_state.value if state.play_state else None),
+            self._encode_volume(state.volume.value if state.volume else None),
+            self._encode_muted(state.muted.value if state.muted else None),
+            self._intern(state.source.value if state.source else None),
+            self._encode_track(state),
+        )
+        if key == self._last_key:
+            return False
+        self._last_key = key
+
+        slot = self._next
+        self._timestamps[slot] = time.time() if timestamp is None else timestamp
+        self._play_state[slot], self._volume[slot], self._muted[slot], self._source[slot], self._track[slot] = key
+        self._winners[slot] = self._encode_winners(state)
+
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total_recorded += 1
+        return True
+
+    def _entry(self, slot: int) -> dict[str, Any]:
+        """Decode one slot into a dictionary."""
+        volume = self._volume[slot]
+        muted = self._muted[slot]
+        track = self._track[slot]
+        packed = self._winners[slot]
+        winners: dict[str, str | None] = {}
+        for shift, field_name in enumerate(_WINNER_FIELDS):
+            code = (packed >> (4 * shift)) & 0xF
+            winners[field_name] = HISTORY_SOURCES[code] if code < len(HISTORY_SOURCES) else "other"
+        return {
+            "timestamp": self._timestamps[slot],
+            "play_state": self._label(self._play_state[slot]),
+            "volume": volume if volume >= 0 else None,
+            "muted": bool(muted) if muted >= 0 else None,
+            "source": self._label(self._source[slot]),
+            "track": self._track_labels.get(track) if track else None,
+            "track_signature": f"{track:08x}" if track else None,
+            "winners": winners,
+        }
+
+    def last(self, n: int | None = None) -> list[dict[str, Any]]:
+        """Return the most recent transitions, oldest first.
+
+        Args:
+            n: Number of transitions to return (default: all stored).
+
+        Returns:
+            List of decoded transition dictionaries.
+        """
+        count = self._count if n is None else max(0, min(n, self._count))
+        start = (self._next - count) % self.capacity
+        return [self._entry((start + i) % self.capacity) for i in range(count)]
+
+    def export(self) -> dict[str, Any]:
+        """Export the full history for diagnostics (JSON-serializable)."""
+        return {
+            "capacity": self.capacity,
+            "total_recorded": self.total_recorded,
+            "entries": self.last(),
+        }
+
+    def clear(self) -> None:
+        """Discard all recorded transitions."""
+        self._next = 0
+        self._count = 0
+        self._last_key = None
+        self.total_recorded = 0
@@ -6,14 +6,16 @@ that adds group awareness, role management, and cached state with getter methods
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
 from typing import TYPE_CHECKING, Any, Literal
 
 from ..client import WiiMClient
+from ..history import StateHistory
 from ..models import DeviceInfo, PlayerStatus
 from .audio import AudioConfiguration
 from .base import PlayerBase
 from .bluetooth import BluetoothControl
+from .changes import STATE_DIFF_FIELDS, StateDiff
 from .coverart import CoverArtManager
 from .diagnostics import DiagnosticsCollector
 from .groupops import GroupOperations
@@ -21,6 +23,7 @@ from .media import MediaControl, NotificationPlaybackResult
 from .playback import PlaybackControl
 from .properties import PlayerProperties
 from .statemgr import StateManager
+from .updates import PlayerUpdate, fleet_updates, player_updates
 from .volume import VolumeControl
 
 if TYPE_CHECKING:
@@ -125,6 +128,118 @@ class Player(PlayerBase):
         """Get current playback state by querying device."""
         return await self._state_mgr.get_play_state()
 
+    async def close(self) -> None:
+        """Release background resources held by the player.
+
+        Cancels a running stream metadata fetch and leaves the shared live ICY
+        reader (closing its connection if this was the last listener). Call
+        this when the player is removed; the client is closed separately with
+        ``player.client.close()``.
+        """
+        self._state_mgr.close()
+
+    def subscribe_state_changes(
+        self,
+        callback: Callable[[StateDiff], None],
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> Callable[[], None]:
+        """Subscribe to change-only notifications with field-level diffs.
+
+        The callback receives ``{field: (old, new)}`` for the user-visible
+        properties that changed since the last notification (see
+        ``STATE_DIFF_FIELDS``). Notifications where nothing watched changed
+        are suppressed entirely. The plain on_state_changed callback keeps
+        working alongside subscribers.
+
+        Example:
+            ```python
+            def on_diff(diff):
+                if "volume_level" in diff:
+                    old, new = diff["volume_level"]
+
+            unsubscribe = player.subscribe_state_changes(on_diff, exclude=["media_position"])
+            ```
+
+        Args:
+            callback: Function called with the diff dictionary.
+            fields: Only report these fields (default: all tracked fields).
+            exclude: Never report these fields (e.g. ``["media_position"]``).
+
+        Returns:
+            Function that cancels the subscription.
+        """
+        return self._change_notifier.subscribe(callback, fields=fields, exclude=exclude)
+
+    @property
+    def state_history(self) -> StateHistory | None:
+        """Recent merged-state transitions for debugging state flapping.
+
+        Each entry records play_state, volume, mute, source, track signature and
+        which source (http/upnp/propagated/optimistic) won the merge. Use
+        ``state_history.last(n)`` or ``state_history.export()``.
+        """
+        return self._state_synchronizer.history
+
+    def updates(
+        self,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> AsyncIterator[StateDiff]:
+        """Async stream of coalesced state diffs for this player.
+
+        Changes that arrive while the consumer is busy are merged per field
+        (oldest old value, newest new value), so a slow consumer only ever sees
+        one pending diff. For all players at once, use ``fleet_updates()``.
+
+        Example:
+            ```python
+            async for diff in player.updates(exclude=["media_position"]):
+                print(diff)
+            ```
+
+        Args:
+            fields: Only report these fields (default: all tracked fields).
+            exclude: Never report these fields.
+
+        Returns:
+            Async iterator yielding ``{field: (old, new)}`` diffs.
+        """
+        return player_updates(self, fields=fields, exclude=exclude)
+
+    @property
+    def batch_periodic_fetches(self) -> bool:
+        """Whether slow configuration fetches are aligned into batched refresh passes.
+
+        When enabled, any configuration tier (getMetaInfo, audio output, EQ, presets,
+        Bluetooth history, subwoofer) becoming due pulls every tier due within the next
+        20% of its interval into the same refresh. Disabled by default.
+        """
+        return self._state_mgr.batch_periodic_fetches
+
+    @batch_periodic_fetches.setter
+    def batch_periodic_fetches(self, enabled: bool) -> None:
+        """Enable or disable batched configuration fetching."""
+        self._state_mgr.batch_periodic_fetches = enabled
+
+    @property
+    def live_metadata(self) -> bool:
+        """Whether raw-URL radio titles follow ICY title changes live.
+
+        When enabled, an Icecast/SHOUTcast stream played by URL is followed by a
+        shared long-lived metadata reader (see pywiim.player.icy), so the title
+        changes as soon as the station sends it instead of being read once per
+        stream. Disabled by default.
+        """
+        return self._state_mgr._stream_enricher.live_metadata
+
+    @live_metadata.setter
+    def live_metadata(self, enabled: bool) -> None:
+        """Enable or disable live ICY metadata for raw-URL radio streams."""
+        self._state_mgr._stream_enricher.live_metadata = enabled
+        if not enabled:
+            self._state_mgr._stream_enricher.stop_live_metadata()
+
     # === Volume Control ===
 
     async def set_volume(self, volume: float) -> None:
@@ -232,6 +347,7 @@ class Player(PlayerBase):
         object_id: str = "Q:0",
         starting_index: int = 0,
         requested_count: int = 0,
+        use_cache: bool = False,
     ) -> list[dict[str, Any]]:
         """Get current queue contents (requires UPnP client with ContentDirectory service).
 
@@ -251,6 +367,8 @@ class Player(PlayerBase):
             object_id: Queue object ID (default "Q:0" for standard queue)
             starting_index: Starting index for pagination (0 = first item)
             requested_count: Number of items to retrieve (0 = all available)
+            use_cache: Serve the range from the paged queue cache, browsing only
+                pages that are missing or whose ContentDirectory UpdateID changed.
 
         Returns:
             List of queue item dictionaries, each containing:
@@ -273,7 +391,57 @@ class Player(PlayerBase):
                 print(f"{item['position']}: {item.get('title', 'Unknown')} - {item.get('artist', 'Unknown')}")
             ```
         """
-        return await self._media_ctrl.get_queue(object_id, starting_index, requested_count)
+        return await self._media_ctrl.get_queue(object_id, starting_index, requested_count, use_cache)
+
+    def iter_queue(self, object_id: str = "Q:0") -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream queue contents page by page (requires UPnP ContentDirectory).
+
+        Pages are cached and validated by the ContentDirectory UpdateID, so
+        repainting a large queue usually needs no Browse requests, and a changed
+        current position never does. Queue-changing commands clear the cache.
+
+        Args:
+            object_id: Queue object ID (default "Q:0" for standard queue)
+
+        Returns:
+            Async iterator of pages (lists of queue items as returned by get_queue()).
+
+        Example:
+            ```python
+            async for page in player.iter_queue():
+                for item in page:
+                    print(item["position"], item.get("title"))
+            ```
+        """
+        return self._media_ctrl.iter_queue(object_id)
+
+    def stream_queue(
+        self,
+        object_id: str = "Q:0",
+        starting_index: int = 0,
+        requested_count: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Browse the queue and yield items as the result is parsed.
+
+        The DIDL-Lite result is parsed incrementally, so a media browser can
+        render the first items of a very large queue immediately while memory
+        stays bounded (no full tree or item list is built).
+
+        Args:
+            object_id: Queue object ID (default "Q:0" for standard queue)
+            starting_index: Starting index for pagination (0 = first item)
+            requested_count: Number of items to retrieve (0 = all available)
+
+        Returns:
+            Async iterator of queue items (same fields as get_queue()).
+
+        Example:
+            ```python
+            async for item in player.stream_queue():
+                print(item["position"], item.get("title"))
+            ```
+        """
+        return self._media_ctrl.stream_queue(object_id, starting_index, requested_count)
 
     async def play_queue(self, queue_position: int = 0) -> None:
         """Start playing from the queue at a specific position.
@@ -558,13 +726,28 @@ class Player(PlayerBase):
 
     # === Cover Art ===
 
-    async def fetch_cover_art(self, url: str | None = None) -> tuple[bytes, str] | None:
-        """Fetch cover art image from URL."""
-        return await self._coverart_mgr.fetch_cover_art(url)
+    async def fetch_cover_art(self, url: str | None = None, size: int | None = None) -> tuple[bytes, str] | None:
+        """Fetch cover art image from URL (optionally scaled to fit size x size pixels)."""
+        return await self._coverart_mgr.fetch_cover_art(url, size)
 
-    async def get_cover_art_bytes(self, url: str | None = None) -> bytes | None:
+    async def get_cover_art_bytes(self, url: str | None = None, size: int | None = None) -> bytes | None:
         """Get cover art image bytes (convenience method)."""
-        return await self._coverart_mgr.get_cover_art_bytes(url)
+        return await self._coverart_mgr.get_cover_art_bytes(url, size)
+
+    def stream_cover_art(self, url: str | None = None) -> AsyncIterator[bytes]:
+        """Stream cover art in chunks (bounded memory; oversized downloads are aborted).
+
+        Example:
+            ```python
+            async for chunk in player.stream_cover_art():
+                await response.write(chunk)
+            ```
+        """
+        return self._coverart_mgr.stream_cover_art(url)
+
+    def get_cover_art_etag(self, url: str | None = None, size: int | None = None) -> str | None:
+        """ETag of the cover art fetch_cover_art() serves for url, if known (stable for the fallback logo)."""
+        return self._coverart_mgr.get_cover_art_etag(url, size)
 
     # === Group Operations ===
 
@@ -1306,4 +1489,11 @@ class Player(PlayerBase):
 
 
 # Export Player class
-__all__ = ["Player", "NotificationPlaybackResult"]
+__all__ = [
+    "Player",
+    "NotificationPlaybackResult",
+    "PlayerUpdate",
+    "StateDiff",
+    "STATE_DIFF_FIELDS",
+    "fleet_updates",
+]
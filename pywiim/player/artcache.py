@@ -0,0 +1,435 @@
+"""Process-wide cover art cache bounded by total bytes.
+
+Players in a group all show the master's artwork, and every player used to
+keep its own 10-entry cache, so each slave downloaded the same image again.
+CoverArtCache is shared by all players of the process:
+
+- Entries are keyed by artwork URL and kept in an OrderedDict in LRU order,
+  so hits and evictions are O(1).
+- The cache is bounded by the total size of the cached images rather than the
+  entry count, which caps memory predictably regardless of image sizes.
+- Entries expire after a TTL (artwork URLs of streaming services are often
+  signed and short-lived). Expired entries keep their ETag/Last-Modified
+  validators, so the next fetch can be a conditional GET.
+- Concurrent fetches of the same URL share one download (see fetch_once()).
+- Resized variants (see artresize) are cached next to the original, keyed by
+  (url, size), and dropped when the original image changes.
+
+An optional CoverArtDiskCache tier below the memory cache keeps images across
+restarts, so a controller restart revalidates artwork instead of downloading
+every image again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Memory cache key: artwork URL, or (URL, max edge in px) for a resized variant
+_CacheKey = str | tuple[str, int]
+
+__all__ = [
+    "CachedArtwork",
+    "CoverArtCache",
+    "CoverArtDiskCache",
+    "COVER_ART_CACHE_MAX_BYTES",
+    "COVER_ART_CACHE_TTL",
+    "COVER_ART_DISK_CACHE_MAX_BYTES",
+    "get_cover_art_cache",
+    "set_cover_art_cache",
+]
+
+# Total image bytes kept by the default cache (16 MiB)
+COVER_ART_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Seconds a cached image is served before it is revalidated
+COVER_ART_CACHE_TTL = 3600.0
+
+# Total image bytes kept on disk by default (128 MiB)
+COVER_ART_DISK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedArtwork:
+    """Downloaded image with the HTTP validators needed to revalidate it."""
+
+    data: bytes
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def has_validators(self) -> bool:
+        """True if a conditional GET can revalidate this image."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CoverArtDiskCache:
+    """On-disk artwork store (one image file plus JSON metadata per URL).
+
+    File access runs in the default executor. Errors are logged and treated
+    as misses - the disk tier is an optimization only.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        max_bytes: int = COVER_ART_DISK_CACHE_MAX_BYTES,
+        ttl: float = COVER_ART_CACHE_TTL,
+    ) -> None:
+        """Initialize disk cache.
+
+        Args:
+            path: Directory holding the cached images (created on first write).
+            max_bytes: Maximum total size of cached images; oldest entries are pruned.
+            ttl: Seconds since download/revalidation an entry is served without a request.
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        """Image and metadata file paths of a URL."""
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return self.path / f"{name}.img", self.path / f"{name}.json"
+
+    async def async_get(self, url: str) -> tuple[CachedArtwork, bool] | None:
+        """Read a stored image.
+
+        Returns:
+            (artwork, fresh) where fresh is False once the TTL has passed, or None on a miss.
+        """
+        try:
+            return await asyncio.to_thread(self._read, url)
+        except (OSError, ValueError, KeyError) as err:
+            _LOGGER.debug("Could not read cached cover art for %s: %s", url, err)
+            return None
+
+    async def async_put(self, url: str, artwork: CachedArtwork) -> None:
+        """Store an image (and prune the oldest entries beyond max_bytes)."""
+        try:
+            await asyncio.to_thread(self._write, url, artwork)
+        except OSError as err:
+            _LOGGER.debug("Could not store cover art for %s: %s", url, err)
+
+    async def async_touch(self, url: str) -> None:
+        """Mark an image as revalidated now (after a 304 Not Modified)."""
+        try:
+            await asyncio.to_thread(self._touch, url)
+        except (OSError, ValueError) as err:
+            _LOGGER.debug("Could not update cached cover art for %s: %s", url, err)
+
+    def _read(self, url: str) -> tuple[CachedArtwork, bool] | None:
+        image_path, meta_path = self._paths(url)
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("url") != url:
+            return None
+        artwork = CachedArtwork(
+            data=image_path.read_bytes(),
+            content_type=meta["content_type"],
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+        return artwork, time.time() - meta.get("stored_at", 0.0) < self.ttl
+
+    def _write(self, url: str, artwork: CachedArtwork) -> None:
+        image_path, meta_path = self._paths(url)
+        self.path.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "url": url,
+            "content_type": artwork.content_type,
+            "etag": artwork.etag,
+            "last_modified": artwork.last_modified,
+            "stored_at": time.time(),
+        }
+        # Image first, metadata last: a metadata file always has its image
+        self._replace(image_path, artwork.data)
+        self._replace(meta_path, json.dumps(meta).encode("utf-8"))
+        self._prune()
+
+    def _touch(self, url: str) -> None:
+        _, meta_path = self._paths(url)
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        meta["stored_at"] = time.time()
+        self._replace(meta_path, json.dumps(meta).encode("utf-8"))
+
+    @staticmethod
+    def _replace(path: Path, data: bytes) -> None:
+        """Write a file via a temporary file and rename."""
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _prune(self) -> None:
+        """Remove least recently stored images until the directory fits max_bytes."""
+        images = [(entry.stat().st_mtime, entry.stat().st_size, entry) for entry in self.path.glob("*.img")]
+        total = sum(size for _, size, _ in images)
+        for _, size, image_path in sorted(images, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            image_path.with_suffix(".json").unlink(missing_ok=True)
+            image_path.unlink(missing_ok=True)
+            total -= size
+
+
+class CoverArtCache:
+    """LRU cache of downloaded cover art images, bounded by total bytes."""
+
+    def __init__(
+        self,
+        max_bytes: int = COVER_ART_CACHE_MAX_BYTES,
+        ttl: float = COVER_ART_CACHE_TTL,
+        disk_cache: CoverArtDiskCache | None = None,
+    ) -> None:
+        """Initialize cover art cache.
+
+        Args:
+            max_bytes: Maximum total size of cached images.
+            ttl: Seconds an entry is served before it is revalidated.
+            disk_cache: Optional on-disk tier below the memory cache.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_cache = disk_cache
+        self._entries: OrderedDict[_CacheKey, tuple[CachedArtwork, float]] = OrderedDict()
+        self._size = 0
+        self._inflight: dict[_CacheKey, asyncio.Task[CachedArtwork | None]] = {}
+
+        # Counters (see statistics)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.shared_fetches = 0
+
+    def __len__(self) -> int:
+        """Number of cached images."""
+        return len(self._entries)
+
+    def __contains__(self, url: object) -> bool:
+        """Whether an image is cached for url (expired or not)."""
+        return url in self._entries
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached images."""
+        return self._size
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Cache counters for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "shared_fetches": self.shared_fetches,
+            "inflight": len(self._inflight),
+            "disk": self.disk_cache is not None,
+        }
+
+    @staticmethod
+    def _key(url: str, size: int | None) -> _CacheKey:
+        return url if size is None else (url, size)
+
+    def get(self, url: str, now: float | None = None, size: int | None = None) -> CachedArtwork | None:
+        """Get a fresh cached image and mark it most recently used.
+
+        Args:
+            url: Artwork URL.
+            now: Current monotonic time (defaults to time.monotonic()).
+            size: Max edge of a resized variant (None for the original image).
+
+        Returns:
+            Cached artwork, or None on a miss or expired entry (see peek()).
+        """
+        key = self._key(url, size)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if now is None:
+            now = time.monotonic()
+        artwork, stored_at = entry
+        if now - stored_at >= self.ttl:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return artwork
+
+    def is_fetching(self, url: str, size: int | None = None) -> bool:
+        """Whether a shared fetch of url (or its size variant) is in flight."""
+        task = self._inflight.get(self._key(url, size))
+        return task is not None and not task.done()
+
+    def peek(self, url: str, size: int | None = None) -> CachedArtwork | None:
+        """Get a cached image even if expired (for revalidation), without touching LRU order or stats."""
+        entry = self._entries.get(self._key(url, size))
+        return entry[0] if entry is not None else None
+
+    def put(self, url: str, artwork: CachedArtwork, now: float | None = None, size: int | None = None) -> None:
+        """Store an image, evicting least recently used entries to stay within max_bytes.
+
+        Images larger than max_bytes are not cached. Storing an original whose
+        bytes changed drops its resized variants. A "variant" that is the
+        original itself (the image already fits) is not stored, so its bytes
+        are not counted twice; get(url, size=...) misses and callers fall back
+        to the original.
+
+        Args:
+            url: Artwork URL.
+            artwork: Downloaded (or resized) image.
+            now: Current monotonic time (defaults to time.monotonic()).
+            size: Max edge of a resized variant (None for the original image).
+        """
+        key = self._key(url, size)
+        if size is None:
+            previous = self.peek(url)
+            if previous is not None and previous.data != artwork.data:
+                self._remove_variants(url)
+        else:
+            original = self.peek(url)
+            if original is not None and original.data is artwork.data:
+                self._remove(key)
+                return
+        self._remove(key)
+        if len(artwork.data) > self.max_bytes:
+            return
+        if now is None:
+            now = time.monotonic()
+        self._entries[key] = (artwork, now)
+        self._size += len(artwork.data)
+        while self._size > self.max_bytes:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._size -= len(evicted.data)
+            self.evictions += 1
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached image of one URL and its resized variants."""
+        self._remove(url)
+        self._remove_variants(url)
+
+    def clear(self) -> None:
+        """Drop all cached images (the disk tier is kept)."""
+        self._entries.clear()
+        self._size = 0
+
+    def _remove(self, key: _CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0].data)
+
+    def _remove_variants(self, url: str) -> None:
+        for key in [key for key in self._entries if isinstance(key, tuple) and key[0] == url]:
+            self._remove(key)
+
+    async def fetch_once(
+        self,
+        url: str,
+        fetcher: Callable[[], Awaitable[CachedArtwork | None]],
+        size: int | None = None,
+    ) -> CachedArtwork | None:
+        """Run fetcher for url unless a fetch of the same URL is already running.
+
+        Callers arriving while a download is in flight await its result instead
+        of starting another one - across all players sharing this cache. A
+        successful result is stored in the cache. Cancelling one caller does not
+        cancel the shared download; its result is still cached for the others.
+        A failed fetch is not remembered, so the next caller tries again.
+
+        Args:
+            url: Artwork URL.
+            fetcher: Coroutine function downloading (or revalidating, resizing) the image.
+            size: Max edge of a resized variant (None for the original image).
+
+        Returns:
+            The fetch result, or None if it failed.
+        """
+        # Shield the shared download from cancellation of any single caller
+        return await asyncio.shield(self.start_fetch(url, fetcher, size))
+
+    def start_fetch(
+        self,
+        url: str,
+        fetcher: Callable[[], Awaitable[CachedArtwork | None]],
+        size: int | None = None,
+    ) -> asyncio.Task[CachedArtwork | None]:
+        """Return the running fetch of url, starting fetcher as the shared fetch if there is none.
+
+        Like fetch_once(), but returns the task instead of awaiting it (e.g. for
+        stream_cover_art(), which forwards chunks while the fetch runs).
+        """
+        loop = asyncio.get_running_loop()
+        key = self._key(url, size)
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.shared_fetches += 1
+        else:
+            task = loop.create_task(self._fetch_and_store(url, size, fetcher))
+            self._inflight[key] = task
+        return task
+
+    async def _fetch_and_store(
+        self,
+        url: str,
+        size: int | None,
+        fetcher: Callable[[], Awaitable[CachedArtwork | None]],
+    ) -> CachedArtwork | None:
+        key = self._key(url, size)
+        try:
+            result = await fetcher()
+            if result is not None:
+                self.put(url, result, size=size)
+            return result
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+
+_DEFAULT_CACHE = CoverArtCache()
+
+
+def get_cover_art_cache() -> CoverArtCache:
+    """Return the process-wide cover art cache used by Player."""
+    return _DEFAULT_CACHE
+
+
+def set_cover_art_cache(cache: CoverArtCache) -> None:
+    """Replace the process-wide cover art cache.
+
+    Only players created afterwards use the new cache.
+
+    Args:
+        cache: Cache to share between players (e.g. with a disk tier or a different byte budget).
+    """
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = cache
@@ -0,0 +1,175 @@
+"""Cover art downloads and the embedded fallback logo.
+
+Low-level helpers behind CoverArtManager: the GET request (using the client's
+session and SSL context), a download that is aborted as soon as it crosses a
+byte limit and can hand every chunk to a streaming caller while it arrives,
+and the embedded PyWiim logo served when there is no artwork.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import contextlib
+import functools
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Iterator, Mapping
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from .artcache import CachedArtwork
+
+if TYPE_CHECKING:
+    from . import Player
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "COVER_ART_MAX_DOWNLOAD_BYTES",
+    "COVER_ART_STREAM_CHUNK",
+    "download_cover_art",
+    "get_embedded_logo",
+    "iter_chunks",
+    "open_cover_art",
+]
+
+# Largest image downloaded (bytes); bigger downloads are aborted (some radio station logos are several MB)
+COVER_ART_MAX_DOWNLOAD_BYTES = 5 * 1024 * 1024
+
+# Chunk size of downloads and of stream_cover_art()
+COVER_ART_STREAM_CHUNK = 64 * 1024
+
+
+def iter_chunks(data: bytes, chunk_size: int) -> Iterator[bytes]:
+    """Split data into chunks of at most chunk_size bytes."""
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        yield bytes(view[offset : offset + chunk_size])
+
+
+@functools.cache
+def get_embedded_logo() -> CachedArtwork:
+    """Embedded PyWiim fallback logo, decoded once on first use.
+
+    The returned artwork is immutable and shared; its ETag is derived from the
+    image bytes, so it is stable across calls and restarts and HTTP frontends
+    can answer conditional requests with 304 Not Modified.
+    """
+    from ..api.constants import EMBEDDED_LOGO_BASE64
+
+    # Decode the embedded base64 PNG logo (join tuple of strings first)
+    data = base64.b64decode("".join(EMBEDDED_LOGO_BASE64))
+    return CachedArtwork(data=data, content_type="image/png", etag=f'"{hashlib.sha256(data).hexdigest()[:32]}"')
+
+
+@contextlib.asynccontextmanager
+async def open_cover_art(
+    player: Player, url: str, headers: dict[str, str] | None = None
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """Open a GET request for cover art (uses the client's session and SSL context)."""
+    session = player.client._session
+    should_close_session = False
+
+    if session is None:
+        session = aiohttp.ClientSession()
+        should_close_session = True
+
+    try:
+        timeout = aiohttp.ClientTimeout(total=10)
+        if url.startswith("https://"):
+            # Use the client's SSL context for HTTPS URLs
+            # This ensures we can fetch artwork from device URLs with self-signed certs
+            ssl_ctx = await player.client._get_ssl_context()
+            request = session.get(url, timeout=timeout, ssl=ssl_ctx, headers=headers)
+        else:
+            # For HTTP URLs, use default SSL handling
+            request = session.get(url, timeout=timeout, headers=headers)
+        async with request as response:
+            yield response
+    finally:
+        if should_close_session:
+            await session.close()
+
+
+def _content_type(headers: Mapping[str, str]) -> str:
+    content_type = headers.get("Content-Type", "image/jpeg")
+    return content_type if "image" in content_type.lower() else "image/jpeg"
+
+
+def _exceeds_max_size(url: str, headers: Mapping[str, str], max_bytes: int) -> bool:
+    """Whether Content-Length announces an image larger than max_bytes."""
+    try:
+        length = int(headers.get("Content-Length", ""))
+    except (TypeError, ValueError):
+        return False
+    if length <= max_bytes:
+        return False
+    _LOGGER.warning("Skipping cover art of %d bytes (limit %d) from %s", length, max_bytes, url)
+    return True
+
+
+async def download_cover_art(
+    player: Player,
+    url: str,
+    max_bytes: int = COVER_ART_MAX_DOWNLOAD_BYTES,
+    stale: CachedArtwork | None = None,
+    chunks: asyncio.Queue[bytes | None] | None = None,
+    chunk_size: int = COVER_ART_STREAM_CHUNK,
+) -> CachedArtwork | None:
+    """Download cover art from URL.
+
+    The body is read in chunks and the download is aborted as soon as more
+    than max_bytes arrived, so an oversized image is never fully buffered.
+
+    Args:
+        player: Player whose client session is used.
+        url: Cover art URL.
+        max_bytes: Largest accepted image.
+        stale: Expired cached copy with validators. The request is then
+            conditional, and stale is returned on 304 Not Modified.
+        chunks: Optional queue receiving every chunk as it arrives (for
+            stream_cover_art()). The caller detects the end of the download
+            from the completed fetch.
+        chunk_size: Maximum chunk size in bytes.
+
+    Returns:
+        The image, stale if it was not modified, or None if the download
+        failed or exceeded max_bytes.
+    """
+    try:
+        headers = stale.conditional_headers() if stale is not None else None
+        async with open_cover_art(player, url, headers) as response:
+            if response.status == 304 and stale is not None:
+                _LOGGER.debug("Cover art not modified, reusing cached copy: %s", url)
+                return stale
+            if response.status != 200:
+                _LOGGER.debug(
+                    "Failed to fetch cover art: HTTP %d from %s",
+                    response.status,
+                    url,
+                )
+                return None
+            if _exceeds_max_size(url, response.headers, max_bytes):
+                return None
+            body: list[bytes] = []
+            total = 0
+            async for chunk in response.content.iter_chunked(chunk_size):
+                total += len(chunk)
+                if total > max_bytes:
+                    _LOGGER.warning("Aborting cover art download over %d bytes from %s", max_bytes, url)
+                    return None
+                body.append(chunk)
+                if chunks is not None:
+                    chunks.put_nowait(chunk)
+            _LOGGER.debug("Fetched cover art from URL: %s", url)
+            return CachedArtwork(
+                data=b"".join(body),
+                content_type=_content_type(response.headers),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+    except Exception as e:
+        _LOGGER.debug("Error fetching cover art from %s: %s", url, e)
+        return None
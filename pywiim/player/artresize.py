@@ -0,0 +1,91 @@
+"""Cover art thumbnail resizing.
+
+Dashboards often show artwork as small thumbnails while streaming services
+serve 1000x1000+ JPEGs. fetch_cover_art(size=...) scales the image down with a
+pluggable resizer and caches the variant per (url, size), so an image proxy
+serves a few KB instead of hundreds.
+
+The default resizer uses Pillow when it is installed (``pip install
+pywiim[images]``); without it, or with set_artwork_resizer(None), the original
+image is returned.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from io import BytesIO
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "ArtworkResizer",
+    "THUMBNAIL_JPEG_QUALITY",
+    "get_artwork_resizer",
+    "pillow_resizer",
+    "set_artwork_resizer",
+]
+
+# Resizer: (image bytes, content type, max edge in px) -> (bytes, content type), or None to keep the original
+ArtworkResizer = Callable[[bytes, str, int], "tuple[bytes, str] | None"]
+
+# JPEG quality of generated thumbnails
+THUMBNAIL_JPEG_QUALITY = 85
+
+
+def pillow_resizer(data: bytes, content_type: str, size: int) -> tuple[bytes, str] | None:
+    """Scale an image to fit size x size pixels using Pillow.
+
+    Keeps the aspect ratio and never upscales. Images with transparency are
+    written as PNG, all others as JPEG.
+
+    Args:
+        data: Original image bytes.
+        content_type: Original MIME type.
+        size: Maximum width and height in pixels.
+
+    Returns:
+        (thumbnail_bytes, content_type), or None if Pillow is not installed, the
+        image cannot be decoded, or it already fits.
+    """
+    if Image is None:
+        return None
+    try:
+        with Image.open(BytesIO(data)) as image:
+            if image.width <= size and image.height <= size:
+                return None
+            image.thumbnail((size, size))
+            output = BytesIO()
+            if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+                image.save(output, format="PNG", optimize=True)
+                return (output.getvalue(), "image/png")
+            image.convert("RGB").save(output, format="JPEG", quality=THUMBNAIL_JPEG_QUALITY, optimize=True)
+            return (output.getvalue(), "image/jpeg")
+    except Exception as err:  # noqa: BLE001
+        _LOGGER.debug("Could not resize %s cover art: %s", content_type, err)
+        return None
+
+
+_RESIZER: ArtworkResizer | None = pillow_resizer if Image is not None else None
+
+
+def get_artwork_resizer() -> ArtworkResizer | None:
+    """Return the resizer used for sized cover art requests (None if resizing is unavailable)."""
+    return _RESIZER
+
+
+def set_artwork_resizer(resizer: ArtworkResizer | None) -> None:
+    """Replace the cover art resizer.
+
+    Resizers run in the default executor, so they may block.
+
+    Args:
+        resizer: Resizer to use, or None to always serve original images.
+    """
+    global _RESIZER
+    _RESIZER = resizer
@@ -64,7 +64,7 @@ class AudioConfiguration:
 
         # Track when source was set for preserving optimistic update during refresh
         # Device status endpoint may return stale source data after a switch
-        self.player._last_source_set_time = time.time()
+        self.player._last_source_set_time = time.monotonic()
 
         # Call callback to notify state change
         if self.player._on_state_changed:
@@ -389,7 +389,7 @@ class AudioConfiguration:
 
         # Track when EQ was set for preserving optimistic update during refresh
         # Device status endpoint returns stale EQ data for many seconds
-        self.player._last_eq_preset_set_time = time.time()
+        self.player._last_eq_preset_set_time = time.monotonic()
 
         # Verify by querying the authoritative EQ endpoint after a brief delay
         # This ensures we have the correct value even if status endpoint is stale
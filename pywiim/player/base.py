@@ -12,6 +12,8 @@ from ..model_names import to_friendly_model_name
 from ..models import DeviceInfo, PlayerStatus
 from ..profiles import DeviceProfile, get_device_profile
 from ..state import StateSynchronizer
+from .artcache import CoverArtCache, get_cover_art_cache
+from .changes import StateChangeNotifier
 
 if TYPE_CHECKING:
     from ..group import Group
@@ -64,6 +66,9 @@ class PlayerBase:
 
         # State management
         self._state_synchronizer = StateSynchronizer()
+        # Opt-in field-level diff subscribers (see subscribe_state_changes)
+        self._change_notifier = StateChangeNotifier(self)
+        self._state_changed_callback: Callable[[], None] | None = None
         self._on_state_changed = on_state_changed
         self._player_finder = player_finder
         self._all_players_finder = all_players_finder
@@ -137,16 +142,39 @@ class PlayerBase:
         # Last played URL tracking (for media_title fallback)
         self._last_played_url: str | None = None
 
-        # Cover art cache (in-memory, keyed by URL hash)
-        # Format: {url_hash: (image_bytes, content_type, timestamp)}
-        self._cover_art_cache: dict[str, tuple[bytes, str, float]] = {}
-        self._cover_art_cache_max_size: int = 10  # Max cached images per player
-        self._cover_art_cache_ttl: float = 3600.0  # 1 hour TTL
+        # Cover art cache (process-wide LRU keyed by URL, bounded by total bytes)
+        self._cover_art_cache: CoverArtCache = get_cover_art_cache()
 
         # Device profile (detected after device_info is available)
         # Profile defines device-specific behaviors (state sources, endpoints, etc.)
         self._profile: DeviceProfile | None = None
 
+    @property
+    def _on_state_changed(self) -> Callable[[], None] | None:
+        """State-changed hook invoked by all update paths.
+
+        Returns the user callback as-is while there are no diff subscribers.
+        Once subscribers exist, returns a dispatcher that calls the user callback
+        and then delivers field-level diffs, so every existing notification site
+        feeds the diff subscribers without changes.
+        """
+        if self._change_notifier.has_subscribers:
+            return self._dispatch_state_changed
+        return self._state_changed_callback
+
+    @_on_state_changed.setter
+    def _on_state_changed(self, callback: Callable[[], None] | None) -> None:
+        """Set the plain (zero-argument) state-changed callback."""
+        self._state_changed_callback = callback
+
+    def _dispatch_state_changed(self) -> None:
+        """Call the user callback, then notify diff subscribers."""
+        try:
+            if self._state_changed_callback:
+                self._state_changed_callback()
+        finally:
+            self._change_notifier.notify()
+
     @property
     def role(self) -> str:
         """Current role: 'solo', 'master', or 'slave'.
@@ -354,14 +382,22 @@ class PlayerBase:
             return True
 
         # Update attempt timestamp (caller checks cooldown before calling)
-        self._last_upnp_attempt = time.time()
+        self._last_upnp_attempt = time.monotonic()
 
         try:
             from ..upnp.client import UpnpClient
+            from ..upnp.description import description_cache_key, get_description_cache
 
             # UPnP description URL is typically on port 49152
             description_url = f"http://{self.client.host}:49152/description.xml"
 
+            # Description/SCPD documents are cached per UUID + firmware. On the first
+            # refresh device_info is not known yet; any cached entry for the URL is
+            # then used and revalidated in the background.
+            cache_key = None
+            if self._device_info is not None:
+                cache_key = description_cache_key(self._device_info.uuid, self._device_info.firmware)
+
             _LOGGER.debug("Creating UPnP client for %s", self.client.host)
             # Pass client's session to UPnP client for connection pooling
             # Ensure session exists (client may create it lazily)
@@ -371,6 +407,8 @@ class PlayerBase:
                 self.client.host,
                 description_url,
                 session=client_session,
+                description_cache=get_description_cache(),
+                cache_key=cache_key,
             )
 
             # Initialize UPnP health tracker if not already present
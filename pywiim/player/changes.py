@@ -0,0 +1,196 @@
+"""Change-only state notifications with field-level diffs.
+
+The classic ``on_state_changed`` callback takes no arguments and fires after
+every refresh, UPnP event and slave propagation, so consumers must re-read every
+property to find out what changed. StateChangeNotifier snapshots the
+user-visible Player properties each time that callback would fire, computes a
+compact ``{field: (old, new)}`` diff against the previous snapshot and only
+invokes subscribers when something they care about actually changed.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from .base import PlayerBase
+    from .updates import StateUpdateQueue
+
+_LOGGER = logging.getLogger(__name__)
+
+# Diff payload delivered to subscribers: {field: (old_value, new_value)}
+StateDiff = dict[str, tuple[Any, Any]]
+
+# User-visible Player properties tracked for diffs. Internal bookkeeping
+# (timestamps, source health, caches) is deliberately not part of this set.
+STATE_DIFF_FIELDS: tuple[str, ...] = (
+    "available",
+    "role",
+    "play_state",
+    "volume_level",
+    "is_muted",
+    "source",
+    "media_title",
+    "media_artist",
+    "media_album",
+    "media_image_url",
+    "media_content_id",
+    "media_duration",
+    "media_position",
+    "media_sample_rate",
+    "media_bit_depth",
+    "media_bit_rate",
+    "media_codec",
+    "queue_count",
+    "queue_position",
+    "shuffle",
+    "repeat",
+    "eq_preset",
+    "audio_output_mode",
+    "group_master_name",
+)
+
+
+class StateChangeNotifier:
+    """Computes field-level diffs and dispatches them to subscribers.
+
+    Subscribers are opt-in; while there are none, no snapshots are taken and the
+    plain ``on_state_changed`` callback path is unchanged. Besides callbacks,
+    diffs feed per-player and fleet-wide StateUpdateQueue streams (see updates.py).
+    """
+
+    # Fleet-wide update queues fed by every player's notifier
+    _fleet_queues: ClassVar[set[StateUpdateQueue]] = set()
+
+    def __init__(self, player: PlayerBase) -> None:
+        """Initialize state change notifier.
+
+        Args:
+            player: Parent Player instance.
+        """
+        self.player = player
+        self._subscribers: dict[int, tuple[Callable[[StateDiff], None], frozenset[str]]] = {}
+        self._next_token = 0
+        self._queues: set[StateUpdateQueue] = set()
+        self._last_snapshot: dict[str, Any] | None = None
+
+    @property
+    def has_subscribers(self) -> bool:
+        """True if any diff subscriber, update stream or fleet stream is registered."""
+        return bool(self._subscribers or self._queues or StateChangeNotifier._fleet_queues)
+
+    def ensure_baseline(self) -> None:
+        """Take a baseline snapshot if no subscriber is currently keeping one."""
+        if not self.has_subscribers or self._last_snapshot is None:
+            self._last_snapshot = self.snapshot()
+
+    def add_queue(self, queue: StateUpdateQueue) -> None:
+        """Attach a per-player update stream queue."""
+        self.ensure_baseline()
+        self._queues.add(queue)
+
+    def remove_queue(self, queue: StateUpdateQueue) -> None:
+        """Detach a per-player update stream queue."""
+        self._queues.discard(queue)
+
+    @classmethod
+    def add_fleet_queue(cls, queue: StateUpdateQueue) -> None:
+        """Attach a fleet-wide update stream queue."""
+        cls._fleet_queues.add(queue)
+
+    @classmethod
+    def remove_fleet_queue(cls, queue: StateUpdateQueue) -> None:
+        """Detach a fleet-wide update stream queue."""
+        cls._fleet_queues.discard(queue)
+
+    def subscribe(
+        self,
+        callback: Callable[[StateDiff], None],
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> Callable[[], None]:
+        """Register a diff subscriber.
+
+        Args:
+            callback: Called with ``{field: (old, new)}`` when watched fields change.
+            fields: Fields to watch (defaults to all STATE_DIFF_FIELDS).
+            exclude: Fields to ignore, e.g. ``["media_position"]`` to skip
+                position-only updates while playing.
+
+        Returns:
+            Function that removes this subscription when called.
+
+        Raises:
+            ValueError: If an unknown field name is given.
+        """
+        watched = frozenset(fields) if fields is not None else frozenset(STATE_DIFF_FIELDS)
+        ignored = frozenset(exclude) if exclude is not None else frozenset()
+        unknown = (watched | ignored) - set(STATE_DIFF_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown state field(s): {', '.join(sorted(unknown))}")
+
+        # Establish the baseline so the first diff is relative to subscription time
+        self.ensure_baseline()
+
+        token = self._next_token
+        self._next_token += 1
+        self._subscribers[token] = (callback, watched - ignored)
+
+        def unsubscribe() -> None:
+            self._subscribers.pop(token, None)
+
+        return unsubscribe
+
+    def snapshot(self) -> dict[str, Any]:
+        """Capture current values of all tracked fields.
+
+        Returns:
+            Dictionary of field name to current property value.
+        """
+        values: dict[str, Any] = {}
+        for field_name in STATE_DIFF_FIELDS:
+            try:
+                values[field_name] = getattr(self.player, field_name)
+            except Exception:  # noqa: BLE001
+                values[field_name] = None
+        return values
+
+    def notify(self) -> StateDiff:
+        """Diff current state against the last snapshot and dispatch to subscribers.
+
+        Without a baseline (e.g. a player created after a fleet stream started),
+        every populated field is reported with ``None`` as the old value.
+
+        Returns:
+            The full diff across all tracked fields (empty if nothing changed).
+        """
+        if not self.has_subscribers:
+            return {}
+
+        current = self.snapshot()
+        previous = self._last_snapshot or {}
+        self._last_snapshot = current
+
+        diff: StateDiff = {
+            field_name: (previous.get(field_name), value)
+            for field_name, value in current.items()
+            if previous.get(field_name) != value
+        }
+        if not diff:
+            return diff
+
+        for queue in (*self._queues, *StateChangeNotifier._fleet_queues):
+            queue.put(self.player, diff)
+
+        for callback, watched in list(self._subscribers.values()):
+            filtered = {k: v for k, v in diff.items() if k in watched}
+            if not filtered:
+                continue
+            try:
+                callback(filtered)
+            except Exception as err:
+                _LOGGER.debug("Error calling state diff subscriber for %s: %s", self.player.host, err)
+
+        return diff
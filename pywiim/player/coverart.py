@@ -1,32 +1,37 @@
-"""Cover art fetching and caching.
-
-# pragma: allow-long-file coverart-cohesive
-# This file exceeds the 400 LOC soft limit (417 lines) but is kept as a single
-# cohesive unit because:
-# 1. Single responsibility: Cover art fetching, caching, and track change detection
-# 2. Well-organized: Clear sections for fetching, caching, and change detection
-# 3. Tight coupling: All methods work together for cover art management
-# 4. Maintainable: Clear structure, follows cover art design pattern
-# 5. Natural unit: Represents one concept (cover art management)
-# Splitting would add complexity without clear benefit.
-"""
+"""Cover art fetching and caching."""
 
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
-import time
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote
 
-import aiohttp
+from ..exceptions import WiiMError
+from .artcache import CachedArtwork
+from .artfetch import (
+    COVER_ART_MAX_DOWNLOAD_BYTES,
+    COVER_ART_STREAM_CHUNK,
+    download_cover_art,
+    get_embedded_logo,
+    iter_chunks,
+)
+from .artresize import ArtworkResizer, get_artwork_resizer
 
 if TYPE_CHECKING:
     from . import Player
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upcoming queue items whose artwork is prefetched on a track change
+ARTWORK_PREFETCH_LOOKAHEAD = 2
+
+# Maximum concurrent prefetch downloads per player
+ARTWORK_PREFETCH_CONCURRENCY = 2
+
+_INVALID_ARTWORK_VALUES = ("unknow", "unknown", "un_known", "none", "")
+
 
 class CoverArtManager:
     """Manages cover art fetching and caching."""
@@ -42,42 +47,30 @@ class CoverArtManager:
         self._last_track_signature: str | None = None
         # Track if we're already fetching artwork to avoid duplicate requests
         self._artwork_fetch_task: asyncio.Task | None = None
+        # Background download of artwork for the new track and upcoming queue items
+        self._prefetch_task: asyncio.Task | None = None
+        self.prefetch_enabled = True
+        # Downloads larger than this are aborted
+        self.max_image_bytes = COVER_ART_MAX_DOWNLOAD_BYTES
 
-    def _get_url_hash(self, url: str) -> str:
-        """Generate a hash for a URL to use as cache key."""
-        return hashlib.md5(url.encode()).hexdigest()
-
-    def _cleanup_cover_art_cache(self) -> None:
-        """Remove expired entries from cover art cache."""
-        now = time.time()
-        expired_keys = [
-            key
-            for key, (_, _, timestamp) in self.player._cover_art_cache.items()
-            if now - timestamp > self.player._cover_art_cache_ttl
-        ]
-        for key in expired_keys:
-            del self.player._cover_art_cache[key]
-
-        # If still over max size, remove oldest entries
-        if len(self.player._cover_art_cache) > self.player._cover_art_cache_max_size:
-            sorted_entries = sorted(
-                self.player._cover_art_cache.items(),
-                key=lambda x: x[1][2],
-            )
-            for key, _ in sorted_entries[: len(self.player._cover_art_cache) - self.player._cover_art_cache_max_size]:
-                del self.player._cover_art_cache[key]
-
-    async def fetch_cover_art(self, url: str | None = None) -> tuple[bytes, str] | None:
+    async def fetch_cover_art(self, url: str | None = None, size: int | None = None) -> tuple[bytes, str] | None:
         """Fetch cover art image from URL or return embedded fallback logo.
 
         Args:
             url: Cover art URL to fetch. If None, uses current track's cover art URL.
                 If no valid URL is found, returns the embedded PyWiim logo (no HTTP call).
+            size: Optional maximum width/height in pixels. The image is scaled down
+                (see artresize) and the variant cached per (url, size). Without an
+                available resizer the original image is returned.
 
         Returns:
             Tuple of (image_bytes, content_type) if successful, None otherwise.
+
+        Raises:
+            ValueError: If size is not positive.
         """
-        import base64
+        if size is not None and size <= 0:
+            raise ValueError("size must be greater than 0")
 
         from .properties import PlayerProperties
 
@@ -85,106 +78,202 @@ class CoverArtManager:
             url = PlayerProperties(self.player).media_image_url
 
         # If no URL provided OR sentinel value, return embedded PyWiim logo directly (no HTTP call needed)
-        from ..api.constants import DEFAULT_WIIM_LOGO_URL, EMBEDDED_LOGO_BASE64
+        from ..api.constants import DEFAULT_WIIM_LOGO_URL
 
         if not url or url == DEFAULT_WIIM_LOGO_URL:
             try:
-                # Decode the embedded base64 PNG logo (join tuple of strings first)
-                base64_string = "".join(EMBEDDED_LOGO_BASE64)
-                logo_bytes = base64.b64decode(base64_string)
-                _LOGGER.debug("Returning embedded PyWiim fallback logo (%d bytes)", len(logo_bytes))
-                return (logo_bytes, "image/png")
+                logo = get_embedded_logo()
             except Exception as e:
                 _LOGGER.error("Failed to decode embedded logo: %s", e)
                 return None
+            return (logo.data, logo.content_type)
+
+        resizer = get_artwork_resizer() if size is not None else None
+        if size is not None and resizer is not None:
+            cached = await self._get_or_resize(url, size, resizer)
+        else:
+            cached = await self._get_or_fetch(url)
+        return (cached.data, cached.content_type) if cached is not None else None
+
+    async def _get_or_resize(self, url: str, size: int, resizer: ArtworkResizer) -> CachedArtwork | None:
+        """Return a resized variant from the shared cache, resizing the original if needed."""
+        cache = self.player._cover_art_cache
+        cached = cache.get(url, size=size)
+        if cached is not None:
+            return cached
+
+        async def resize() -> CachedArtwork | None:
+            original = await self._get_or_fetch(url)
+            if original is None:
+                return None
+            resized = await asyncio.to_thread(resizer, original.data, original.content_type, size)
+            if resized is None:
+                # Already small enough (or not decodable) - serve the original for this size
+                return original
+            _LOGGER.debug(
+                "Resized cover art to %d px (%d -> %d bytes): %s", size, len(original.data), len(resized[0]), url
+            )
+            return CachedArtwork(data=resized[0], content_type=resized[1])
+
+        return await cache.fetch_once(url, resize, size=size)
+
+    async def _get_or_fetch(self, url: str) -> CachedArtwork | None:
+        """Return cover art from the shared cache, fetching it if it is not fresh."""
+        # Check the shared cache first (slaves usually show the master's artwork)
+        cache = self.player._cover_art_cache
+        cached = cache.get(url)
+        if cached is not None:
+            _LOGGER.debug("Returning cover art from cache for URL: %s", url)
+            return cached
+        # Disk tier / conditional GET / download (concurrent requests for the same URL share one fetch)
+        return await cache.fetch_once(url, lambda: self._load_cover_art(url))
+
+    @staticmethod
+    def _is_valid_artwork_url(url: Any) -> bool:
+        """Whether url is real artwork (not empty, "unknown" or the WiiM logo sentinel)."""
+        from ..api.constants import DEFAULT_WIIM_LOGO_URL
 
-        # Clean up expired cache entries
-        self._cleanup_cover_art_cache()
+        value = str(url).strip() if url else ""
+        return bool(value) and value.lower() not in _INVALID_ARTWORK_VALUES and value != DEFAULT_WIIM_LOGO_URL
 
-        # Check cache first
-        url_hash = self._get_url_hash(url)
-        if url_hash in self.player._cover_art_cache:
-            cached_bytes, content_type, timestamp = self.player._cover_art_cache[url_hash]
-            if time.time() - timestamp < self.player._cover_art_cache_ttl:
-                _LOGGER.debug("Returning cover art from cache for URL: %s", url)
-                return (cached_bytes, content_type)
+    def schedule_artwork_prefetch(self, merged_state: dict[str, Any]) -> None:
+        """Start downloading artwork for the current track and the next queue items.
 
-        # Fetch from URL
+        Called on track changes so the first artwork request of a UI is served
+        from the cache. Upcoming items are only known if the queue was browsed
+        with caching (see MediaControl.upcoming_queue_items()). A running
+        prefetch for the previous track is cancelled; shared downloads it
+        started still complete and are cached.
+
+        Args:
+            merged_state: Merged state dictionary from StateSynchronizer.
+        """
+        if not self.prefetch_enabled:
+            return
+
+        urls: list[str] = []
+        candidates = [merged_state.get("image_url")]
+        candidates += [
+            item.get("image_url")
+            for item in self.player._media_ctrl.upcoming_queue_items(
+                ARTWORK_PREFETCH_LOOKAHEAD, merged_state.get("title")
+            )
+        ]
+        for url in candidates:
+            if self._is_valid_artwork_url(url) and str(url) not in urls:
+                urls.append(str(url))
+        if not urls:
+            return
+
+        if self._prefetch_task and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
         try:
-            session = self.player.client._session
-            should_close_session = False
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync context) - artwork is fetched on first request
+            return
+        self._prefetch_task = loop.create_task(self._prefetch_artwork(urls))
 
-            if session is None:
-                session = aiohttp.ClientSession()
-                should_close_session = True
+    async def _prefetch_artwork(self, urls: list[str]) -> None:
+        """Fetch artwork for urls into the shared cache, at most ARTWORK_PREFETCH_CONCURRENCY at a time."""
+        semaphore = asyncio.Semaphore(ARTWORK_PREFETCH_CONCURRENCY)
 
-            try:
-                # Get SSL context from client if URL is HTTPS
-                timeout = aiohttp.ClientTimeout(total=10)
-                if url.startswith("https://"):
-                    # Use the client's SSL context for HTTPS URLs
-                    # This ensures we can fetch artwork from device URLs with self-signed certs
-                    ssl_ctx = await self.player.client._get_ssl_context()
-                    async with session.get(url, timeout=timeout, ssl=ssl_ctx) as response:
-                        if response.status == 200:
-                            image_bytes = await response.read()
-                            content_type = response.headers.get("Content-Type", "image/jpeg")
-                            if "image" not in content_type.lower():
-                                content_type = "image/jpeg"
-
-                            # Cache the result
-                            self.player._cover_art_cache[url_hash] = (
-                                image_bytes,
-                                content_type,
-                                time.time(),
-                            )
-                            _LOGGER.debug("Fetched and cached cover art from URL: %s", url)
-
-                            # Clean up cache if needed
-                            self._cleanup_cover_art_cache()
-
-                            return (image_bytes, content_type)
-                        else:
-                            _LOGGER.debug(
-                                "Failed to fetch cover art: HTTP %d from %s",
-                                response.status,
-                                url,
-                            )
-                            return None
-                else:
-                    # For HTTP URLs, use default SSL handling
-                    async with session.get(url, timeout=timeout) as response:
-                        if response.status == 200:
-                            image_bytes = await response.read()
-                            content_type = response.headers.get("Content-Type", "image/jpeg")
-                            if "image" not in content_type.lower():
-                                content_type = "image/jpeg"
-
-                            # Cache the result
-                            self.player._cover_art_cache[url_hash] = (
-                                image_bytes,
-                                content_type,
-                                time.time(),
-                            )
-                            _LOGGER.debug("Fetched and cached cover art from URL: %s", url)
-
-                            # Clean up cache if needed
-                            self._cleanup_cover_art_cache()
-
-                            return (image_bytes, content_type)
-                        else:
-                            _LOGGER.debug(
-                                "Failed to fetch cover art: HTTP %d from %s",
-                                response.status,
-                                url,
-                            )
-                            return None
-            finally:
-                if should_close_session:
-                    await session.close()
-        except Exception as e:
-            _LOGGER.debug("Error fetching cover art from %s: %s", url, e)
-            return None
+        async def prefetch(url: str) -> None:
+            async with semaphore:
+                await self._get_or_fetch(url)
+
+        _LOGGER.debug("Prefetching artwork for %s: %s", self.player.host, urls)
+        await asyncio.gather(*(prefetch(url) for url in urls), return_exceptions=True)
+
+    async def _load_cover_art(self, url: str) -> CachedArtwork | None:
+        """Load cover art that is not fresh in memory (result is cached by CoverArtCache.fetch_once).
+
+        Fresh disk entries are used as-is. Otherwise the image is downloaded,
+        as a conditional GET if an expired memory or disk entry has validators.
+        """
+        cache = self.player._cover_art_cache
+        disk_cache = cache.disk_cache
+        stale = cache.peek(url)
+        if stale is None and disk_cache is not None:
+            stored = await disk_cache.async_get(url)
+            if stored is not None:
+                stale, fresh = stored
+                if fresh:
+                    _LOGGER.debug("Returning cover art from disk cache for URL: %s", url)
+                    return stale
+
+        artwork = await download_cover_art(
+            self.player, url, self.max_image_bytes, stale if stale is not None and stale.has_validators else None
+        )
+        if disk_cache is not None and artwork is not None:
+            if artwork is stale:
+                await disk_cache.async_touch(url)
+            else:
+                await disk_cache.async_put(url, artwork)
+        return artwork
+
+    async def stream_cover_art(
+        self, url: str | None = None, chunk_size: int = COVER_ART_STREAM_CHUNK
+    ) -> AsyncIterator[bytes]:
+        """Stream cover art in chunks instead of waiting for the whole image.
+
+        Cached images are served from the cache. Otherwise the download is
+        started as the shared fetch of the URL and its chunks are forwarded as
+        they arrive; other callers (streaming or not) asking for the same URL
+        meanwhile join it instead of opening another connection. The complete
+        image is cached if it fits the cache budget. Downloads larger than
+        max_image_bytes are skipped (Content-Length) or aborted as soon as the
+        limit is crossed. If an expired copy or a disk tier exists, the shared
+        buffered path is used instead, so the image can be revalidated.
+
+        Args:
+            url: Cover art URL. If None, uses current track's cover art URL
+                (the embedded logo when there is none).
+            chunk_size: Maximum chunk size in bytes.
+
+        Yields:
+            Image data chunks. Nothing is yielded if the image is unavailable
+            or announced as too large.
+
+        Raises:
+            WiiMError: If the download fails or exceeds max_image_bytes after
+                chunks were already yielded.
+        """
+        from ..api.constants import DEFAULT_WIIM_LOGO_URL
+        from .properties import PlayerProperties
+
+        if url is None:
+            url = PlayerProperties(self.player).media_image_url
+        if not url or url == DEFAULT_WIIM_LOGO_URL:
+            for chunk in iter_chunks(get_embedded_logo().data, chunk_size):
+                yield chunk
+            return
+
+        cache = self.player._cover_art_cache
+        cached = cache.get(url)
+        if cached is None and (cache.is_fetching(url) or cache.peek(url) is not None or cache.disk_cache is not None):
+            # Join the shared download / revalidate the expired copy / use the disk tier
+            cached = await self._get_or_fetch(url)
+            if cached is None:
+                return
+        if cached is not None:
+            for chunk in iter_chunks(cached.data, chunk_size):
+                yield chunk
+            return
+
+        # No fetch of url is running (checked above), so this one is started and shared
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+        fetch = cache.start_fetch(
+            url,
+            lambda: download_cover_art(self.player, url, self.max_image_bytes, chunks=chunks, chunk_size=chunk_size),
+        )
+        fetch.add_done_callback(lambda _: chunks.put_nowait(None))
+        total = 0
+        while (received := await chunks.get()) is not None:
+            total += len(received)
+            yield received
+        if await asyncio.shield(fetch) is None and total:
+            raise WiiMError(f"Cover art download from {url} failed or exceeded {self.max_image_bytes} bytes")
 
     def check_track_changed(self, merged_state: dict[str, Any]) -> bool:
         """Check if track changed based on title/artist/album signature.
@@ -208,6 +297,7 @@ class CoverArtManager:
 
         if track_changed:
             self._last_track_signature = current_signature
+            self.schedule_artwork_prefetch(merged_state)
 
         if not self._last_track_signature and current_signature:
             # First track detected
@@ -249,19 +339,13 @@ class CoverArtManager:
         # but getMetaInfo has the actual track info
         needs_metadata_enrichment = is_invalid_metadata(title) or is_invalid_metadata(artist)
 
-        if track_changed:
-            self._last_track_signature = current_signature
-
         # Check if artwork is missing or is default logo
-        image_url = merged_state.get("image_url")
-        from ..api.constants import DEFAULT_WIIM_LOGO_URL
+        has_valid_artwork = self._is_valid_artwork_url(merged_state.get("image_url"))
 
-        has_valid_artwork = (
-            image_url
-            and str(image_url).strip()
-            and str(image_url).strip().lower() not in ("unknow", "unknown", "un_known", "none", "")
-            and str(image_url).strip() != DEFAULT_WIIM_LOGO_URL
-        )
+        if track_changed:
+            self._last_track_signature = current_signature
+            if has_valid_artwork:
+                self.schedule_artwork_prefetch(merged_state)
 
         # Fetch metadata from getMetaInfo if:
         # 1. Track changed and artwork is missing, OR
@@ -377,7 +461,7 @@ class CoverArtManager:
                 _LOGGER.debug("Applying metadata from getMetaInfo: %s", update)
 
                 # Update state synchronizer
-                self.player._state_synchronizer.update_from_http(update, timestamp=time.time())
+                self.player._state_synchronizer.update_from_http(update)
 
                 # Update cached status model
                 merged = self.player._state_synchronizer.get_merged_state()
@@ -393,6 +477,10 @@ class CoverArtManager:
                         self.player._status_model.entity_picture = image_url
                         self.player._status_model.cover_url = image_url
 
+                if "entity_picture" in update:
+                    # Artwork became known only now - prefetch it before the UI asks
+                    self.schedule_artwork_prefetch(merged)
+
                 # Trigger callback to notify of update
                 if self.player._on_state_changed:
                     try:
@@ -412,16 +500,38 @@ class CoverArtManager:
         except Exception as e:
             _LOGGER.debug("Error fetching metadata from getMetaInfo on track change: %s", e)
 
-    async def get_cover_art_bytes(self, url: str | None = None) -> bytes | None:
+    def get_cover_art_etag(self, url: str | None = None, size: int | None = None) -> str | None:
+        """ETag of the image fetch_cover_art() serves for url, if known (no I/O).
+
+        Stable for the embedded fallback logo. For downloaded artwork this is
+        the upstream ETag of the cached image (None for resized variants, or
+        if the server sent none or the image is not cached).
+
+        Args:
+            url: Cover art URL. If None, uses current track's cover art URL.
+            size: Max edge of a resized variant (see fetch_cover_art()).
+        """
+        from ..api.constants import DEFAULT_WIIM_LOGO_URL
+        from .properties import PlayerProperties
+
+        if url is None:
+            url = PlayerProperties(self.player).media_image_url
+        if not url or url == DEFAULT_WIIM_LOGO_URL:
+            return get_embedded_logo().etag
+        cached = self.player._cover_art_cache.peek(url, size)
+        return cached.etag if cached is not None else None
+
+    async def get_cover_art_bytes(self, url: str | None = None, size: int | None = None) -> bytes | None:
         """Get cover art image bytes (convenience method).
 
         Args:
             url: Cover art URL to fetch. If None, uses current track's cover art URL.
+            size: Optional maximum width/height in pixels (see fetch_cover_art()).
 
         Returns:
             Image bytes if successful, None otherwise.
         """
-        result = await self.fetch_cover_art(url)
+        result = await self.fetch_cover_art(url, size)
         if result:
             return result[0]
         return None
@@ -172,6 +172,13 @@ class DiagnosticsCollector:
         except Exception:
             diagnostics["eq"] = None
 
+        # Merged-state transition history (ring buffer)
+        try:
+            history = self.player._state_synchronizer.history
+            diagnostics["state_history"] = history.export() if history is not None else None
+        except Exception:
+            diagnostics["state_history"] = None
+
         # Role
         diagnostics["role"] = self.player.role
         diagnostics["available"] = self.player.available
@@ -0,0 +1,372 @@
+"""HLS radio metadata: cached playlists and ID3 tags of new segments.
+
+Master playlists are resolved to a variant once, media playlists are reused
+for their target duration, and only the leading ID3 tag of each segment not
+seen before is downloaded with HTTP Range requests. Used by
+get_stream_metadata() for ``.m3u8`` streams; requires the optional m3u8 and
+mutagen packages.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Final
+from urllib.parse import urljoin
+
+import aiohttp
+
+from .stream import USER_AGENT, StreamMetadata, _decode_text
+
+try:
+    import m3u8  # type: ignore[import-untyped]
+except ImportError:
+    m3u8 = None
+
+try:
+    from mutagen import File as MutagenFile
+except ImportError:
+    MutagenFile = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# HLS playlist caching and ranged segment reads
+HLS_VARIANT_TTL: Final = 3600.0  # Seconds a master playlist's variant choice is reused
+HLS_MEDIA_IDLE_TTL: Final = 3600.0  # Seconds a media playlist is kept after its last refresh
+HLS_CACHE_SIZE: Final = 64  # Master and media playlists remembered (each)
+HLS_DEFAULT_TARGET_DURATION: Final = 10.0  # Media playlist reuse (s) if EXT-X-TARGETDURATION is missing
+HLS_ID3_PROBE_BYTES: Final = 4096  # Leading segment bytes requested to find the ID3 tag
+HLS_ID3_MAX_BYTES: Final = 256 * 1024  # Cap on ID3 tag bytes read (tags may embed artwork)
+
+
+@dataclass
+class _HlsMediaPlaylist:
+    """Cached state of one HLS media playlist."""
+
+    fetched_at: float
+    target_duration: float
+    segments: list[tuple[int, str]] = field(default_factory=list)  # (media sequence, absolute URL)
+    checked_sequence: int = -1  # Highest media sequence whose ID3 tag was read
+    metadata: StreamMetadata | None = None
+
+
+class _HlsPlaylistCache:
+    """HLS playlists and segment progress, shared by all players.
+
+    Master playlists are resolved to a variant once per HLS_VARIANT_TTL; media
+    playlists are reused for their EXT-X-TARGETDURATION, and only segments with
+    a media sequence number not seen before are read. Both maps hold at most
+    max_entries playlists; when one is full, expired entries (media playlists
+    not refreshed for HLS_MEDIA_IDLE_TTL) are dropped, then the oldest one.
+    """
+
+    def __init__(self, max_entries: int = HLS_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self.variants: dict[str, tuple[str, float]] = {}  # master URL -> (variant URL, resolved at)
+        self.media: dict[str, _HlsMediaPlaylist] = {}
+
+    def variant_for(self, url: str, now: float) -> str | None:
+        """Remembered variant of a master playlist (None if unknown or expired)."""
+        entry = self.variants.get(url)
+        if entry is None:
+            return None
+        if now - entry[1] >= HLS_VARIANT_TTL:
+            del self.variants[url]
+            return None
+        return entry[0]
+
+    def put_variant(self, url: str, variant_url: str, now: float) -> None:
+        """Remember the variant chosen for a master playlist."""
+        if len(self.variants) >= self.max_entries and url not in self.variants:
+            for key in [key for key, (_, resolved_at) in self.variants.items() if now - resolved_at >= HLS_VARIANT_TTL]:
+                del self.variants[key]
+            if len(self.variants) >= self.max_entries:
+                del self.variants[next(iter(self.variants))]  # Oldest insertion
+        self.variants[url] = (variant_url, now)
+
+    def add_media(self, url: str, now: float) -> _HlsMediaPlaylist:
+        """Start tracking a media playlist."""
+        if len(self.media) >= self.max_entries and url not in self.media:
+            for key in [key for key, state in self.media.items() if now - state.fetched_at >= HLS_MEDIA_IDLE_TTL]:
+                del self.media[key]
+            if len(self.media) >= self.max_entries:
+                del self.media[next(iter(self.media))]  # Oldest insertion
+        state = _HlsMediaPlaylist(fetched_at=now, target_duration=0.0)
+        self.media[url] = state
+        return state
+
+    def clear(self) -> None:
+        """Forget all playlists."""
+        self.variants.clear()
+        self.media.clear()
+
+
+_HLS_CACHE = _HlsPlaylistCache()
+
+
+async def _fetch_hls_metadata(url: str, session: aiohttp.ClientSession, timeout: int) -> StreamMetadata | None:
+    """Extract metadata from HLS stream via its playlist and the ID3 tags of new segments.
+
+    Playlists are cached (see _HlsPlaylistCache) and only the leading ID3 tag of
+    each new segment is downloaded using HTTP Range requests.
+
+    Args:
+        url: The HLS playlist URL (.m3u8).
+        session: aiohttp session for HTTP requests.
+        timeout: Timeout in seconds.
+
+    Returns:
+        StreamMetadata object if successful, None otherwise.
+    """
+    if m3u8 is None:
+        _LOGGER.debug("m3u8 library not available, cannot extract HLS metadata")
+        return None
+
+    if MutagenFile is None:
+        _LOGGER.debug("mutagen library not available, cannot extract ID3 tags from HLS segments")
+        return None
+
+    try:
+        now = time.monotonic()
+        variant_url = _HLS_CACHE.variant_for(url, now)
+        if variant_url is not None:
+            return await _fetch_hls_metadata(variant_url, session, timeout)
+
+        state = _HLS_CACHE.media.get(url)
+        if state is None or now - state.fetched_at >= state.target_duration:
+            # Fetch the playlist content asynchronously
+            async with session.get(
+                url,
+                headers={"User-Agent": USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.debug("Failed to fetch HLS playlist: HTTP %d", response.status)
+                    return state.metadata if state is not None else None
+                playlist_content = await response.text()
+
+            # Parse the HLS playlist from content
+            playlist = m3u8.loads(playlist_content, uri=url)
+
+            # Handle master playlists (playlists that contain variant playlists)
+            if playlist.is_variant:
+                _LOGGER.debug("Master playlist detected, selecting first variant")
+                if not playlist.playlists:
+                    _LOGGER.debug("Master playlist has no variants: %s", url)
+                    return None
+                # Select the first variant (or could select by bandwidth)
+                variant_url = urljoin(url, playlist.playlists[0].uri)
+                _HLS_CACHE.put_variant(url, variant_url, now)
+                _LOGGER.debug("Fetching variant playlist: %s", variant_url)
+
+                # Recursively fetch the variant playlist
+                return await _fetch_hls_metadata(variant_url, session, timeout)
+
+            # Handle media playlists (playlists with segments)
+            if not playlist.segments:
+                _LOGGER.debug("HLS playlist has no segments: %s", url)
+                # Try to extract station name from URL as fallback
+                metadata = _extract_station_name_from_url(url)
+                return metadata if metadata.station_name else None
+
+            first_sequence = playlist.media_sequence or 0
+            if state is None:
+                state = _HLS_CACHE.add_media(url, now)
+            state.fetched_at = now
+            state.target_duration = float(playlist.target_duration or HLS_DEFAULT_TARGET_DURATION)
+            # m3u8 handles relative URLs when base_uri is provided; urljoin covers the rest
+            state.segments = [
+                (first_sequence + index, urljoin(url, segment.uri)) for index, segment in enumerate(playlist.segments)
+            ]
+
+        # Check the last few segments the previous call has not seen, most recent first.
+        # Some streams only embed metadata in certain segments.
+        new_segments = [segment for segment in state.segments[-3:] if segment[0] > state.checked_sequence]
+        for _sequence, segment_url in reversed(new_segments):
+            _LOGGER.debug("Reading ID3 tag of HLS segment: %s", segment_url)
+            try:
+                head = await _read_segment_id3(segment_url, session, timeout)
+            except (aiohttp.ClientError, TimeoutError) as err:
+                _LOGGER.debug("Failed to download HLS segment %s: %s", segment_url, err)
+                continue
+            segment_metadata = _parse_segment_metadata(head) if head else None
+            if segment_metadata is not None:
+                state.metadata = segment_metadata
+                break
+            _LOGGER.debug("HLS segment has no extractable metadata")
+        if new_segments:
+            state.checked_sequence = new_segments[-1][0]
+
+        if state.metadata is not None:
+            return state.metadata
+
+        # If no metadata found in segments, try to extract station name from URL
+        _LOGGER.debug("No metadata found in segments, trying URL-based extraction")
+        metadata = _extract_station_name_from_url(url)
+        return metadata if metadata.station_name else None
+
+    except Exception as err:
+        _LOGGER.debug("Error extracting HLS metadata from %s: %s", url, err)
+        # Try URL-based extraction as last resort
+        metadata = _extract_station_name_from_url(url)
+        return metadata if metadata.station_name else None
+
+
+async def _read_prefix(response: aiohttp.ClientResponse, size: int) -> bytes:
+    """Read at most size bytes from a response body, leaving everything after them unread."""
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = await response.content.read(min(size - len(buffer), 65536))
+        if not chunk:
+            break
+        buffer += chunk
+    return bytes(buffer)
+
+
+def _id3_tag_size(data: bytes) -> int:
+    """Total size of an ID3v2 tag at the start of data (0 if there is none)."""
+    if len(data) < 10 or not data.startswith(b"ID3"):
+        return 0
+    size = 0
+    for byte in data[6:10]:
+        size = (size << 7) | (byte & 0x7F)  # Syncsafe integer
+    footer = 10 if data[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+async def _read_segment_id3(url: str, session: aiohttp.ClientSession, timeout: int) -> bytes | None:
+    """Download the leading bytes of an HLS segment that hold its ID3 tag.
+
+    A Range request fetches HLS_ID3_PROBE_BYTES; if the tag is longer, the rest
+    is requested with a second Range request (up to HLS_ID3_MAX_BYTES). Servers
+    that ignore Range are read only up to the end of the tag.
+
+    Returns:
+        The segment prefix (the complete ID3 tag if present), or None on HTTP errors.
+    """
+    headers = {"User-Agent": USER_AGENT, "Range": f"bytes=0-{HLS_ID3_PROBE_BYTES - 1}"}
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with session.get(url, headers=headers, timeout=client_timeout) as response:
+        if response.status not in (200, 206):
+            _LOGGER.debug("Failed to download HLS segment: HTTP %d", response.status)
+            return None
+        data = await _read_prefix(response, HLS_ID3_PROBE_BYTES)
+        tag_size = min(_id3_tag_size(data), HLS_ID3_MAX_BYTES)
+        if tag_size <= len(data):
+            return data
+        if response.status == 200:
+            # Range ignored - keep reading this response up to the end of the tag
+            return data + await _read_prefix(response, tag_size - len(data))
+
+    headers["Range"] = f"bytes={len(data)}-{tag_size - 1}"
+    async with session.get(url, headers=headers, timeout=client_timeout) as response:
+        if response.status == 206:
+            return data + await _read_prefix(response, tag_size - len(data))
+        if response.status == 200:
+            return await _read_prefix(response, tag_size)
+    return data
+
+
+def _parse_segment_metadata(segment_data: bytes) -> StreamMetadata | None:
+    """Parse title/artist from the (leading bytes of an) HLS segment."""
+    # HLS segments often have ID3 tags embedded in AAC streams
+    audio_data = BytesIO(segment_data)
+    metadata = StreamMetadata()
+
+    # Check if segment starts with ID3 tag
+    if segment_data.startswith(b"ID3"):
+        # Try to parse ID3 tags directly
+        try:
+            from mutagen.id3 import ID3
+
+            id3_tags = ID3(audio_data)
+            if id3_tags:
+                # Extract standard ID3 tags
+                title_tag = id3_tags.get("TIT2")  # Title
+                artist_tag = id3_tags.get("TPE1")  # Artist
+
+                if title_tag:
+                    metadata.title = _decode_text(str(title_tag))
+                if artist_tag:
+                    metadata.artist = _decode_text(str(artist_tag))
+
+                if metadata.title or metadata.artist:
+                    _LOGGER.debug(
+                        "Extracted HLS metadata from ID3: title=%s, artist=%s",
+                        metadata.title,
+                        metadata.artist,
+                    )
+                    return metadata
+        except Exception as id3_err:
+            _LOGGER.debug("Failed to parse ID3 tags directly: %s", id3_err)
+        audio_data.seek(0)
+
+    # Fallback: Try mutagen File() for other formats
+    try:
+        tags = MutagenFile(audio_data)
+    except Exception as err:
+        _LOGGER.debug("Failed to parse HLS segment tags: %s", err)
+        return None
+    if tags and tags.tags:
+        # Extract standard ID3 tags, or common alternative tag names
+        title_tag = tags.tags.get("TIT2") or tags.tags.get("TITLE")
+        artist_tag = tags.tags.get("TPE1") or tags.tags.get("ARTIST")
+
+        # Extract text values from tags
+        if title_tag:
+            title_value = str(title_tag[0])
+            if title_value:
+                metadata.title = _decode_text(title_value)
+
+        if artist_tag:
+            artist_value = str(artist_tag[0])
+            if artist_value:
+                metadata.artist = _decode_text(artist_value)
+
+    if metadata.title or metadata.artist:
+        _LOGGER.debug("Extracted HLS metadata: title=%s, artist=%s", metadata.title, metadata.artist)
+        return metadata
+    return None
+
+
+def _extract_station_name_from_url(url: str) -> StreamMetadata:
+    """Extract station name from URL patterns as fallback.
+
+    Args:
+        url: Stream URL
+
+    Returns:
+        StreamMetadata with station_name if found
+    """
+    metadata = StreamMetadata()
+
+    # Radio-Canada patterns
+    if "rcavliveaudio" in url or "radio-canada" in url.lower():
+        if "P-2QMTL0_MTL" in url:
+            metadata.station_name = "Radio-Canada ICI Première Montréal"
+        elif "ICI_PREMIERE" in url.upper():
+            metadata.station_name = "Radio-Canada ICI Première"
+        elif "ICI_MUSIQUE" in url.upper():
+            metadata.station_name = "Radio-Canada ICI Musique"
+        else:
+            metadata.station_name = "Radio-Canada"
+
+    # BBC patterns
+    elif "bbc" in url.lower():
+        if "radio_one" in url.lower():
+            metadata.station_name = "BBC Radio 1"
+        elif "radio_two" in url.lower():
+            metadata.station_name = "BBC Radio 2"
+        else:
+            metadata.station_name = "BBC Radio"
+
+    # CBC patterns
+    elif "cbc" in url.lower():
+        if "CBCR1" in url.upper():
+            metadata.station_name = "CBC Radio One"
+        else:
+            metadata.station_name = "CBC Radio"
+
+    return metadata
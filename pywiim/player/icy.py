@@ -0,0 +1,264 @@
+"""Long-lived ICY (Icecast/SHOUTcast) metadata reader.
+
+get_stream_metadata() opens a radio stream, reads up to the first metadata
+block and closes the connection, so the title it returns goes stale with the
+next song. IcyMetadataReader keeps one connection per stream URL open
+instead and pushes every ``StreamTitle`` change to its listeners as soon as
+the station sends it.
+
+Audio bytes are skipped by counting against ``icy-metaint``; only metadata
+blocks are copied. Readers are shared: all players tuned to the same station
+subscribe to one reader, which disconnects when the last listener leaves and
+reconnects with backoff when the connection drops. Each reader owns a private
+aiohttp session, so it does not depend on (or keep using) the session of the
+player that happened to subscribe first.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Final
+
+import aiohttp
+
+from .stream import (
+    ICE_METAINT_HEADER,
+    ICE_NAME_HEADER,
+    METADATA_TIMEOUT,
+    USER_AGENT,
+    StreamMetadata,
+    _decode_text,
+    _parse_stream_title,
+)
+from .streamurl import _resolve_stream_url
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "ICY_READ_TIMEOUT",
+    "ICY_RECONNECT_DELAY",
+    "ICY_RECONNECT_MAX_DELAY",
+    "IcyMetadataListener",
+    "IcyMetadataParser",
+    "IcyMetadataReader",
+    "subscribe_icy_metadata",
+]
+
+# Seconds without any stream data before the connection is considered dead
+ICY_READ_TIMEOUT: Final = 30.0
+
+# Reconnect backoff after a dropped connection (doubles up to the maximum)
+ICY_RECONNECT_DELAY: Final = 2.0
+ICY_RECONNECT_MAX_DELAY: Final = 60.0
+
+IcyMetadataListener = Callable[[StreamMetadata], None]
+
+
+class IcyMetadataParser:
+    """Incremental splitter of an ICY stream into metadata blocks.
+
+    The stream alternates ``metaint`` audio bytes, one length byte (in units
+    of 16 bytes) and the metadata block. Audio is skipped by advancing an
+    offset into each chunk, so it is never copied.
+    """
+
+    def __init__(self, metaint: int) -> None:
+        """Initialize parser.
+
+        Args:
+            metaint: Audio bytes between metadata blocks (``icy-metaint`` header).
+
+        Raises:
+            ValueError: If metaint is not positive.
+        """
+        if metaint <= 0:
+            raise ValueError("metaint must be greater than 0")
+        self.metaint = metaint
+        self._audio_left = metaint
+        self._meta_left: int | None = None
+        self._meta = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume a chunk of stream data.
+
+        Returns:
+            Complete, non-empty metadata blocks contained in the data so far.
+        """
+        blocks: list[bytes] = []
+        view = memoryview(chunk)
+        size = len(view)
+        pos = 0
+        while pos < size:
+            if self._audio_left:
+                step = min(self._audio_left, size - pos)
+                self._audio_left -= step
+                pos += step
+            elif self._meta_left is None:
+                self._meta_left = view[pos] * 16
+                pos += 1
+                if not self._meta_left:
+                    self._meta_left = None
+                    self._audio_left = self.metaint
+            else:
+                step = min(self._meta_left, size - pos)
+                self._meta += view[pos : pos + step]
+                self._meta_left -= step
+                pos += step
+                if not self._meta_left:
+                    blocks.append(bytes(self._meta))
+                    self._meta.clear()
+                    self._meta_left = None
+                    self._audio_left = self.metaint
+        return blocks
+
+
+class IcyMetadataReader:
+    """Shared long-lived metadata reader for one stream URL."""
+
+    def __init__(self, url: str, reconnect_delay: float = ICY_RECONNECT_DELAY) -> None:
+        """Initialize reader.
+
+        Args:
+            url: Stream (or M3U/PLS playlist) URL.
+            reconnect_delay: Initial delay in seconds before reconnecting.
+        """
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.metadata: StreamMetadata | None = None
+        self.connects = 0
+        self._listeners: list[IcyMetadataListener] = []
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the reader task is active."""
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self, listener: IcyMetadataListener) -> Callable[[], None]:
+        """Register a listener and start reading if needed.
+
+        The latest metadata, if any, is delivered to the new listener right away.
+
+        Returns:
+            Callable that removes the listener again.
+        """
+        self._listeners.append(listener)
+        if self.metadata is not None:
+            self._notify_one(listener, self.metadata)
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if not self._listeners:
+                self.stop()
+
+        return unsubscribe
+
+    def stop(self) -> None:
+        """Disconnect from the stream."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _run(self) -> None:
+        """Read the stream until stopped, reconnecting after errors (in a private session)."""
+        session = aiohttp.ClientSession()
+        delay = self.reconnect_delay
+        try:
+            while self._listeners:
+                try:
+                    if not await self._read_stream(session):
+                        return
+                    delay = self.reconnect_delay
+                except (aiohttp.ClientError, TimeoutError) as err:
+                    _LOGGER.debug("ICY metadata stream %s dropped: %s", self.url, err)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, ICY_RECONNECT_MAX_DELAY)
+        except asyncio.CancelledError:
+            pass
+        except Exception as err:
+            _LOGGER.debug("Unexpected error reading ICY metadata from %s: %s", self.url, err)
+        finally:
+            await session.close()
+
+    async def _read_stream(self, session: aiohttp.ClientSession) -> bool:
+        """Read one connection until it ends.
+
+        Returns:
+            False if the stream does not carry ICY metadata (no point in reconnecting).
+        """
+        url = await _resolve_stream_url(self.url, session)
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=METADATA_TIMEOUT, sock_read=ICY_READ_TIMEOUT)
+        headers = {"Icy-MetaData": "1", "User-Agent": USER_AGENT}
+        async with session.get(url, headers=headers, timeout=timeout) as response:
+            metaint_str = response.headers.get(ICE_METAINT_HEADER)
+            if response.status != 200 or not metaint_str:
+                _LOGGER.debug("Stream %s does not provide ICY metadata", self.url)
+                return False
+            try:
+                parser = IcyMetadataParser(int(metaint_str))
+            except ValueError:
+                return False
+
+            station_name = None
+            icy_name = response.headers.get(ICE_NAME_HEADER)
+            if icy_name and icy_name not in ("no name", "Unspecified name", "-"):
+                station_name = _decode_text(icy_name)
+
+            self.connects += 1
+            _LOGGER.debug("Reading ICY metadata from %s (metaint=%d)", url, parser.metaint)
+            async for chunk in response.content.iter_any():
+                for block in parser.feed(chunk):
+                    metadata = StreamMetadata(station_name=station_name)
+                    _parse_stream_title(block, metadata)
+                    if metadata.title is None:
+                        continue
+                    previous = self.metadata
+                    if previous is not None and (previous.title, previous.artist) == (metadata.title, metadata.artist):
+                        continue
+                    self.metadata = metadata
+                    for listener in list(self._listeners):
+                        self._notify_one(listener, metadata)
+        return True
+
+    def _notify_one(self, listener: IcyMetadataListener, metadata: StreamMetadata) -> None:
+        """Deliver metadata to one listener, isolating its errors."""
+        try:
+            listener(metadata)
+        except Exception as err:
+            _LOGGER.debug("Error in ICY metadata listener: %s", err)
+
+
+_READERS: dict[str, IcyMetadataReader] = {}
+
+
+def subscribe_icy_metadata(url: str, listener: IcyMetadataListener) -> Callable[[], None]:
+    """Receive StreamTitle changes of a radio stream as they arrive.
+
+    All subscribers of the same URL share one reader and one connection, made
+    in the reader's own session.
+
+    Args:
+        url: Stream (or M3U/PLS playlist) URL.
+        listener: Called with the new StreamMetadata on every title change.
+
+    Returns:
+        Callable that unsubscribes; the connection is closed when the last
+        listener unsubscribes.
+    """
+    reader = _READERS.get(url)
+    if reader is None:
+        reader = IcyMetadataReader(url)
+        _READERS[url] = reader
+    unsubscribe = reader.subscribe(listener)
+
+    def release() -> None:
+        unsubscribe()
+        if not reader._listeners and _READERS.get(url) is reader:
+            del _READERS[url]
+
+    return release
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import logging
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 from html import unescape
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Literal, cast
 from xml.etree import ElementTree as ET
 
 from ..exceptions import WiiMError
+from ..upnp.didl import DidlCache
+from .queue import QueueCache
 from .source_capabilities import SOURCE_CAPABILITIES, source_supports_native_notification_prompt
 
 if TYPE_CHECKING:
@@ -16,6 +21,24 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed queue Browse pages, keyed by DIDL content digest
+_QUEUE_DIDL_CACHE = DidlCache(maxsize=16)
+
+# Namespaces in queue DIDL-Lite (both standard and LinkPlay-specific)
+_QUEUE_NAMESPACES = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "upnp": "urn:schemas-upnp-org:metadata-1-0/upnp/",
+    "song": "www.linkplay.com/song/",
+    "": "urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/",
+}
+_DIDL_ITEM_TAGS = frozenset({"{urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/}item", "item"})
+
+# Characters fed to the pull parser at a time when streaming queue items
+_QUEUE_PARSE_CHUNK = 65536
+
+# Streamed queue items between event loop yields
+_QUEUE_STREAM_BATCH = 50
+
 
 @dataclass(slots=True)
 class NotificationPlaybackResult:
@@ -38,6 +61,9 @@ class MediaControl:
         """
         self.player = player
 
+        # Parsed queue pages, validated by ContentDirectory UpdateID
+        self._queue_cache = QueueCache()
+
     async def _route_slave_command(self, group_method) -> bool:
         """Route slave playback commands through group to master.
 
@@ -300,6 +326,8 @@ class MediaControl:
             WiiMError: If enqueue='add' or 'next' and UPnP client is not available.
                 Note: Does NOT raise for invalid/unreachable URLs.
         """
+        self._queue_cache.invalidate()
+
         # Call API (raises on failure)
         if enqueue in ("add", "next"):
             if not self.player._upnp_client:
@@ -320,6 +348,8 @@ class MediaControl:
         Args:
             playlist_url: URL to M3U playlist file.
         """
+        self._queue_cache.invalidate()
+
         # Call API (raises on failure)
         await self.player.client.play_playlist(playlist_url)
 
@@ -385,6 +415,7 @@ class MediaControl:
         if not self.player._upnp_client:
             raise WiiMError("Queue management requires UPnP client.")
 
+        self._queue_cache.invalidate()
         await self.player._upnp_client.async_call_action(
             "AVTransport",
             "AddURIToQueue",
@@ -407,6 +438,7 @@ class MediaControl:
         if not self.player._upnp_client:
             raise WiiMError("Queue management requires UPnP client.")
 
+        self._queue_cache.invalidate()
         await self.player._upnp_client.async_call_action(
             "AVTransport",
             "InsertURIToQueue",
@@ -447,6 +479,8 @@ class MediaControl:
         Raises:
             WiiMError: If both UPnP and HTTP API methods fail
         """
+        self._queue_cache.invalidate()
+
         # Try UPnP PlayQueue DeleteQueue first (more reliable on some devices)
         if self.player._upnp_client and self.player._upnp_client.play_queue is not None:
             try:
@@ -511,104 +545,147 @@ class MediaControl:
             - position: Position in queue (0-based index)
             - image_url: Album art URL (if available)
         """
-        items: list[dict[str, Any]] = []
-
         if not didl_xml or didl_xml.strip() == "":
-            return items
+            return []
 
         try:
-            # Unescape HTML entities (e.g., &lt; becomes <)
-            didl_xml = unescape(didl_xml)
-
-            # Parse XML
-            root = ET.fromstring(didl_xml)
-
-            # Define namespaces (both standard and LinkPlay-specific)
-            namespaces = {
-                "dc": "http://purl.org/dc/elements/1.1/",
-                "upnp": "urn:schemas-upnp-org:metadata-1-0/upnp/",
-                "song": "www.linkplay.com/song/",
-                "": "urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/",
-            }
-
-            # Find all item elements
-            item_elements = root.findall(".//item", namespaces)
-            if not item_elements:
-                # Try without namespace
-                item_elements = root.findall(".//item")
-
-            for idx, item in enumerate(item_elements):
-                queue_item: dict[str, Any] = {
-                    "position": starting_index + idx,  # 0-based position in queue
-                }
-
-                # Extract URI from res element (res contains the media URL)
-                res_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/}res")
-                if res_elem is None:
-                    # Try without namespace
-                    res_elem = item.find(".//res")
-
-                if res_elem is not None and res_elem.text:
-                    queue_item["media_content_id"] = res_elem.text.strip()
-
-                    # Extract duration from res element's duration attribute
-                    # Format is typically "H:MM:SS" or "H:MM:SS.mmm"
-                    duration_str = res_elem.get("duration")
-                    if duration_str:
-                        duration_seconds = self._parse_duration(duration_str)
-                        if duration_seconds is not None:
-                            queue_item["duration"] = duration_seconds
-                else:
-                    # Fallback: check for res attribute on item
-                    res_attr = item.get("res")
-                    if res_attr:
-                        queue_item["media_content_id"] = res_attr.strip()
-
-                # Extract title (dc:title)
-                title_elem = item.find("dc:title", namespaces)
-                if title_elem is None:
-                    title_elem = item.find(".//{http://purl.org/dc/elements/1.1/}title")
-                if title_elem is not None and title_elem.text:
-                    queue_item["title"] = title_elem.text.strip()
-
-                # Extract artist (upnp:artist or dc:creator)
-                artist_elem = item.find("upnp:artist", namespaces)
-                if artist_elem is None:
-                    artist_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}artist")
-                if artist_elem is None:
-                    artist_elem = item.find("dc:creator", namespaces)
-                if artist_elem is None:
-                    artist_elem = item.find(".//{http://purl.org/dc/elements/1.1/}creator")
-                if artist_elem is not None and artist_elem.text:
-                    queue_item["artist"] = artist_elem.text.strip()
-
-                # Extract album (upnp:album)
-                album_elem = item.find("upnp:album", namespaces)
-                if album_elem is None:
-                    album_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}album")
-                if album_elem is not None and album_elem.text:
-                    queue_item["album"] = album_elem.text.strip()
-
-                # Extract album art URI (upnp:albumArtURI)
-                art_elem = item.find("upnp:albumArtURI", namespaces)
-                if art_elem is None:
-                    art_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}albumArtURI")
-                if art_elem is not None and art_elem.text:
-                    image_url = art_elem.text.strip()
-                    # Validate URL: must be valid http/https and not placeholder values
-                    if image_url and image_url != "un_known" and self._is_valid_url(image_url):
-                        queue_item["image_url"] = image_url
-
-                # Only add item if it has at least a media_content_id
-                if queue_item.get("media_content_id"):
-                    items.append(queue_item)
-
+            # Identical pages are parsed once; positions are applied per call
+            cached = _QUEUE_DIDL_CACHE.get_or_parse(didl_xml, self._extract_queue_items)
+            return [{**item, "position": starting_index + item["position"]} for item in cached]
         except ET.ParseError as err:
             _LOGGER.warning("Failed to parse queue DIDL-Lite XML: %s", err)
         except Exception as err:
             _LOGGER.warning("Error parsing queue items: %s", err)
 
-        return items
+        return []
+
+    def _extract_queue_items(self, didl_xml: str) -> list[dict[str, Any]]:
+        """Extract queue items from a DIDL-Lite page (positions relative to the page).
+
+        Args:
+            didl_xml: DIDL-Lite XML string containing queue items
+
+        Returns:
+            List of queue item dictionaries (see _parse_queue_items).
+
+        Raises:
+            ET.ParseError: If the XML is malformed.
+        """
+        return list(self._iter_queue_items(didl_xml))
+
+    def _iter_queue_items(self, didl_xml: str, starting_index: int = 0) -> Iterator[dict[str, Any]]:
+        """Incrementally parse DIDL-Lite XML, yielding queue items as they complete.
+
+        Uses XMLPullParser fed in chunks; each item element is detached from the
+        tree once converted, so memory stays bounded regardless of queue size.
+
+        Args:
+            didl_xml: DIDL-Lite XML string containing queue items
+            starting_index: Position of the first item in the queue
+
+        Yields:
+            Queue item dictionaries (see _parse_queue_items).
+
+        Raises:
+            ET.ParseError: If the XML is malformed (items before the error are
+                already yielded).
+        """
+        # Unescape HTML entities (e.g., &lt; becomes <)
+        didl_xml = unescape(didl_xml)
+
+        parser: ET.XMLPullParser = ET.XMLPullParser(events=("start", "end"))
+        open_elements: list[ET.Element] = []
+        index = starting_index
+        chunks = (didl_xml[i : i + _QUEUE_PARSE_CHUNK] for i in range(0, len(didl_xml), _QUEUE_PARSE_CHUNK))
+        # Chunks are sliced lazily; None marks the end of the document
+        for chunk in itertools.chain(chunks, (None,)):
+            if chunk is None:
+                parser.close()
+            else:
+                parser.feed(chunk)
+            # Only start/end events are requested, so every event carries an element
+            for event, elem in cast("Iterator[tuple[str, ET.Element]]", parser.read_events()):
+                if event == "start":
+                    open_elements.append(elem)
+                    continue
+                open_elements.pop()
+                if elem.tag not in _DIDL_ITEM_TAGS:
+                    continue
+                queue_item = self._queue_item_from_element(elem, index)
+                index += 1
+                if open_elements:
+                    open_elements[-1].remove(elem)  # Drop parsed items from the tree
+                if queue_item is not None:
+                    yield queue_item
+
+    def _queue_item_from_element(self, item: ET.Element, position: int) -> dict[str, Any] | None:
+        """Convert one DIDL-Lite item element to a queue item (None without a media URI)."""
+        namespaces = _QUEUE_NAMESPACES
+        queue_item: dict[str, Any] = {
+            "position": position,
+        }
+
+        # Extract URI from res element (res contains the media URL)
+        res_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/}res")
+        if res_elem is None:
+            # Try without namespace
+            res_elem = item.find(".//res")
+
+        if res_elem is not None and res_elem.text:
+            queue_item["media_content_id"] = res_elem.text.strip()
+
+            # Extract duration from res element's duration attribute
+            # Format is typically "H:MM:SS" or "H:MM:SS.mmm"
+            duration_str = res_elem.get("duration")
+            if duration_str:
+                duration_seconds = self._parse_duration(duration_str)
+                if duration_seconds is not None:
+                    queue_item["duration"] = duration_seconds
+        else:
+            # Fallback: check for res attribute on item
+            res_attr = item.get("res")
+            if res_attr:
+                queue_item["media_content_id"] = res_attr.strip()
+
+        # Extract title (dc:title)
+        title_elem = item.find("dc:title", namespaces)
+        if title_elem is None:
+            title_elem = item.find(".//{http://purl.org/dc/elements/1.1/}title")
+        if title_elem is not None and title_elem.text:
+            queue_item["title"] = title_elem.text.strip()
+
+        # Extract artist (upnp:artist or dc:creator)
+        artist_elem = item.find("upnp:artist", namespaces)
+        if artist_elem is None:
+            artist_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}artist")
+        if artist_elem is None:
+            artist_elem = item.find("dc:creator", namespaces)
+        if artist_elem is None:
+            artist_elem = item.find(".//{http://purl.org/dc/elements/1.1/}creator")
+        if artist_elem is not None and artist_elem.text:
+            queue_item["artist"] = artist_elem.text.strip()
+
+        # Extract album (upnp:album)
+        album_elem = item.find("upnp:album", namespaces)
+        if album_elem is None:
+            album_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}album")
+        if album_elem is not None and album_elem.text:
+            queue_item["album"] = album_elem.text.strip()
+
+        # Extract album art URI (upnp:albumArtURI)
+        art_elem = item.find("upnp:albumArtURI", namespaces)
+        if art_elem is None:
+            art_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}albumArtURI")
+        if art_elem is not None and art_elem.text:
+            image_url = art_elem.text.strip()
+            # Validate URL: must be valid http/https and not placeholder values
+            if image_url and image_url != "un_known" and self._is_valid_url(image_url):
+                queue_item["image_url"] = image_url
+
+        # Only return item if it has at least a media_content_id
+        if queue_item.get("media_content_id"):
+            return queue_item
+        return None
 
     def _parse_duration(self, duration_str: str) -> int | None:
         """Parse UPnP duration string to seconds.
@@ -646,6 +723,7 @@ class MediaControl:
         object_id: str = "Q:0",
         starting_index: int = 0,
         requested_count: int = 0,
+        use_cache: bool = False,
     ) -> list[dict[str, Any]]:
         """Get current queue contents (requires UPnP client with ContentDirectory service).
 
@@ -667,6 +745,8 @@ class MediaControl:
             object_id: Queue object ID (default "Q:0" for standard queue)
             starting_index: Starting index for pagination (0 = first item)
             requested_count: Number of items to retrieve (0 = all available)
+            use_cache: Serve the range from the paged queue cache (see iter_queue()),
+                browsing only pages that are missing or whose UpdateID changed.
 
         Returns:
             List of queue item dictionaries, each containing:
@@ -685,6 +765,16 @@ class MediaControl:
         if not self.player._upnp_client:
             raise WiiMError("Queue retrieval requires UPnP client.")
 
+        if use_cache:
+            end = starting_index + requested_count if requested_count > 0 else None
+            items: list[dict[str, Any]] = []
+            first_page = starting_index // self._queue_cache.page_size
+            async for page in self._iter_queue_pages(object_id, first_page):
+                items.extend(item for item in page if item["position"] >= starting_index)
+                if end is not None and items and items[-1]["position"] >= end - 1:
+                    break
+            return items if end is None else items[: end - starting_index]
+
         try:
             # Browse queue using ContentDirectory service
             result = await self.player._upnp_client.browse_queue(
@@ -710,6 +800,151 @@ class MediaControl:
             _LOGGER.warning("Failed to get queue from %s: %s", self.player.host, err)
             raise WiiMError(f"Failed to get queue: {err}") from err
 
+    def upcoming_queue_items(self, count: int, current_title: str | None = None) -> list[dict[str, Any]]:
+        """Queue items following the current track, from the queue cache only.
+
+        Never browses the device: returns [] unless the queue has been browsed
+        with caching (get_queue(use_cache=True) / iter_queue()) and the cached
+        snapshot is still trusted.
+
+        Args:
+            count: Number of upcoming items wanted.
+            current_title: Title of the current track, used to tell whether
+                plicurr points at the current item or at the one before it.
+        """
+        position = self.player._status_model.queue_position if self.player._status_model else None
+        queue_count = self.player._status_model.queue_count if self.player._status_model else None
+        if position is None or count <= 0 or not self._queue_cache.is_trusted("Q:0", queue_count):
+            return []
+
+        # plicurr is 1-based on LinkPlay firmware; cached items use 0-based positions
+        current = position - 1
+        if current_title:
+            for candidate in (current, position):
+                items = self._queue_cache.cached_items("Q:0", candidate, 1)
+                if items and items[0].get("title") == current_title:
+                    current = candidate
+                    break
+        return self._queue_cache.cached_items("Q:0", current + 1, count)
+
+    async def iter_queue(self, object_id: str = "Q:0") -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream queue contents page by page (requires UPnP ContentDirectory).
+
+        Pages are cached per queue and validated by the ContentDirectory UpdateID,
+        so repainting a large (e.g. USB-drive) queue usually needs no Browse
+        requests at all, and a changed current position never does.
+
+        Args:
+            object_id: Queue object ID (default "Q:0" for standard queue)
+
+        Yields:
+            Lists of queue item dictionaries (same fields as get_queue()).
+
+        Raises:
+            WiiMError: If UPnP client is not available or queue retrieval fails
+        """
+        if not self.player._upnp_client:
+            raise WiiMError("Queue retrieval requires UPnP client.")
+
+        async for page in self._iter_queue_pages(object_id, 0):
+            yield page
+
+    async def stream_queue(
+        self,
+        object_id: str = "Q:0",
+        starting_index: int = 0,
+        requested_count: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Browse the queue and yield items while the DIDL-Lite result is parsed.
+
+        Unlike get_queue(), the Browse result is parsed incrementally, so the
+        first items are available before a large (thousands of tracks) result
+        is fully parsed, and no full tree or item list is built. Control returns
+        to the event loop every few dozen items.
+
+        Args:
+            object_id: Queue object ID (default "Q:0" for standard queue)
+            starting_index: Starting index for pagination (0 = first item)
+            requested_count: Number of items to retrieve (0 = all available)
+
+        Yields:
+            Queue item dictionaries (same fields as get_queue()). Parsing stops
+            with a warning at malformed XML, after the items already yielded.
+
+        Raises:
+            WiiMError: If UPnP client is not available or the Browse action fails
+        """
+        if not self.player._upnp_client:
+            raise WiiMError("Queue retrieval requires UPnP client.")
+
+        try:
+            result = await self.player._upnp_client.browse_queue(
+                object_id=object_id,
+                starting_index=starting_index,
+                requested_count=requested_count,
+            )
+        except Exception as err:
+            _LOGGER.warning("Failed to get queue from %s: %s", self.player.host, err)
+            raise WiiMError(f"Failed to get queue: {err}") from err
+
+        didl_xml = result.get("Result", "")
+        if not didl_xml or not didl_xml.strip():
+            return
+
+        try:
+            for count, item in enumerate(self._iter_queue_items(didl_xml, starting_index), 1):
+                yield item
+                if count % _QUEUE_STREAM_BATCH == 0:
+                    await asyncio.sleep(0)
+        except ET.ParseError as err:
+            _LOGGER.warning("Failed to parse queue DIDL-Lite XML: %s", err)
+
+    async def _iter_queue_pages(self, object_id: str, first_page: int) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield queue pages from first_page on, from cache or via Browse."""
+        cache = self._queue_cache
+        trusted = cache.is_trusted(object_id, self.player.queue_count)
+        page_index = first_page
+        while True:
+            page = cache.get_page(object_id, page_index) if trusted else None
+            if page is None:
+                page = await self._browse_queue_page(object_id, page_index)
+                # A matching UpdateID keeps the other cached pages; a new one dropped them
+                trusted = True
+
+            yield [dict(item) for item in page]
+
+            total = cache.total(object_id)
+            if not page or total is None or (page_index + 1) * cache.page_size >= total:
+                return
+            page_index += 1
+
+    async def _browse_queue_page(self, object_id: str, page_index: int) -> list[dict[str, Any]]:
+        """Browse one queue page and store it in the queue cache."""
+        if not self.player._upnp_client:
+            raise WiiMError("Queue retrieval requires UPnP client.")
+
+        page_size = self._queue_cache.page_size
+        starting_index = page_index * page_size
+        try:
+            result = await self.player._upnp_client.browse_queue(
+                object_id=object_id,
+                starting_index=starting_index,
+                requested_count=page_size,
+            )
+        except Exception as err:
+            _LOGGER.warning("Failed to get queue page %d from %s: %s", page_index, self.player.host, err)
+            raise WiiMError(f"Failed to get queue: {err}") from err
+
+        items = self._parse_queue_items(result.get("Result", ""), starting_index)
+        total = result.get("TotalMatches")
+        try:
+            total = int(total) if total is not None else None
+        except (TypeError, ValueError):
+            total = None
+        if self._queue_cache.store_page(object_id, page_index, items, result.get("UpdateID"), total):
+            _LOGGER.debug("Queue %s on %s changed (UpdateID) - dropped cached pages", object_id, self.player.host)
+        return items
+
     async def play_queue(self, queue_position: int = 0) -> None:
         """Start playing from the queue at a specific position.
 
@@ -774,6 +1009,8 @@ class MediaControl:
         if queue_position < 0:
             raise WiiMError(f"Invalid queue position: {queue_position} (must be >= 0)")
 
+        self._queue_cache.invalidate()
+
         try:
             # RemoveTrackFromQueue uses ObjectID which is typically "Q:0/position"
             # UPnP uses 1-based track numbers
@@ -815,6 +1052,8 @@ class MediaControl:
         if not self.player._upnp_client:
             raise WiiMError("Queue management requires UPnP client.")
 
+        self._queue_cache.invalidate()
+
         try:
             await self.player._upnp_client.async_call_action(
                 "av_transport",
@@ -66,7 +66,7 @@ class PlaybackControl:
             self.player._status_model.loop_mode = loop_mode
 
         # Track when loop_mode was set for preserving optimistic update during refresh
-        self.player._last_loop_mode_set_time = time.time()
+        self.player._last_loop_mode_set_time = time.monotonic()
 
         # Call callback to notify state change
         if self.player._on_state_changed:
@@ -122,7 +122,7 @@ class PlaybackControl:
             self.player._status_model.loop_mode = loop_mode
 
         # Track when loop_mode was set for preserving optimistic update during refresh
-        self.player._last_loop_mode_set_time = time.time()
+        self.player._last_loop_mode_set_time = time.monotonic()
 
         # Call callback to notify state change
         if self.player._on_state_changed:
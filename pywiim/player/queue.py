@@ -0,0 +1,177 @@
+"""Paged queue cache keyed by ContentDirectory UpdateID.
+
+USB-drive queues on WiiM Amp/Ultra can hold thousands of tracks, and a media
+browser repaint used to Browse and parse the whole queue every time. QueueCache
+keeps parsed Browse pages per queue object, together with the UpdateID and
+TotalMatches the device reported for them:
+
+- While the snapshot is trusted (younger than the TTL and its track count
+  still matches the HTTP ``plicount``), pages are served without any request.
+  Changes of the current queue position do not touch the cache.
+- Otherwise the first page needed is re-browsed. If the device reports the
+  same UpdateID, the remaining cached pages are still valid and reused
+  (incremental refresh); a new UpdateID drops all cached pages.
+- Queue-mutating commands invalidate the cache explicitly.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = ["QueueCache", "DEFAULT_QUEUE_PAGE_SIZE", "QUEUE_CACHE_TTL"]
+
+# Items per Browse request when paging through a queue
+DEFAULT_QUEUE_PAGE_SIZE = 100
+
+# Seconds a validated queue snapshot is trusted without asking the device
+QUEUE_CACHE_TTL = 300.0
+
+
+@dataclass
+class _QueueSnapshot:
+    """Cached pages of one queue object."""
+
+    update_id: Any
+    total: int | None
+    validated_at: float
+    pages: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+    # Per page: queue position -> item (pages have gaps where items were skipped while parsing)
+    positions: dict[int, dict[int, dict[str, Any]]] = field(default_factory=dict)
+
+
+class QueueCache:
+    """Per-player cache of parsed queue Browse pages."""
+
+    def __init__(self, page_size: int = DEFAULT_QUEUE_PAGE_SIZE, ttl: float = QUEUE_CACHE_TTL) -> None:
+        """Initialize queue cache.
+
+        Args:
+            page_size: Items per Browse page.
+            ttl: Seconds a snapshot is trusted before it is revalidated.
+
+        Raises:
+            ValueError: If page_size is not positive.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be greater than 0")
+        self.page_size = page_size
+        self.ttl = ttl
+        self._snapshots: dict[str, _QueueSnapshot] = {}
+
+        # Counters (see statistics)
+        self.page_hits = 0
+        self.page_fetches = 0
+        self.invalidations = 0
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Cache counters for diagnostics."""
+        return {
+            "queues": len(self._snapshots),
+            "pages": sum(len(snapshot.pages) for snapshot in self._snapshots.values()),
+            "page_hits": self.page_hits,
+            "page_fetches": self.page_fetches,
+            "invalidations": self.invalidations,
+        }
+
+    def total(self, object_id: str) -> int | None:
+        """Last TotalMatches reported for a queue (None if unknown)."""
+        snapshot = self._snapshots.get(object_id)
+        return snapshot.total if snapshot is not None else None
+
+    def is_trusted(self, object_id: str, queue_count: int | None = None, now: float | None = None) -> bool:
+        """Whether cached pages can be served without revalidating.
+
+        Args:
+            object_id: Queue object ID.
+            queue_count: Current track count from the HTTP API (plicount), if known.
+            now: Current monotonic time (defaults to time.monotonic()).
+        """
+        snapshot = self._snapshots.get(object_id)
+        if snapshot is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if now - snapshot.validated_at >= self.ttl:
+            return False
+        if queue_count is not None and snapshot.total is not None and queue_count != snapshot.total:
+            return False
+        return True
+
+    def get_page(self, object_id: str, page_index: int) -> list[dict[str, Any]] | None:
+        """Get a cached page (None on a miss)."""
+        snapshot = self._snapshots.get(object_id)
+        if snapshot is None:
+            return None
+        page = snapshot.pages.get(page_index)
+        if page is not None:
+            self.page_hits += 1
+        return page
+
+    def cached_items(self, object_id: str, start: int, count: int) -> list[dict[str, Any]]:
+        """Cached items at positions start..start+count-1 (without Browse or hit counting).
+
+        Items are looked up by their "position" field, not their offset in the
+        page: positions missing from a cached page (items without a playable
+        URL are skipped while parsing) are left out. Stops at the first
+        position whose page is not cached.
+        """
+        snapshot = self._snapshots.get(object_id)
+        if snapshot is None:
+            return []
+        items: list[dict[str, Any]] = []
+        for position in range(max(0, start), max(0, start) + count):
+            page = snapshot.positions.get(position // self.page_size)
+            if page is None:
+                break
+            item = page.get(position)
+            if item is not None:
+                items.append(item)
+        return items
+
+    def store_page(
+        self,
+        object_id: str,
+        page_index: int,
+        items: list[dict[str, Any]],
+        update_id: Any,
+        total: int | None,
+        now: float | None = None,
+    ) -> bool:
+        """Store a freshly browsed page and revalidate the snapshot.
+
+        Args:
+            object_id: Queue object ID.
+            page_index: Page number (0-based).
+            items: Parsed items of the page.
+            update_id: UpdateID reported with the page.
+            total: TotalMatches reported with the page.
+            now: Current monotonic time (defaults to time.monotonic()).
+
+        Returns:
+            True if other cached pages were dropped because the queue changed.
+        """
+        if now is None:
+            now = time.monotonic()
+        self.page_fetches += 1
+        snapshot = self._snapshots.get(object_id)
+        changed = snapshot is not None and (snapshot.update_id != update_id or snapshot.total != total)
+        if snapshot is None or changed:
+            snapshot = _QueueSnapshot(update_id=update_id, total=total, validated_at=now)
+            self._snapshots[object_id] = snapshot
+        snapshot.validated_at = now
+        snapshot.pages[page_index] = items
+        snapshot.positions[page_index] = {item["position"]: item for item in items if "position" in item}
+        return changed
+
+    def invalidate(self, object_id: str | None = None) -> None:
+        """Drop cached pages of one queue (or all queues)."""
+        if object_id is None:
+            dropped = bool(self._snapshots)
+            self._snapshots.clear()
+        else:
+            dropped = self._snapshots.pop(object_id, None) is not None
+        if dropped:
+            self.invalidations += 1
@@ -81,6 +81,11 @@ class StateManager:
         # Polling strategy for periodic fetching decisions
         self._polling_strategy: PollingStrategy | None = None
 
+        # Batch configuration-tier fetches into one aligned pass (opt-in)
+        # When enabled, tiers due soon are pulled forward whenever any tier is due,
+        # so the device sees fewer, larger bursts instead of a constant trickle.
+        self.batch_periodic_fetches: bool = False
+
     def apply_diff(self, changes: dict[str, Any]) -> bool:
         """Apply state changes from UPnP events.
 
@@ -290,10 +295,10 @@ class StateManager:
             # This avoids blocking refresh() for 5+ seconds during UPnP init.
             # UPnP will be available for metadata/events once creation completes.
             # If it fails, we retry after UPNP_RETRY_COOLDOWN seconds.
-            now = time.time()
+            now = time.monotonic()
             if not self.player._upnp_client:
                 time_since_last_attempt = now - self.player._last_upnp_attempt
-                if time_since_last_attempt >= UPNP_RETRY_COOLDOWN:
+                if not self.player._last_upnp_attempt or time_since_last_attempt >= UPNP_RETRY_COOLDOWN:
                     asyncio.create_task(self.player._ensure_upnp_client())
 
             # Core refresh - behavior depends on role (from previous cycle)
@@ -380,8 +385,7 @@ class StateManager:
                 and self.player.upnp_is_healthy is not False
             ):
                 try:
-                    volume_from_upnp = await self.player._upnp_client.get_volume()
-                    mute_from_upnp = await self.player._upnp_client.get_mute()
+                    volume_from_upnp, mute_from_upnp = await self._read_upnp_volume_mute()
                     if volume_from_upnp is not None:
                         status.volume = volume_from_upnp
                     if mute_from_upnp is not None:
@@ -409,8 +413,7 @@ class StateManager:
             and self.player.upnp_is_healthy is not False
         ):
             try:
-                upnp_volume = await self.player._upnp_client.get_volume()
-                upnp_mute = await self.player._upnp_client.get_mute()
+                upnp_volume, upnp_mute = await self._read_upnp_volume_mute()
                 _LOGGER.debug(
                     "Got volume from UPnP for %s: volume=%s, mute=%s",
                     self.player.client.host,
@@ -467,6 +470,9 @@ class StateManager:
             # but we should keep the optimistic source that was set by set_source()
             status.source = self.player._status_model.source
 
+        # Preservation windows are measured on the monotonic clock (read once per pass)
+        now = time.monotonic()
+
         # Preserve optimistic source if it was recently set
         # Device status endpoint may return stale source data after a switch
         source_preservation_window = 5.0  # seconds to preserve optimistic source
@@ -475,7 +481,7 @@ class StateManager:
             and self.player._status_model
             and self.player._status_model.source
             and self.player._last_source_set_time > 0
-            and (time.time() - self.player._last_source_set_time) < source_preservation_window
+            and (now - self.player._last_source_set_time) < source_preservation_window
         ):
             # Recently set source via set_source() - preserve the optimistic value
             status.source = self.player._status_model.source
@@ -490,7 +496,7 @@ class StateManager:
             and self.player._status_model
             and self.player._status_model.eq_preset
             and self.player._last_eq_preset_set_time > 0
-            and (time.time() - self.player._last_eq_preset_set_time) < eq_preservation_window
+            and (now - self.player._last_eq_preset_set_time) < eq_preservation_window
         ):
             # Recently set EQ preset via set_eq_preset() - preserve the optimistic value
             status.eq_preset = self.player._status_model.eq_preset
@@ -503,7 +509,7 @@ class StateManager:
             and self.player._status_model
             and self.player._status_model.loop_mode is not None
             and self.player._last_loop_mode_set_time > 0
-            and (time.time() - self.player._last_loop_mode_set_time) < loop_mode_preservation_window
+            and (now - self.player._last_loop_mode_set_time) < loop_mode_preservation_window
         ):
             # Recently set loop_mode via set_shuffle()/set_repeat() - preserve the optimistic value
             status.loop_mode = self.player._status_model.loop_mode
@@ -519,7 +525,7 @@ class StateManager:
             and self.player._status_model
             and self.player._status_model.source
             and self.player._last_source_set_time > 0
-            and (time.time() - self.player._last_source_set_time) < source_preservation_window
+            and (now - self.player._last_source_set_time) < source_preservation_window
         ):
             # Update synchronizer with preserved optimistic source
             optimistic_updates["source"] = self.player._status_model.source
@@ -529,7 +535,7 @@ class StateManager:
             and self.player._status_model
             and self.player._status_model.eq_preset
             and self.player._last_eq_preset_set_time > 0
-            and (time.time() - self.player._last_eq_preset_set_time) < eq_preservation_window
+            and (now - self.player._last_eq_preset_set_time) < eq_preservation_window
         ):
             # Update synchronizer with preserved optimistic EQ preset
             optimistic_updates["eq_preset"] = self.player._status_model.eq_preset
@@ -547,6 +553,39 @@ class StateManager:
 
         return status
 
+    async def _read_upnp_volume_mute(self) -> tuple[int | None, bool | None]:
+        """Get volume/mute via UPnP RenderingControl, preferring recent events.
+
+        RenderingControl LastChange events carry Volume and Mute whenever they
+        change. Values delivered by an event within the freshness window are
+        used as-is; only the remaining fields are read, with GetVolume and
+        GetMute issued concurrently when both are needed.
+
+        Returns:
+            Tuple of (volume, muted).
+
+        Raises:
+            UpnpError: If a GetVolume/GetMute action fails.
+        """
+        upnp_client = self.player._upnp_client
+        if upnp_client is None:
+            return None, None
+
+        fresh = self.player._state_synchronizer.fresh_upnp_values(("volume", "muted"))
+        volume: int | None = fresh.get("volume")
+        muted: bool | None = fresh.get("muted")
+
+        if volume is None and muted is None:
+            # Issue both SOAP requests together: one round trip of latency instead of two
+            volume, muted = await asyncio.gather(upnp_client.get_volume(), upnp_client.get_mute())
+        elif volume is None:
+            volume = await upnp_client.get_volume()
+        elif muted is None:
+            muted = await upnp_client.get_mute()
+        else:
+            _LOGGER.debug("Using event-fresh UPnP volume/mute for %s (skipping SOAP reads)", self.player.host)
+        return volume, muted
+
     async def _refresh_device_info(self) -> None:
         """Fetch device info and update profile."""
         device_info = await self.player.client.get_device_info_model()
@@ -600,7 +639,7 @@ class StateManager:
                 self.player._metadata = metadata if metadata else None
                 # Track last successful/attempted getMetaInfo fetch so periodic refresh
                 # doesn't immediately re-fetch in the same refresh cycle.
-                self.player._last_metadata_check = time.time()
+                self.player._last_metadata_check = time.monotonic()
 
                 # Apply title/artist/album from getMetaInfo when status values are "Unknown"
                 # This is critical for Bluetooth AVRCP sources where getPlayerStatusEx returns "Unknown"
@@ -649,7 +688,7 @@ class StateManager:
                     if update:
                         _LOGGER.debug("Applied metadata from getMetaInfo: %s", update)
                         # Update state synchronizer
-                        self.player._state_synchronizer.update_from_http(update, timestamp=time.time())
+                        self.player._state_synchronizer.update_from_http(update)
             except Exception as err:
                 _LOGGER.debug("Failed to fetch metadata for %s: %s", self.player.host, err)
                 self.player._metadata = None
@@ -672,7 +711,7 @@ class StateManager:
             full: Whether this is a full refresh.
             status: Current player status.
         """
-        now = time.time()
+        now = time.monotonic()
 
         # Build merged state for track change detection
         merged_for_track = self.player._state_synchronizer.get_merged_state()
@@ -682,6 +721,9 @@ class StateManager:
         current_source = status.source if status else None
         source_changed = self._last_source is not None and current_source != self._last_source
 
+        is_playing = bool(status and status.play_state and status.play_state in PLAYING_STATES)
+        batched = self._select_batched_tiers(is_playing, now)
+
         # getMetaInfo (Audio Quality Metadata) - Fetch on startup, full refresh, track change,
         # or periodically while playing (every 60s).
         #
@@ -690,10 +732,10 @@ class StateManager:
         # - Track-change detection can miss first track (signature not yet established) and
         #   some radio sources where title/artist are stable.
         # - Periodic refresh while playing ensures integrations see these fields reliably.
-        is_playing = bool(status and status.play_state and status.play_state in PLAYING_STATES)
         should_fetch_metainfo = (
             full
             or self.player._metadata is None
+            or "metainfo" in batched
             or (
                 is_playing
                 and self._polling_strategy
@@ -719,6 +761,7 @@ class StateManager:
             full
             or self.player._audio_output_status is None
             or source_changed
+            or "audio_output" in batched
             or (
                 self._polling_strategy
                 and self._polling_strategy.should_fetch_audio_output(
@@ -749,6 +792,7 @@ class StateManager:
         should_fetch_eq_presets = (
             full
             or track_changed
+            or "eq_presets" in batched
             or (
                 self._polling_strategy
                 and self._polling_strategy.should_fetch_eq_info(
@@ -770,6 +814,7 @@ class StateManager:
         should_fetch_eq_status = (
             full
             or track_changed
+            or "eq_status" in batched
             or (
                 self._polling_strategy
                 and self._polling_strategy.should_fetch_eq_info(
@@ -793,6 +838,7 @@ class StateManager:
         should_fetch_presets = (
             full
             or track_changed
+            or "presets" in batched
             or (
                 self._polling_strategy
                 and self._polling_strategy.should_fetch_presets(
@@ -815,6 +861,7 @@ class StateManager:
         should_fetch_bt = (
             full
             or track_changed
+            or "bt_history" in batched
             or (
                 self._polling_strategy
                 and self._polling_strategy.should_fetch_configuration(self.player._last_bt_history_check, now=now)
@@ -833,10 +880,14 @@ class StateManager:
         # Only available on WiiM Ultra with firmware 5.2+
         # Subwoofer settings are "set and forget" config, so infrequent polling is fine
         subwoofer_supported = self.player.client.capabilities.get("supports_subwoofer", None)
-        should_fetch_subwoofer = full or (
-            self._polling_strategy
-            and self._polling_strategy.should_fetch_subwoofer(
-                self.player._last_subwoofer_check, subwoofer_supported, now=now
+        should_fetch_subwoofer = (
+            full
+            or "subwoofer" in batched
+            or (
+                self._polling_strategy
+                and self._polling_strategy.should_fetch_subwoofer(
+                    self.player._last_subwoofer_check, subwoofer_supported, now=now
+                )
             )
         )
         # First time: probe to see if subwoofer is supported (subwoofer_supported is None)
@@ -858,6 +909,42 @@ class StateManager:
                 if subwoofer_supported is None:
                     self.player.client._capabilities["supports_subwoofer"] = False
 
+    def _select_batched_tiers(self, is_playing: bool, now: float) -> set[str]:
+        """Select configuration tiers to pull forward into this refresh pass.
+
+        Only active when batch_periodic_fetches is enabled. Unsupported tiers are
+        excluded so they never trigger a batch, and getMetaInfo only takes part
+        while playing (matching its own periodic rule).
+
+        Args:
+            is_playing: Whether the player is currently playing.
+            now: Timestamp of this refresh pass.
+
+        Returns:
+            Set of tier names to fetch now (empty when batching is disabled or nothing is due).
+        """
+        if not self.batch_periodic_fetches or self._polling_strategy is None:
+            return set()
+
+        capabilities = self.player.client.capabilities
+        tiers: dict[str, float | None] = {"bt_history": self.player._last_bt_history_check}
+        if is_playing:
+            tiers["metainfo"] = self.player._last_metadata_check
+        if capabilities.get("supports_audio_output", False):
+            tiers["audio_output"] = self.player._last_audio_output_check
+        if capabilities.get("supports_eq", False):
+            tiers["eq_presets"] = self.player._last_eq_presets_check
+            tiers["eq_status"] = self.player._last_eq_status_check
+        if capabilities.get("supports_presets", False):
+            tiers["presets"] = self.player._last_presets_check
+        if capabilities.get("supports_subwoofer", None):
+            tiers["subwoofer"] = self.player._last_subwoofer_check
+
+        batched = self._polling_strategy.select_batched_tiers(tiers, now=now)
+        if batched:
+            _LOGGER.debug("Batched configuration refresh for %s: %s", self.player.host, sorted(batched))
+        return batched
+
     async def _finalize_refresh(self) -> None:
         """Finalize refresh: sync group state, propagate metadata, notify callback."""
         # Synchronize group state from device state
@@ -901,3 +988,7 @@ class StateManager:
         """Get current playback state by querying device."""
         status = await self.get_status()
         return status.play_state or "stop"
+
+    def close(self) -> None:
+        """Release background resources (stream metadata fetch and live ICY reader)."""
+        self._stream_enricher.close()
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from .icy import subscribe_icy_metadata
 from .stream import StreamMetadata, get_stream_metadata
 
 if TYPE_CHECKING:
@@ -21,6 +22,11 @@ class StreamEnricher:
 
     Handles cases where the device plays a direct URL (Icecast, M3U, PLS)
     but returns the URL as the title instead of parsed metadata.
+
+    By default metadata is read once per stream URL. With live_metadata
+    enabled, Icecast/SHOUTcast streams are additionally followed by a shared
+    long-lived ICY reader (see icy.py), so title changes are applied as soon
+    as the station sends them.
     """
 
     def __init__(self, player: Player) -> None:
@@ -31,9 +37,11 @@ class StreamEnricher:
         """
         self.player = player
         self.enabled: bool = True
+        self.live_metadata: bool = False
         self._last_stream_url: str | None = None
         self._last_stream_metadata: StreamMetadata | None = None
         self._enrichment_task: asyncio.Task | None = None
+        self._live_unsubscribe: Callable[[], None] | None = None
 
     async def enrich_if_needed(self, status: PlayerStatus | None) -> None:
         """Enrich status with stream metadata if playing a raw stream.
@@ -42,6 +50,7 @@ class StreamEnricher:
             status: Current player status to check for stream URL.
         """
         if not self.enabled:
+            self.stop_live_metadata()
             return
 
         # Early return if status is None
@@ -51,22 +60,30 @@ class StreamEnricher:
         # Check if we are playing
         # Note: "stop" is normalized to "pause" by PlayerStatus, so check for both
         if not status.play_state or status.play_state in ("stop", "pause", "idle"):
+            self.stop_live_metadata()
             return
 
         # Check if source is suitable for enrichment (wifi/url playback)
         # 'wifi' (10, 20, 3) or 'unknown' are candidates.
         if status.source not in ("wifi", "unknown", None):
+            self.stop_live_metadata()
             return
 
         # Check if we have a URL in title
         url = status.title
         if not url or not str(url).startswith(("http://", "https://")):
+            # The device reports real metadata again: stale ICY titles must not overwrite it
+            self._last_stream_url = None
+            self._last_stream_metadata = None
+            self.stop_live_metadata()
             return
 
         # Avoid re-fetching same URL repeatedly if we have cached metadata
         if url == self._last_stream_url and self._last_stream_metadata:
             # Re-apply cached metadata
             self._apply_stream_metadata(self._last_stream_metadata)
+            if self.live_metadata and self._live_unsubscribe is None:
+                self._start_live_metadata(url)
             return
 
         # If URL changed, start new fetch
@@ -77,6 +94,7 @@ class StreamEnricher:
             # Cancel existing task
             if self._enrichment_task and not self._enrichment_task.done():
                 self._enrichment_task.cancel()
+            self.stop_live_metadata()
 
             # Start new task
             try:
@@ -85,6 +103,43 @@ class StreamEnricher:
             except RuntimeError:
                 # No event loop available (sync context) - will fetch on next poll
                 _LOGGER.debug("No event loop available, stream metadata will be fetched on next poll")
+                return
+            if self.live_metadata:
+                self._start_live_metadata(url)
+
+    def _start_live_metadata(self, url: str) -> None:
+        """Follow title changes of an Icecast/SHOUTcast stream.
+
+        HLS streams carry no ICY metadata and are left to the one-shot fetch.
+
+        Args:
+            url: Stream URL.
+        """
+        lower_url = url.lower()
+        if lower_url.endswith(".m3u8") or "/hls/" in lower_url:
+            return
+        self._live_unsubscribe = subscribe_icy_metadata(url, self._on_live_metadata)
+
+    def stop_live_metadata(self) -> None:
+        """Release the live ICY reader of the current stream (if any)."""
+        if self._live_unsubscribe is not None:
+            self._live_unsubscribe()
+            self._live_unsubscribe = None
+
+    def close(self) -> None:
+        """Cancel a running metadata fetch and release the live ICY reader."""
+        if self._enrichment_task and not self._enrichment_task.done():
+            self._enrichment_task.cancel()
+        self._enrichment_task = None
+        self._last_stream_url = None
+        self._last_stream_metadata = None
+        self.stop_live_metadata()
+
+    def _on_live_metadata(self, metadata: StreamMetadata) -> None:
+        """Apply a title change pushed by the live ICY reader."""
+        self._last_stream_metadata = metadata
+        self._apply_stream_metadata(metadata)
+        self._notify_state_changed()
 
     async def _fetch_and_apply_stream_metadata(self, url: str) -> None:
         """Fetch metadata from stream and apply it to state.
@@ -100,21 +155,24 @@ class StreamEnricher:
 
             metadata = await get_stream_metadata(url, session)
 
-            if metadata:
+            # The live reader may already have delivered a newer title
+            if metadata and not (self._live_unsubscribe is not None and self._last_stream_metadata):
                 self._last_stream_metadata = metadata
                 self._apply_stream_metadata(metadata)
-
-                # Notify change
-                if self.player._on_state_changed:
-                    try:
-                        self.player._on_state_changed()
-                    except Exception as err:
-                        _LOGGER.debug("Error in callback after stream enrichment: %s", err)
+                self._notify_state_changed()
         except asyncio.CancelledError:
             pass
         except Exception as err:
             _LOGGER.debug("Error enriching stream metadata for %s: %s", url, err)
 
+    def _notify_state_changed(self) -> None:
+        """Notify the player's state callback after enrichment."""
+        if self.player._on_state_changed:
+            try:
+                self.player._on_state_changed()
+            except Exception as err:
+                _LOGGER.debug("Error in callback after stream enrichment: %s", err)
+
     def _apply_stream_metadata(self, metadata: StreamMetadata) -> None:
         """Apply enriched metadata to state.
 
@@ -137,7 +195,7 @@ class StreamEnricher:
             _LOGGER.debug("Applying stream metadata enrichment: %s", update)
 
             # Update synchronizer (as if from HTTP)
-            self.player._state_synchronizer.update_from_http(update, timestamp=time.time())
+            self.player._state_synchronizer.update_from_http(update)
 
             # Update cached status model immediately for UI responsiveness
             if self.player._status_model:
@@ -0,0 +1,171 @@
+"""Resolution of radio URLs to the actual stream.
+
+Follows HTTP redirects and M3U/PLS playlists (favourites are often playlist
+links) and caches the final URL per input URL, shared by all players, so
+switching back to a station does not repeat the redirect chain.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Final
+
+import aiohttp
+
+from .stream import USER_AGENT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Resolved playlist/redirect URLs (see _ResolvedUrlCache)
+STREAM_URL_CACHE_TTL: Final = 3600.0  # Seconds a resolved stream URL is reused
+STREAM_URL_NEGATIVE_TTL: Final = 300.0  # Seconds a failed resolution is remembered
+STREAM_URL_CACHE_SIZE: Final = 256
+
+
+class _ResolvedUrlCache:
+    """Playlist/redirect URL -> final stream URL, shared by all players.
+
+    Successful resolutions are kept for STREAM_URL_CACHE_TTL; failed ones
+    (network errors, playlists without a stream entry) for the shorter
+    STREAM_URL_NEGATIVE_TTL, so a broken favourite is not re-fetched on every
+    enrichment attempt but recovers soon.
+    """
+
+    def __init__(self, max_entries: int = STREAM_URL_CACHE_SIZE) -> None:
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[str, float]] = {}  # url -> (final URL, expires at)
+
+    def get(self, url: str, now: float) -> str | None:
+        """Cached final URL (None on a miss or if expired)."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if now >= entry[1]:
+            del self._entries[url]
+            return None
+        return entry[0]
+
+    def put(self, url: str, final_url: str, resolved: bool, now: float) -> None:
+        """Store a resolution result."""
+        if len(self._entries) >= self.max_entries and url not in self._entries:
+            for key in [key for key, (_, expires) in self._entries.items() if now >= expires]:
+                del self._entries[key]
+            if len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]  # Oldest insertion
+        ttl = STREAM_URL_CACHE_TTL if resolved else STREAM_URL_NEGATIVE_TTL
+        self._entries[url] = (final_url, now + ttl)
+
+    def clear(self) -> None:
+        """Forget all resolutions."""
+        self._entries.clear()
+
+
+_RESOLVED_URL_CACHE = _ResolvedUrlCache()
+
+
+async def _resolve_stream_url(url: str, session: aiohttp.ClientSession) -> str:
+    """Resolve redirects and parse playlists to find the actual stream URL.
+
+    Results are cached per URL (see _ResolvedUrlCache), so switching back to a
+    station does not repeat redirect chains and playlist downloads.
+    """
+    now = time.monotonic()
+    cached = _RESOLVED_URL_CACHE.get(url, now)
+    if cached is not None:
+        return cached
+
+    final_url, resolved = await _follow_stream_url(url, session)
+    _RESOLVED_URL_CACHE.put(url, final_url, resolved, now)
+    return final_url
+
+
+async def _follow_stream_url(url: str, session: aiohttp.ClientSession) -> tuple[str, bool]:
+    """Follow redirects and playlists from url.
+
+    Returns:
+        (final_url, resolved) - resolved is False if a request failed or a
+        playlist had no stream entry (final_url is then the last URL reached).
+    """
+    current_url = url
+    visited = {url}
+
+    for _ in range(5):  # Max 5 hops/resolutions
+        try:
+            # Check for playlist extensions first
+            lower_url = current_url.lower()
+            if lower_url.endswith((".m3u", ".m3u8")):
+                new_url = await _parse_m3u(current_url, session)
+            elif lower_url.endswith(".pls"):
+                new_url = await _parse_pls(current_url, session)
+            else:
+                # Check for HTTP redirects via HEAD request
+                async with session.head(
+                    current_url,
+                    allow_redirects=False,
+                    headers={"User-Agent": USER_AGENT},
+                    timeout=aiohttp.ClientTimeout(total=5),
+                ) as response:
+                    if response.status in (301, 302, 303, 307, 308) and "Location" in response.headers:
+                        new_url = response.headers["Location"]
+                    else:
+                        # It's a direct link (hopefully)
+                        return current_url, True
+
+            if not new_url:
+                return current_url, False
+            if new_url in visited:
+                return current_url, True
+
+            visited.add(new_url)
+            current_url = new_url
+
+        except (aiohttp.ClientError, TimeoutError):
+            return current_url, False
+
+    return current_url, True
+
+
+async def _parse_m3u(url: str, session: aiohttp.ClientSession) -> str | None:
+    """Parse M3U playlist (non-HLS).
+
+    For HLS playlists (.m3u8), use _fetch_hls_metadata() instead.
+    """
+    try:
+        # Skip HLS playlists - they need special handling
+        if url.lower().endswith(".m3u8"):
+            return None
+
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status != 200:
+                return None
+            content = await response.text()
+
+            for line in content.splitlines():
+                line = line.strip()
+                if line and not line.startswith("#") and line.startswith(("http://", "https://")):
+                    return line
+    except Exception:
+        pass
+    return None
+
+
+async def _parse_pls(url: str, session: aiohttp.ClientSession) -> str | None:
+    """Parse PLS playlist."""
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status != 200:
+                return None
+            content = await response.text()
+
+            # Simple parsing for File1=http://...
+            for line in content.splitlines():
+                if line.lower().startswith("file") and "=" in line:
+                    parts = line.split("=", 1)
+                    if len(parts) == 2:
+                        val = parts[1].strip()
+                        if val.startswith(("http://", "https://")):
+                            return val
+    except Exception:
+        pass
+    return None
@@ -0,0 +1,185 @@
+"""Async state-change streams per player and across the fleet.
+
+Push-based alternative to polling Player properties in a loop. Each consumer
+gets its own bounded StateUpdateQueue fed by StateChangeNotifier. Pending
+changes are coalesced per player and per field (oldest ``old`` value, newest
+``new`` value), so a slow consumer never sees a backlog of intermediate states;
+when a fleet queue holds more players than ``maxsize`` the oldest pending
+player is dropped.
+
+Example:
+    ```python
+    async for changes in player.updates(exclude=["media_position"]):
+        print(changes)
+
+    async for update in fleet_updates():
+        print(update.player.host, update.changes)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .changes import STATE_DIFF_FIELDS, StateChangeNotifier, StateDiff
+
+if TYPE_CHECKING:
+    from .base import PlayerBase
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default bound for pending players in a fleet queue
+DEFAULT_FLEET_QUEUE_SIZE = 256
+
+
+@dataclass
+class PlayerUpdate:
+    """A coalesced set of field changes for one player."""
+
+    player: PlayerBase
+    changes: StateDiff
+
+
+class StateUpdateQueue:
+    """Bounded, per-field coalescing queue of player state changes."""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_FLEET_QUEUE_SIZE,
+        fields: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize update queue.
+
+        Args:
+            maxsize: Maximum number of players with pending changes. When exceeded,
+                the player whose changes have been pending longest is dropped.
+            fields: Fields to deliver (default: all STATE_DIFF_FIELDS).
+            exclude: Fields never to deliver.
+
+        Raises:
+            ValueError: If maxsize is not positive or an unknown field is given.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        watched = frozenset(fields) if fields is not None else frozenset(STATE_DIFF_FIELDS)
+        ignored = frozenset(exclude) if exclude is not None else frozenset()
+        unknown = (watched | ignored) - set(STATE_DIFF_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown state field(s): {', '.join(sorted(unknown))}")
+
+        self.maxsize = maxsize
+        self._watched = watched - ignored
+        self._pending: OrderedDict[PlayerBase, StateDiff] = OrderedDict()
+        self._event = asyncio.Event()
+        self.dropped = 0  # Players dropped because the queue was full
+
+    def __len__(self) -> int:
+        """Number of players with pending changes."""
+        return len(self._pending)
+
+    def put(self, player: PlayerBase, diff: StateDiff) -> None:
+        """Add changes for a player, coalescing with anything still pending.
+
+        Args:
+            player: Player the changes belong to.
+            diff: Field-level diff ``{field: (old, new)}``.
+        """
+        filtered = {k: v for k, v in diff.items() if k in self._watched}
+        if not filtered:
+            return
+
+        pending = self._pending.get(player)
+        if pending is None:
+            self._pending[player] = filtered
+            while len(self._pending) > self.maxsize:
+                dropped_player, _ = self._pending.popitem(last=False)
+                self.dropped += 1
+                _LOGGER.debug("State update queue full, dropped pending changes for %s", dropped_player.host)
+        else:
+            for field_name, (old, new) in filtered.items():
+                if field_name in pending:
+                    old = pending[field_name][0]
+                if old == new:
+                    # Field returned to its original value - nothing to report
+                    pending.pop(field_name, None)
+                else:
+                    pending[field_name] = (old, new)
+            if not pending:
+                del self._pending[player]
+                return
+
+        self._event.set()
+
+    async def get(self) -> PlayerUpdate:
+        """Wait for and return the oldest pending player update."""
+        while not self._pending:
+            self._event.clear()
+            await self._event.wait()
+        player, changes = self._pending.popitem(last=False)
+        if not self._pending:
+            self._event.clear()
+        return PlayerUpdate(player=player, changes=changes)
+
+
+async def player_updates(
+    player: PlayerBase,
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> AsyncIterator[StateDiff]:
+    """Stream coalesced state diffs for one player.
+
+    Args:
+        player: Player to watch.
+        fields: Fields to deliver (default: all STATE_DIFF_FIELDS).
+        exclude: Fields never to deliver.
+
+    Yields:
+        Field-level diffs ``{field: (old, new)}``.
+    """
+    queue = StateUpdateQueue(maxsize=1, fields=fields, exclude=exclude)
+    player._change_notifier.add_queue(queue)
+    try:
+        while True:
+            update = await queue.get()
+            yield update.changes
+    finally:
+        player._change_notifier.remove_queue(queue)
+
+
+async def fleet_updates(
+    maxsize: int = DEFAULT_FLEET_QUEUE_SIZE,
+    fields: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> AsyncIterator[PlayerUpdate]:
+    """Stream coalesced state changes from every Player in the process.
+
+    Uses the internal player registry, so players created after iteration starts
+    are included automatically; their first update reports all populated fields
+    with ``None`` as the old value.
+
+    Args:
+        maxsize: Maximum number of players with pending changes.
+        fields: Fields to deliver (default: all STATE_DIFF_FIELDS).
+        exclude: Fields never to deliver.
+
+    Yields:
+        PlayerUpdate events (player plus coalesced diff).
+    """
+    from .base import PlayerBase
+
+    queue = StateUpdateQueue(maxsize=maxsize, fields=fields, exclude=exclude)
+    # Baseline existing players so the first update reflects real changes
+    for player in list(PlayerBase._all_instances):
+        player._change_notifier.ensure_baseline()
+    StateChangeNotifier.add_fleet_queue(queue)
+    try:
+        while True:
+            yield await queue.get()
+    finally:
+        StateChangeNotifier.remove_fleet_queue(queue)
@@ -66,6 +66,10 @@ class PollingStrategy:
     CONFIGURATION_INTERVAL = 60.0  # Bluetooth, EQ, Device Info
     METADATA_CHECK_INTERVAL = 1.0  # Check for track changes
 
+    # Batched configuration fetching: tiers due within this fraction of their
+    # interval are pulled forward into the same pass (see select_batched_tiers)
+    CONFIGURATION_BATCH_WINDOW = 0.2
+
     # Legacy device intervals (longer for older devices)
     LEGACY_FAST_POLL_INTERVAL = 3.0  # Legacy devices during playback
     LEGACY_NORMAL_POLL_INTERVAL = 15.0  # Legacy devices when idle
@@ -78,7 +82,7 @@ class PollingStrategy:
             capabilities: Device capabilities dictionary from capability detection.
         """
         self.capabilities = capabilities
-        self._last_playing_time: float = 0.0  # Initialize to 0 (far in past) so startup uses normal polling
+        self._last_playing_time: float = 0.0  # 0 = never played, so startup uses normal polling
 
     def get_optimal_interval(
         self,
@@ -109,8 +113,9 @@ class PollingStrategy:
             Recommended polling interval in seconds
         """
         # Update last playing time
+        now = time.monotonic()
         if is_playing:
-            self._last_playing_time = time.time()
+            self._last_playing_time = now
 
         if self.capabilities.get("is_legacy_device", False):
             # Legacy devices need longer intervals
@@ -131,8 +136,8 @@ class PollingStrategy:
                 return self.FAST_POLL_INTERVAL  # 1 second
 
             # Not playing: Check "Active Idle" window
-            time_since_playing = time.time() - self._last_playing_time
-            if time_since_playing < 30:  # 30 seconds
+            time_since_playing = now - self._last_playing_time
+            if self._last_playing_time and time_since_playing < 30:  # 30 seconds
                 # Active Idle: Recently paused, stay fast to catch resumed playback quickly
                 return self.FAST_POLL_INTERVAL  # 1 second
 
@@ -153,7 +158,7 @@ class PollingStrategy:
         Args:
             last_fetch_time: Timestamp of last configuration fetch
             force_refresh: Whether to force a refresh (e.g. user action)
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if configuration should be fetched
@@ -162,7 +167,7 @@ class PollingStrategy:
             return True
 
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check (None or 0 means never fetched)
         if last_fetch_time is None or last_fetch_time == 0:
@@ -211,7 +216,7 @@ class PollingStrategy:
             last_fetch_time: Timestamp of last audio output fetch
             source_changed: Whether the input source has changed
             audio_output_supported: Whether device supports audio output endpoint
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if audio output status should be fetched
@@ -223,7 +228,7 @@ class PollingStrategy:
             return True
 
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check
         if last_fetch_time == 0:
@@ -248,7 +253,7 @@ class PollingStrategy:
         Args:
             last_fetch_time: Timestamp of last EQ info fetch
             eq_supported: Whether device supports EQ endpoint
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if EQ info should be fetched
@@ -257,7 +262,7 @@ class PollingStrategy:
             return False  # Endpoint not supported
 
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check (None or 0 means never fetched)
         if last_fetch_time is None or last_fetch_time == 0:
@@ -282,7 +287,7 @@ class PollingStrategy:
         Args:
             last_fetch_time: Timestamp of last presets fetch
             presets_supported: Whether device supports presets endpoint
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if presets should be fetched
@@ -291,7 +296,7 @@ class PollingStrategy:
             return False  # Endpoint not supported
 
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check (None or 0 means never fetched)
         if last_fetch_time is None or last_fetch_time == 0:
@@ -316,7 +321,7 @@ class PollingStrategy:
         Args:
             last_fetch_time: Timestamp of last subwoofer status fetch
             subwoofer_supported: Whether device supports subwoofer endpoint
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if subwoofer status should be fetched
@@ -325,7 +330,7 @@ class PollingStrategy:
             return False  # Endpoint not supported
 
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check (None or 0 means never fetched)
         if last_fetch_time is None or last_fetch_time == 0:
@@ -347,13 +352,13 @@ class PollingStrategy:
 
         Args:
             last_fetch_time: Timestamp of last device info fetch
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if device info should be fetched
         """
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check (None or 0 means never fetched)
         if last_fetch_time is None or last_fetch_time == 0:
@@ -375,13 +380,13 @@ class PollingStrategy:
 
         Args:
             last_fetch_time: Timestamp of last multiroom fetch
-            now: Current time (defaults to time.time())
+            now: Current monotonic time (defaults to time.monotonic())
 
         Returns:
             True if multiroom info should be fetched
         """
         if now is None:
-            now = time.time()
+            now = time.monotonic()
 
         # Always fetch on first check
         if last_fetch_time == 0:
@@ -391,6 +396,56 @@ class PollingStrategy:
         MULTIROOM_INTERVAL = 15.0
         return (now - last_fetch_time) >= MULTIROOM_INTERVAL
 
+    def select_batched_tiers(
+        self,
+        last_fetch_times: dict[str, float | None],
+        now: float | None = None,
+        window: float | None = None,
+    ) -> set[str]:
+        """Select configuration tiers to fetch together in one batched pass.
+
+        Each configuration tier (EQ, presets, Bluetooth history, ...) has its own
+        last-fetch timestamp, so their 60s timers drift apart and a device ends up
+        receiving one or two slow requests in most poll cycles. Batching aligns them:
+        as soon as any tier is due, every tier that would become due within the next
+        ``window`` fraction of its interval is pulled forward into the same pass.
+
+        Fetch logic:
+        1. If no tier is due, nothing is selected
+        2. If at least one tier is due (or never fetched), select all tiers whose
+           age is at least ``(1 - window) * CONFIGURATION_INTERVAL``
+
+        Args:
+            last_fetch_times: Mapping of tier name to last fetch timestamp
+                (None or 0 means never fetched). Callers should only include
+                tiers the device supports.
+            now: Current monotonic time (defaults to time.monotonic())
+            window: Look-ahead fraction of the interval (defaults to
+                CONFIGURATION_BATCH_WINDOW)
+
+        Returns:
+            Set of tier names to fetch in this pass (empty if none are due)
+        """
+        if now is None:
+            now = time.monotonic()
+        if window is None:
+            window = self.CONFIGURATION_BATCH_WINDOW
+
+        due_threshold = self.CONFIGURATION_INTERVAL
+        batch_threshold = self.CONFIGURATION_INTERVAL * (1.0 - window)
+
+        ages: dict[str, float] = {}
+        for tier, last_fetch_time in last_fetch_times.items():
+            if last_fetch_time is None or last_fetch_time == 0:
+                ages[tier] = float("inf")
+            else:
+                ages[tier] = now - last_fetch_time
+
+        if not any(age >= due_threshold for age in ages.values()):
+            return set()
+
+        return {tier for tier, age in ages.items() if age >= batch_threshold}
+
 
 class TrackChangeDetector:
     """Detect track changes for metadata fetching.
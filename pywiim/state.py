@@ -21,6 +21,7 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
+from .history import DEFAULT_HISTORY_SIZE, StateHistory
 from .metadata import is_valid_image_url, is_valid_metadata_value
 
 if TYPE_CHECKING:
@@ -132,13 +133,13 @@ class TimestampedField:
 
     value: Any
     source: str  # "http" or "upnp"
-    timestamp: float
+    timestamp: float  # time.monotonic() of the update (not wall clock)
     confidence: float = 1.0  # 0.0-1.0, based on source reliability and freshness
 
     def is_fresh(self, field_name: str, now: float | None = None) -> bool:
         """Check if field is fresh based on freshness window."""
         if now is None:
-            now = time.time()
+            now = time.monotonic()
         freshness_window = FRESHNESS_WINDOWS.get(field_name, 10.0)
         age = now - self.timestamp
         return age < freshness_window
@@ -146,7 +147,7 @@ class TimestampedField:
     def age(self, now: float | None = None) -> float:
         """Get age of field in seconds."""
         if now is None:
-            now = time.time()
+            now = time.monotonic()
         return now - self.timestamp
 
 
@@ -172,7 +173,7 @@ class SynchronizedState:
     # Source
     source: TimestampedField | None = None
 
-    # Source health tracking
+    # Source health tracking (time.monotonic() of last update per source)
     http_last_update: float | None = None
     upnp_last_update: float | None = None
     http_available: bool = True
@@ -238,7 +239,7 @@ class StateSynchronizer:
         ```
     """
 
-    def __init__(self, profile: DeviceProfile | None = None):
+    def __init__(self, profile: DeviceProfile | None = None, history_size: int = DEFAULT_HISTORY_SIZE):
         """Initialize state synchronizer.
 
         Args:
@@ -246,12 +247,15 @@ class StateSynchronizer:
                 authoritative for each state field. When provided, the
                 synchronizer uses explicit source selection instead of
                 freshness-based conflict resolution.
+            history_size: Number of merged-state transitions kept in the
+                history ring buffer (0 disables history recording).
         """
         self._http_state: dict[str, TimestampedField] = {}
         self._upnp_state: dict[str, TimestampedField] = {}
         self._merged_state = SynchronizedState()
         self._last_merge_time: float = 0.0
         self._profile = profile
+        self._history: StateHistory | None = StateHistory(history_size) if history_size > 0 else None
 
     def set_profile(self, profile: DeviceProfile) -> None:
         """Set or update the device profile.
@@ -275,6 +279,11 @@ class StateSynchronizer:
         """Get the current device profile."""
         return self._profile
 
+    @property
+    def history(self) -> StateHistory | None:
+        """Ring buffer of merged-state transitions (None if disabled)."""
+        return self._history
+
     def _get_preferred_source(self, field_name: str) -> str:
         """Get the preferred source for a field from profile or global default.
 
@@ -315,12 +324,13 @@ class StateSynchronizer:
 
         Args:
             data: Dictionary with state fields from HTTP API
-            timestamp: Timestamp of the update (defaults to now)
+            timestamp: Monotonic timestamp of the update (defaults to now)
             source: Source identifier for the update. Defaults to "http" for normal
                 HTTP polling. Use "propagated" when state is propagated from master
                 to slave in a group.
         """
-        ts = timestamp or time.time()
+        now = time.monotonic()
+        ts = timestamp or now
 
         # Extract transport state
         if "play_state" in data:
@@ -389,7 +399,7 @@ class StateSynchronizer:
                     )
 
         self._merged_state.http_last_update = ts
-        self._merge_state()
+        self._merge_state(now)
 
     def update_from_upnp(
         self,
@@ -400,9 +410,10 @@ class StateSynchronizer:
 
         Args:
             data: Dictionary with state fields from UPnP event
-            timestamp: Timestamp of the update (defaults to now)
+            timestamp: Monotonic timestamp of the update (defaults to now)
         """
-        ts = timestamp or time.time()
+        now = time.monotonic()
+        ts = timestamp or now
 
         # Extract transport state
         if "play_state" in data:
@@ -468,11 +479,17 @@ class StateSynchronizer:
                     )
 
         self._merged_state.upnp_last_update = ts
-        self._merge_state()
+        self._merge_state(now)
 
-    def _merge_state(self) -> None:
-        """Merge HTTP and UPnP state using conflict resolution rules."""
-        now = time.time()
+    def _merge_state(self, now: float | None = None) -> None:
+        """Merge HTTP and UPnP state using conflict resolution rules.
+
+        Args:
+            now: Monotonic time of this update pass (read once by the caller and
+                shared by every field's freshness check).
+        """
+        if now is None:
+            now = time.monotonic()
 
         # Update source availability first (needed for conflict resolution)
         self._update_source_availability(now)
@@ -504,6 +521,10 @@ class StateSynchronizer:
 
         self._last_merge_time = now
 
+        # Record transition (no-op if play_state/volume/mute/source/track are unchanged)
+        if self._history is not None:
+            self._history.record(self._merged_state)
+
     def _resolve_conflict(
         self,
         http_field: TimestampedField | None,
@@ -953,6 +974,29 @@ class StateSynchronizer:
         """
         return self._merged_state
 
+    def fresh_upnp_values(self, field_names: tuple[str, ...], now: float | None = None) -> dict[str, Any]:
+        """Get values recently delivered by UPnP events.
+
+        Lets callers skip polling fields that events keep current (e.g. volume
+        and mute from RenderingControl LastChange events).
+
+        Args:
+            field_names: Fields to check.
+            now: Current monotonic time (defaults to time.monotonic()).
+
+        Returns:
+            Mapping of field name to value for fields whose UPnP value is
+            within its freshness window and not None.
+        """
+        if now is None:
+            now = time.monotonic()
+        fresh: dict[str, Any] = {}
+        for field_name in field_names:
+            field = self._upnp_state.get(field_name)
+            if field is not None and field.value is not None and field.is_fresh(field_name, now):
+                fresh[field_name] = field.value
+        return fresh
+
 
 class GroupStateSynchronizer:
     """Synchronize group state from multiple devices (master + slaves).
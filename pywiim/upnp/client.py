@@ -9,6 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import ssl
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import Any, cast
 
@@ -16,12 +17,32 @@ from aiohttp import ClientError, ClientSession, TCPConnector
 from async_upnp_client.aiohttp import AiohttpNotifyServer, AiohttpSessionRequester
 from async_upnp_client.client import UpnpDevice
 from async_upnp_client.client_factory import UpnpFactory
+from async_upnp_client.const import HttpRequest
 from async_upnp_client.exceptions import UpnpError, UpnpResponseError
 from async_upnp_client.profiles.dlna import DmrDevice
 from async_upnp_client.utils import async_get_local_ip
 
+from .description import DescriptionCacheRequester, UpnpDescriptionCache, description_cache_key
+from .notify import acquire_shared_notify_server, create_notify_session, release_shared_notify_server
+
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum SOAP actions in flight per device (the embedded HTTP server handles few connections)
+UPNP_MAX_CONCURRENT_ACTIONS = 4
+
+# Seconds an idle keep-alive connection to the device stays in the pool
+UPNP_KEEPALIVE_TIMEOUT = 30.0
+
+
+def _create_pooled_session(ssl_context: ssl.SSLContext | bool) -> ClientSession:
+    """Create a keep-alive session sized for UPnP actions to one device."""
+    connector = TCPConnector(
+        ssl=ssl_context,
+        limit_per_host=UPNP_MAX_CONCURRENT_ACTIONS,
+        keepalive_timeout=UPNP_KEEPALIVE_TIMEOUT,
+    )
+    return ClientSession(connector=connector)
+
 
 class UpnpClient:
     """UPnP client wrapper for WiiM devices using async-upnp-client.
@@ -35,6 +56,9 @@ class UpnpClient:
         host: str,
         description_url: str,
         session: Any,
+        description_cache: UpnpDescriptionCache | None = None,
+        cache_key: str | None = None,
+        max_concurrent_actions: int = UPNP_MAX_CONCURRENT_ACTIONS,
     ) -> None:
         """Initialize UPnP client.
 
@@ -42,6 +66,9 @@ class UpnpClient:
             host: Device hostname or IP
             description_url: URL to device description.xml
             session: aiohttp session for HTTP requests (reused when possible)
+            description_cache: Optional cache of description/SCPD documents
+            cache_key: Expected cache key (see description_cache_key()), if known
+            max_concurrent_actions: Maximum SOAP actions in flight to this device
         """
         self.host = host
         self.description_url = description_url
@@ -53,7 +80,12 @@ class UpnpClient:
         self._content_directory_service: Any | None = None
         self._play_queue_service: Any | None = None
         self._notify_server: AiohttpNotifyServer | None = None
+        self._notify_server_shared = False  # True when _notify_server is the process-wide shared server
         self._internal_session: ClientSession | None = None  # Session we created internally (only if needed)
+        self._description_cache = description_cache
+        self._cache_key = cache_key
+        self._revalidate_task: asyncio.Task[None] | None = None  # Background check of cached documents
+        self._action_semaphore = asyncio.Semaphore(max(1, max_concurrent_actions))  # Per-device action cap
 
     @classmethod
     async def create(
@@ -61,6 +93,9 @@ class UpnpClient:
         host: str,
         description_url: str,
         session: ClientSession | None = None,
+        description_cache: UpnpDescriptionCache | None = None,
+        cache_key: str | None = None,
+        max_concurrent_actions: int = UPNP_MAX_CONCURRENT_ACTIONS,
     ) -> UpnpClient:
         """Create and initialize UPnP client from description URL.
 
@@ -69,11 +104,18 @@ class UpnpClient:
             description_url: URL to device description.xml
             session: Optional aiohttp session (reused for HTTP operations,
                 new session created only for HTTPS with special SSL config)
+            description_cache: Optional cache of description/SCPD documents. On a
+                hit the device is built without network round trips and the
+                description is revalidated in the background.
+            cache_key: Expected cache key (UUID + firmware, see description_cache_key()).
+                None accepts any cached entry for the description URL.
+            max_concurrent_actions: Maximum SOAP actions in flight to this device
+                (see async_call_actions()).
 
         Returns:
             Initialized UpnpClient instance
         """
-        client = cls(host, description_url, session)
+        client = cls(host, description_url, session, description_cache, cache_key, max_concurrent_actions)
         await client._initialize()
         return client
 
@@ -90,8 +132,7 @@ class UpnpClient:
                 ssl_context.check_hostname = False
                 ssl_context.verify_mode = ssl.CERT_NONE
                 ssl_context.set_ciphers("ALL:@SECLEVEL=0")
-                connector = TCPConnector(ssl=ssl_context)
-                session = ClientSession(connector=connector)
+                session = _create_pooled_session(ssl_context)
                 self._internal_session = session  # Track for cleanup
             else:
                 # HTTP - can reuse passed session if available
@@ -102,16 +143,25 @@ class UpnpClient:
                 else:
                     _LOGGER.info("Using HTTP for UPnP description (no SSL needed)")
                     # No session provided or session is closed - create our own
-                    connector = TCPConnector(ssl=False)
-                    session = ClientSession(connector=connector)
+                    session = _create_pooled_session(False)
                     self._internal_session = session  # Track for cleanup
 
             # DLNA pattern: with_sleep=True adds retry logic, timeout ensures we don't hang
             requester = AiohttpSessionRequester(session, with_sleep=True, timeout=10)
 
+            # Serve description/SCPD documents from the cache when possible
+            cached_documents: dict[str, str] | None = None
+            if self._description_cache is not None:
+                await self._description_cache.async_load()
+                cached_documents = self._description_cache.lookup(self.description_url, self._cache_key)
+            cache_requester = DescriptionCacheRequester(requester, cached_documents)
+
             # Create UPnP device from description.xml using factory (DLNA/DMR pattern)
-            _LOGGER.info("Fetching UPnP device description from: %s", self.description_url)
-            factory = UpnpFactory(requester, non_strict=True)
+            if cached_documents:
+                _LOGGER.debug("Using cached UPnP device description for %s", self.host)
+            else:
+                _LOGGER.info("Fetching UPnP device description from: %s", self.description_url)
+            factory = UpnpFactory(cache_requester, non_strict=True)
 
             # Add explicit timeout wrapper (5 seconds for description.xml fetch)
             try:
@@ -133,6 +183,15 @@ class UpnpClient:
             # Get AVTransport service
             if self._device is None:
                 raise UpnpError("Device not initialized")
+
+            if self._description_cache is not None:
+                if cached_documents and cache_requester.network_fetches == 0:
+                    # Built entirely from cache - check the device still serves the same description
+                    self._revalidate_task = asyncio.create_task(
+                        self._revalidate_description(requester, cached_documents[self.description_url])
+                    )
+                else:
+                    await self._store_description(self._device.udn, cache_requester.all_documents)
             self._av_transport_service = self._device.service("urn:schemas-upnp-org:service:AVTransport:1")
 
             # Get RenderingControl service
@@ -210,36 +269,63 @@ class UpnpClient:
             )
             raise UpnpError(f"Failed to create UPnP device: {err}") from err
 
+    async def _store_description(self, udn: str, documents: dict[str, str]) -> None:
+        """Store the documents used to build the device in the description cache."""
+        if self._description_cache is None:
+            return
+        key = self._cache_key or description_cache_key(udn)
+        if key is None or self.description_url not in documents:
+            return
+        self._description_cache.put(self.description_url, key, documents)
+        await self._description_cache.async_save()
+
+    async def _revalidate_description(self, requester: Any, cached_description: str) -> None:
+        """Re-fetch description.xml and refresh the cache entry if the device changed it.
+
+        The running client keeps the device built from the cache; refreshed
+        documents are used from the next client creation on.
+        """
+        try:
+            response = await requester.async_http_request(HttpRequest("GET", self.description_url, {}, None))
+            if response.status_code != 200 or response.body is None:
+                return
+            if response.body == cached_description:
+                _LOGGER.debug("Cached UPnP description for %s is up to date", self.host)
+                return
+
+            _LOGGER.info("UPnP description for %s changed - refreshing cached documents", self.host)
+            recorder = DescriptionCacheRequester(requester)
+            device = await UpnpFactory(recorder, non_strict=True).async_create_device(self.description_url)
+            await self._store_description(device.udn, recorder.fetched)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Could not revalidate UPnP description for %s: %s", self.host, err)
+
     async def start_notify_server(
         self,
         callback_host: str | None = None,
         callback_port: int = 0,
+        shared: bool = False,
     ) -> AiohttpNotifyServer:
         """Start the NOTIFY server for receiving event notifications.
 
         Args:
             callback_host: Host IP for callback URL (auto-detect if None)
             callback_port: Port for callback (0 = ephemeral)
+            shared: Join the process-wide notify server for this callback address
+                instead of starting a dedicated one. NOTIFY requests are routed to
+                the right device by SID, so a fleet needs only one listening socket.
 
         Returns:
             Started AiohttpNotifyServer instance
         """
         # Try to reuse passed session for notify server (used for subscription requests)
         # Only create new session if we need special SSL config or no session provided
+        session: ClientSession | None = None
         if self.session is not None and not self.session.closed:
             _LOGGER.debug("Reusing passed aiohttp session for UPnP notify server")
             session = self.session
-        else:
-            # Create notify server (DLNA/DMR pattern) with SSL disabled for self-signed certs
-            # Use executor to avoid blocking event loop (Python 3.13 detects blocking calls)
-            ssl_context = await asyncio.to_thread(lambda: ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT))
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            ssl_context.set_ciphers("ALL:@SECLEVEL=0")
-
-            connector = TCPConnector(ssl=ssl_context)
-            session = ClientSession(connector=connector)
-        requester = AiohttpSessionRequester(session, with_sleep=True, timeout=10)
 
         # Get the correct local IP for callback URL
         if callback_host:
@@ -266,13 +352,23 @@ class UpnpClient:
 
         source_ip = event_ip if callback_port == 0 else callback_host or event_ip
 
-        self._notify_server = AiohttpNotifyServer(
-            requester=requester,
-            source=(source_ip, callback_port),
-            loop=None,  # Use default event loop
-        )
+        if shared:
+            # The shared server owns its session; a caller-provided one is only used unshared
+            self._notify_server = await acquire_shared_notify_server(self.host, (source_ip, callback_port))
+            self._notify_server_shared = True
+        else:
+            if session is None:
+                # Create notify server (DLNA/DMR pattern) with SSL disabled for self-signed certs
+                session = await create_notify_session()
+            requester = AiohttpSessionRequester(session, with_sleep=True, timeout=10)
 
-        await self._notify_server.async_start_server()
+            self._notify_server = AiohttpNotifyServer(
+                requester=requester,
+                source=(source_ip, callback_port),
+                loop=None,  # Use default event loop
+            )
+
+            await self._notify_server.async_start_server()
 
         # Get server info from the notify server instance
         server_host = getattr(self._notify_server, "host", "unknown")
@@ -350,22 +446,51 @@ class UpnpClient:
         return self._notify_server
 
     async def unwind_notify_server(self) -> None:
-        """Stop and clean up the NOTIFY server."""
+        """Stop and clean up the NOTIFY server.
+
+        A shared server is only stopped when its last client leaves; until then
+        only this client's subscriptions are removed from it.
+        """
         if self._notify_server:
             try:
-                await self._notify_server.async_stop_server()
+                if self._notify_server_shared:
+                    await self._unsubscribe_own_services()
+                    await release_shared_notify_server(self._notify_server, self.host)
+                else:
+                    await self._notify_server.async_stop_server()
             except Exception as err:  # noqa: BLE001
                 _LOGGER.debug("Error stopping notify server for %s: %s", self.host, err)
             finally:
                 self._notify_server = None
+                self._notify_server_shared = False
                 _LOGGER.debug("Notify server stopped for %s", self.host)
 
+    async def _unsubscribe_own_services(self) -> None:
+        """Remove this device's SIDs from the (shared) notify server's event handler."""
+        if self._notify_server is None:
+            return
+        event_handler = self._notify_server.event_handler
+        # DmrDevice subscribes every service (incl. ConnectionManager), not just the ones we keep
+        services = self._device.all_services if self._device is not None else []
+        for service in services:
+            sid = event_handler.sid_for_service(service)
+            if sid is None:
+                continue
+            try:
+                await event_handler.async_unsubscribe(sid)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Error unsubscribing SID %s for %s: %s", sid, self.host, err)
+
     async def close(self) -> None:
         """Close the UPnP client and clean up resources.
 
         Stops the notify server and closes the internal aiohttp session (only if we created it).
         Does not close externally-provided sessions.
         """
+        if self._revalidate_task is not None and not self._revalidate_task.done():
+            self._revalidate_task.cancel()
+        self._revalidate_task = None
+
         # Stop notify server first
         await self.unwind_notify_server()
 
@@ -682,10 +807,33 @@ class UpnpClient:
         if not action_obj:
             raise UpnpError(f"Action {action} not found in {service_name}")
 
-        result = await action_obj.async_call(**arguments or {})
+        async with self._action_semaphore:
+            result = await action_obj.async_call(**arguments or {})
 
         return cast(dict[str, Any], result)
 
+    async def async_call_actions(
+        self,
+        calls: Sequence[tuple[str, str, dict[str, Any] | None]],
+    ) -> list[dict[str, Any] | BaseException]:
+        """Call several independent UPnP actions concurrently.
+
+        Actions are issued together over the keep-alive connection pool, so a
+        batch no longer pays one device round trip per action. At most
+        max_concurrent_actions are in flight per device; the rest wait.
+
+        Args:
+            calls: (service_name, action, arguments) tuples, as for async_call_action()
+
+        Returns:
+            Results in call order. A failed action yields its exception instead
+            of a result, so one failure does not discard the others.
+        """
+        return await asyncio.gather(
+            *(self.async_call_action(service_name, action, arguments) for service_name, action, arguments in calls),
+            return_exceptions=True,
+        )
+
     async def get_media_info(self) -> dict[str, Any]:
         """Fetch current media info via GetMediaInfo UPnP action.
 
@@ -905,7 +1053,8 @@ class UpnpClient:
 
         This is a convenience method that fetches all available state in one call.
         Intended for diagnostics and debugging - NOT for regular state updates
-        (use HTTP polling + UPnP events for that).
+        (use HTTP polling + UPnP events for that). The six actions run
+        concurrently, limited by max_concurrent_actions.
 
         Returns:
             Dictionary with all available UPnP state:
@@ -923,47 +1072,24 @@ class UpnpClient:
         """
         result: dict[str, Any] = {"errors": {}}
 
-        # Fetch transport info (play state)
-        try:
-            result["transport"] = await self.get_transport_info()
-        except Exception as err:
-            result["transport"] = None
-            result["errors"]["transport"] = str(err)
-
-        # Fetch media info (what's playing)
-        try:
-            result["media"] = await self.get_media_info()
-        except Exception as err:
-            result["media"] = None
-            result["errors"]["media"] = str(err)
-
-        # Fetch position info
-        try:
-            result["position"] = await self.get_position_info()
-        except Exception as err:
-            result["position"] = None
-            result["errors"]["position"] = str(err)
-
-        # Fetch volume
-        try:
-            result["volume"] = await self.get_volume()
-        except Exception as err:
-            result["volume"] = None
-            result["errors"]["volume"] = str(err)
-
-        # Fetch mute state
-        try:
-            result["muted"] = await self.get_mute()
-        except Exception as err:
-            result["muted"] = None
-            result["errors"]["muted"] = str(err)
-
-        # Fetch available actions
-        try:
-            result["available_actions"] = await self.get_current_transport_actions()
-        except Exception as err:
-            result["available_actions"] = None
-            result["errors"]["available_actions"] = str(err)
+        # All fetches are independent - issue them concurrently (capped per device)
+        fetches = {
+            "transport": self.get_transport_info(),
+            "media": self.get_media_info(),
+            "position": self.get_position_info(),
+            "volume": self.get_volume(),
+            "muted": self.get_mute(),
+            "available_actions": self.get_current_transport_actions(),
+        }
+        values = await asyncio.gather(*fetches.values(), return_exceptions=True)
+        for key, value in zip(fetches, values, strict=True):
+            if isinstance(value, Exception):
+                result[key] = None
+                result["errors"][key] = str(value)
+            elif isinstance(value, BaseException):
+                raise value
+            else:
+                result[key] = value
 
         # Clean up errors dict if empty
         if not result["errors"]:
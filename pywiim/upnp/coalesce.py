@@ -0,0 +1,122 @@
+"""Micro-batching of UPnP events into coalesced state updates.
+
+Devices often send several NOTIFYs for one logical transition - e.g.
+TransportState TRANSITIONING then PLAYING, each with the same track metadata,
+or a RenderingControl burst while a volume slider moves. Without batching each
+NOTIFY runs a full synchronizer merge and fires the state-changed callbacks.
+EventCoalescer collects the parsed changes of all events arriving within a
+short window (20-50 ms) and hands them over as one merged update, where later
+values win per field. PlayStateDebouncer still applies on top for the
+play -> pause/stop transitions it smooths over longer periods.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = ["EventCoalescer"]
+
+# Flush callback: (merged changes, merged raw variables per service type)
+FlushCallback = Callable[[dict[str, Any], dict[str, dict[str, Any]]], None]
+
+
+class EventCoalescer:
+    """Merge consecutive UPnP event changes within a time window."""
+
+    def __init__(self, window: float, flush_callback: FlushCallback) -> None:
+        """Initialize event coalescer.
+
+        Args:
+            window: Seconds to wait after the first event of a batch before flushing.
+            flush_callback: Called with the merged changes and raw variables when a batch flushes.
+
+        Raises:
+            ValueError: If window is not positive.
+        """
+        if window <= 0:
+            raise ValueError("window must be greater than 0")
+        self.window = window
+        self._flush_callback = flush_callback
+        self._changes: dict[str, Any] = {}
+        self._variables: dict[str, dict[str, Any]] = {}
+        self._pending_events = 0
+        self._handle: asyncio.TimerHandle | None = None
+
+        # Counters (see statistics)
+        self.events = 0
+        self.batches = 0
+
+    @property
+    def pending(self) -> bool:
+        """True if events are waiting to be flushed."""
+        return self._pending_events > 0
+
+    def pending_value(self, field: str, default: Any = None) -> Any:
+        """Value of a field in the not-yet-flushed batch (default if absent)."""
+        return self._changes.get(field, default)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Coalescing counters for diagnostics."""
+        return {
+            "window": self.window,
+            "events": self.events,
+            "batches": self.batches,
+            "coalesced": self.events - self.batches - self._pending_events,
+        }
+
+    def add(self, changes: dict[str, Any], variables: dict[str, Any], service_type: str) -> None:
+        """Add one event's parsed changes to the current batch.
+
+        Starts the window timer with the first event of a batch. Without a
+        running event loop the batch is flushed immediately.
+
+        Args:
+            changes: State changes parsed from the event.
+            variables: Raw state variables of the event.
+            service_type: Service that sent the event (e.g. "AVTransport").
+        """
+        self.events += 1
+        self._pending_events += 1
+        self._changes.update(changes)
+        self._variables.setdefault(service_type, {}).update(variables)
+
+        if self._handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        self._handle = loop.call_later(self.window, self.flush)
+
+    def flush(self) -> None:
+        """Deliver the current batch now (no-op if nothing is pending)."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._pending_events:
+            return
+
+        changes, variables = self._changes, self._variables
+        count = self._pending_events
+        self._changes, self._variables, self._pending_events = {}, {}, 0
+        self.batches += 1
+        if count > 1:
+            _LOGGER.debug("Coalesced %d UPnP events into one update: %s", count, list(changes))
+        try:
+            self._flush_callback(changes, variables)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Error applying coalesced UPnP events: %s", err)
+
+    def cancel(self) -> None:
+        """Drop the current batch without delivering it."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._changes, self._variables, self._pending_events = {}, {}, 0
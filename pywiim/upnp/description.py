@@ -0,0 +1,252 @@
+"""Persistent cache of UPnP device description and SCPD documents.
+
+Building a UpnpDevice fetches description.xml plus one SCPD document per
+service (AVTransport, RenderingControl, ConnectionManager, ContentDirectory,
+PlayQueue, ...) - several sequential round trips that make UPnP init take
+seconds per device. These documents only change with firmware, so
+UpnpDescriptionCache stores them keyed by device UUID + firmware version and
+lets UpnpClient build the device from the cache without touching the network.
+The client then revalidates description.xml in the background and refreshes
+the entry (for the next creation) when the device reports something different.
+
+The cache is in-memory by default; pass a path to persist it as JSON across
+restarts:
+
+Example:
+    ```python
+    from pywiim.upnp.description import UpnpDescriptionCache, set_description_cache
+
+    set_description_cache(UpnpDescriptionCache("/config/.storage/pywiim_upnp.json"))
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from async_upnp_client.client import UpnpRequester
+from async_upnp_client.const import HttpRequest, HttpResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "DescriptionCacheRequester",
+    "UpnpDescriptionCache",
+    "description_cache_key",
+    "get_description_cache",
+    "set_description_cache",
+]
+
+# Bump when the on-disk format changes (older files are ignored)
+CACHE_FORMAT_VERSION = 1
+
+
+def description_cache_key(uuid: str | None, firmware: str | None = None) -> str | None:
+    """Build a cache key from a device UUID and firmware version.
+
+    UUIDs are normalized so the HTTP API form (``FF31F09E1A5E...``) and the UPnP
+    UDN form (``uuid:ff31f09e-1a5e-...``) produce the same key.
+
+    Args:
+        uuid: Device UUID or UPnP UDN.
+        firmware: Firmware version (None if not known yet).
+
+    Returns:
+        Cache key, or None if uuid is empty.
+    """
+    if not uuid:
+        return None
+    normalized = uuid.lower().removeprefix("uuid:").replace("-", "")
+    return f"{normalized}/{firmware or 'unknown'}"
+
+
+@dataclass
+class _Entry:
+    """Documents fetched for one device description URL."""
+
+    key: str
+    documents: dict[str, str]
+    stored_at: float
+
+
+class UpnpDescriptionCache:
+    """Description/SCPD documents keyed by UUID + firmware, optionally persisted to disk."""
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Initialize description cache.
+
+        Args:
+            path: Optional JSON file to persist the cache to. None keeps it in memory only.
+        """
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[str, _Entry] = {}  # description URL -> entry
+        self._loaded = self.path is None
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached devices."""
+        return len(self._entries)
+
+    def lookup(self, description_url: str, key: str | None = None) -> dict[str, str] | None:
+        """Get cached documents for a description URL.
+
+        Args:
+            description_url: URL of the device's description.xml.
+            key: Expected cache key (see description_cache_key()). When given, an
+                entry stored under a different UUID or firmware is treated as a miss.
+                When None (UUID/firmware not known yet), any entry for the URL is used
+                and background revalidation catches changes.
+
+        Returns:
+            Mapping of document URL to XML text, or None on a miss.
+        """
+        entry = self._entries.get(description_url)
+        if entry is None or description_url not in entry.documents or (key is not None and entry.key != key):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(entry.documents)
+
+    def put(self, description_url: str, key: str, documents: dict[str, str]) -> None:
+        """Store the documents fetched for a device (replacing any previous entry)."""
+        self._entries[description_url] = _Entry(key=key, documents=dict(documents), stored_at=time.time())
+
+    def invalidate(self, description_url: str) -> None:
+        """Forget the documents for a description URL."""
+        self._entries.pop(description_url, None)
+
+    def clear(self) -> None:
+        """Forget all documents and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the cache file once (no-op for in-memory caches or if already loaded)."""
+        if self._loaded or self.path is None:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            try:
+                data = await asyncio.to_thread(self._read_file, self.path)
+            except (OSError, ValueError) as err:
+                _LOGGER.debug("Could not load UPnP description cache %s: %s", self.path, err)
+                data = None
+            if data is not None:
+                for url, raw in data.items():
+                    if url not in self._entries:
+                        self._entries[url] = _Entry(raw["key"], raw["documents"], raw.get("stored_at", 0.0))
+                _LOGGER.debug("Loaded %d cached UPnP descriptions from %s", len(data), self.path)
+            self._loaded = True
+
+    async def async_save(self) -> None:
+        """Write the cache file atomically (no-op for in-memory caches).
+
+        Errors are logged and swallowed - the cache is an optimization only.
+        """
+        if self.path is None:
+            return
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "entries": {
+                url: {"key": entry.key, "documents": entry.documents, "stored_at": entry.stored_at}
+                for url, entry in self._entries.items()
+            },
+        }
+        async with self._lock:
+            try:
+                await asyncio.to_thread(self._write_file, self.path, payload)
+            except OSError as err:
+                _LOGGER.debug("Could not save UPnP description cache %s: %s", self.path, err)
+
+    @staticmethod
+    def _read_file(path: Path) -> dict[str, Any] | None:
+        """Read and validate the cache file (runs in executor)."""
+        if not path.exists():
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return None
+        return {
+            url: raw
+            for url, raw in entries.items()
+            if isinstance(raw, dict) and isinstance(raw.get("key"), str) and isinstance(raw.get("documents"), dict)
+        }
+
+    @staticmethod
+    def _write_file(path: Path, payload: dict[str, Any]) -> None:
+        """Write the cache file via a temporary file and rename (runs in executor)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+class DescriptionCacheRequester(UpnpRequester):
+    """UpnpRequester that serves GETs for cached documents and records fetched ones.
+
+    Wraps the real requester: cached document URLs are answered locally, every
+    other request is forwarded. Successful GET responses are recorded in
+    ``fetched`` so a freshly built device can be stored in the cache.
+    """
+
+    def __init__(self, requester: UpnpRequester, documents: dict[str, str] | None = None) -> None:
+        """Initialize caching requester.
+
+        Args:
+            requester: Requester used for everything not served from the cache.
+            documents: Cached document URL -> XML text.
+        """
+        self._requester = requester
+        self.documents = documents or {}
+        self.fetched: dict[str, str] = {}
+        self.network_fetches = 0
+
+    async def async_http_request(self, http_request: HttpRequest) -> HttpResponse:
+        """Serve a cached document or forward the request."""
+        if http_request.method == "GET":
+            body = self.documents.get(http_request.url)
+            if body is not None:
+                return HttpResponse(200, {}, body)
+            self.network_fetches += 1
+
+        response = await self._requester.async_http_request(http_request)
+        if http_request.method == "GET" and response.status_code == 200 and response.body is not None:
+            self.fetched[http_request.url] = response.body
+        return response
+
+    @property
+    def all_documents(self) -> dict[str, str]:
+        """Cached and newly fetched documents."""
+        return {**self.documents, **self.fetched}
+
+
+_DEFAULT_CACHE: UpnpDescriptionCache | None = UpnpDescriptionCache()
+
+
+def get_description_cache() -> UpnpDescriptionCache | None:
+    """Return the process-wide description cache used by Player (None if disabled)."""
+    return _DEFAULT_CACHE
+
+
+def set_description_cache(cache: UpnpDescriptionCache | None) -> None:
+    """Replace the process-wide description cache.
+
+    Args:
+        cache: Cache to use (e.g. a disk-backed one), or None to disable caching.
+    """
+    global _DEFAULT_CACHE
+    _DEFAULT_CACHE = cache
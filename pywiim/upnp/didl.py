@@ -0,0 +1,87 @@
+"""LRU cache for parsed DIDL-Lite metadata.
+
+Devices resend identical ``CurrentTrackMetaData`` / ``AVTransportURIMetaData``
+blobs on every transport event (play/pause, position, volume in some firmware),
+and queue browsing returns the same pages repeatedly. DidlCache keys parse
+results by a digest of the raw DIDL string so each distinct blob is unescaped
+and parsed once. Cached values are shared between callers and must be treated
+as read-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+__all__ = ["DidlCache", "DEFAULT_DIDL_CACHE_SIZE"]
+
+# Distinct DIDL blobs kept per cache
+DEFAULT_DIDL_CACHE_SIZE = 64
+
+_T = TypeVar("_T")
+
+
+class DidlCache:
+    """Small LRU of DIDL-Lite parse results keyed by content digest."""
+
+    def __init__(self, maxsize: int = DEFAULT_DIDL_CACHE_SIZE) -> None:
+        """Initialize DIDL cache.
+
+        Args:
+            maxsize: Maximum number of distinct DIDL blobs kept.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than 0")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Number of cached parse results."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(didl_xml: str) -> bytes:
+        """Digest of the raw DIDL string (the raw blob itself is not retained)."""
+        return hashlib.blake2b(didl_xml.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def get_or_parse(self, didl_xml: str, parser: Callable[[str], _T]) -> _T:
+        """Return the cached result for a DIDL blob, parsing it on a miss.
+
+        Exceptions raised by the parser propagate and nothing is cached.
+
+        Args:
+            didl_xml: Raw DIDL-Lite string (as received, possibly HTML-encoded).
+            parser: Function producing the result from the raw string.
+
+        Returns:
+            Parse result (shared - do not mutate).
+        """
+        key = self.key(didl_xml)
+        try:
+            result: _T = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = parser(didl_xml)
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Discard all cached results and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
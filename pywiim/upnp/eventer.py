@@ -19,15 +19,22 @@ Reference implementation: dlna_dmr/media_player.py:388-391
 from __future__ import annotations
 
 import logging
+import re
 import time
 from collections.abc import Callable, Sequence
+from html import unescape as html_unescape
 from typing import Any
 from urllib.parse import urlparse
+from xml.etree import ElementTree as ET
+from xml.sax.saxutils import unescape as xml_unescape
 
 from async_upnp_client.client import UpnpService, UpnpStateVariable
 from async_upnp_client.exceptions import UpnpResponseError
 
 from .client import UpnpClient
+from .coalesce import EventCoalescer
+from .didl import DidlCache
+from .renewal import SubscriptionRenewalManager, get_renewal_manager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,6 +63,164 @@ def _is_valid_url(url: str | None) -> bool:
         return False
 
 
+# LastChange fast path: element tags and double-quoted attributes
+_LAST_CHANGE_ELEMENT_RE = re.compile(r"<([^\s/>!?]+)([^>]*)>")
+_LAST_CHANGE_ATTR_RE = re.compile(r'([^\s=]+)\s*=\s*"([^"]*)"')
+_LAST_CHANGE_CONTAINERS = frozenset({"Event", "InstanceID"})
+_XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}
+
+# LastChange variable: (name without namespace, attributes)
+LastChangeVariable = tuple[str, dict[str, str]]
+
+
+def _scan_last_change(last_change_xml: str) -> list[LastChangeVariable] | None:
+    """Extract LastChange variables without building an element tree.
+
+    Handles the common flat events (RenderingControl Volume/Mute, AVTransport
+    TransportState and positions) in which every variable is a self-closing
+    element with double-quoted attributes.
+
+    Args:
+        last_change_xml: Raw LastChange XML.
+
+    Returns:
+        List of (variable name, attributes), or None if the event carries
+        DIDL-Lite metadata, numeric character references, or is not in the
+        simple form (use the full parser).
+    """
+    if "MetaData" in last_change_xml or "&#" in last_change_xml:
+        return None
+
+    variables: list[LastChangeVariable] = []
+    has_instance = False
+    for match in _LAST_CHANGE_ELEMENT_RE.finditer(last_change_xml):
+        name = match.group(1).rpartition(":")[2]
+        attr_text = match.group(2)
+        if name in _LAST_CHANGE_CONTAINERS:
+            has_instance = has_instance or name == "InstanceID"
+            continue
+        if not attr_text.endswith("/"):
+            return None  # Element with content - not a simple variable
+        attr_text = attr_text[:-1]
+        if _LAST_CHANGE_ATTR_RE.sub("", attr_text).strip():
+            return None  # Unquoted/single-quoted attributes
+        attrs = {
+            key.rpartition(":")[2]: xml_unescape(value, _XML_ENTITIES) if "&" in value else value
+            for key, value in _LAST_CHANGE_ATTR_RE.findall(attr_text)
+        }
+        variables.append((name, attrs))
+
+    return variables if has_instance else None
+
+
+def _parse_last_change_tree(last_change_xml: str) -> list[LastChangeVariable]:
+    """Extract LastChange variables with a full ElementTree parse.
+
+    Args:
+        last_change_xml: Raw LastChange XML.
+
+    Returns:
+        List of (variable name, attributes) for all InstanceID children.
+
+    Raises:
+        ET.ParseError: If the XML is malformed.
+    """
+    root = ET.fromstring(last_change_xml)
+
+    # Parse Event XML structure
+    # Handle namespace: XML may have xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/"
+    # Try to find InstanceID elements, handling both namespaced and non-namespaced XML
+    instances = []
+    if root.tag.endswith("Event") or "Event" in root.tag:
+        # Root is the Event element - find InstanceID children
+        # Try with namespace wildcard first
+        instances = root.findall(".//{*}InstanceID")
+        if not instances:
+            # Try direct children
+            instances = [child for child in root if child.tag.endswith("InstanceID")]
+    else:
+        # Event is nested - find Event first, then InstanceID
+        events = root.findall(".//{*}Event")
+        if not events:
+            events = root.findall(".//Event")
+        for event in events:
+            instances.extend(event.findall(".//{*}InstanceID"))
+            if not instances:
+                instances.extend([child for child in event if child.tag.endswith("InstanceID")])
+
+    variables: list[LastChangeVariable] = []
+    for instance in instances:
+        for var in instance:
+            # Strip namespace from tag name (e.g., {urn:...}TransportState -> TransportState)
+            var_name = var.tag.split("}")[-1] if "}" in var.tag else var.tag
+            variables.append((var_name, dict(var.attrib)))
+    return variables
+
+
+# Parsed CurrentTrackMetaData/AVTransportURIMetaData, shared by all eventers
+_DIDL_METADATA_CACHE = DidlCache()
+
+# DIDL-Lite namespaces (both standard and LinkPlay-specific)
+_DIDL_NAMESPACES = {
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "upnp": "urn:schemas-upnp-org:metadata-1-0/upnp/",
+    "song": "www.linkplay.com/song/",
+    "": "urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/",
+}
+
+
+def _extract_didl_metadata(didl_xml: str) -> dict[str, str | None] | None:
+    """Extract title/artist/album/image_url from a DIDL-Lite blob.
+
+    Independent of playback state so the result can be cached; callers decide
+    whether empty fields clear existing metadata.
+
+    Args:
+        didl_xml: DIDL-Lite XML string (may be HTML-encoded)
+
+    Returns:
+        None if there is no item element. Otherwise a dict containing each field
+        whose element is present: its value, or None if empty/invalid.
+
+    Raises:
+        ET.ParseError: If the XML is malformed.
+    """
+    # Unescape HTML entities (e.g., &lt; becomes <)
+    root = ET.fromstring(html_unescape(didl_xml))
+
+    # Find item element (may be in root or nested)
+    item = root.find(".//item", _DIDL_NAMESPACES)
+    if item is None:
+        # Try without namespace
+        item = root.find(".//item")
+    if item is None:
+        return None
+
+    fields: dict[str, str | None] = {}
+    for field_name, prefixed, qualified in (
+        ("title", "dc:title", ".//{http://purl.org/dc/elements/1.1/}title"),
+        ("artist", "upnp:artist", ".//{urn:schemas-upnp-org:metadata-1-0/upnp/}artist"),
+        ("album", "upnp:album", ".//{urn:schemas-upnp-org:metadata-1-0/upnp/}album"),
+        ("image_url", "upnp:albumArtURI", ".//{urn:schemas-upnp-org:metadata-1-0/upnp/}albumArtURI"),
+    ):
+        elem = item.find(prefixed, _DIDL_NAMESPACES)
+        if elem is None:
+            elem = item.find(qualified)
+        if elem is None:
+            continue
+        text = elem.text.strip() if elem.text else ""
+        fields[field_name] = text or None
+
+    # Validate album art URL: must be valid http/https and not placeholder values
+    image_url = fields.get("image_url")
+    if image_url and (image_url == "un_known" or not _is_valid_url(image_url)):
+        if image_url != "un_known":
+            _LOGGER.debug("Invalid image URL in DIDL-Lite (not a valid URL): %s", image_url[:100])
+        fields["image_url"] = None
+
+    return fields
+
+
 class UpnpEventer:
     """Manage UPnP event subscriptions and process LastChange notifications.
 
@@ -71,6 +236,7 @@ class UpnpEventer:
         state_manager: Any,  # State manager with apply_diff() method and play_state property
         device_uuid: str,
         state_updated_callback: Callable[[dict[str, Any], str], None] | Callable[[], None] | None = None,
+        coalesce_window: float = 0.0,
     ) -> None:
         """Initialize UPnP eventer.
 
@@ -79,6 +245,8 @@ class UpnpEventer:
             state_manager: State manager with apply_diff() method and play_state property
             device_uuid: Device UUID for identification
             state_updated_callback: Optional callback function called when state is updated
+            coalesce_window: Seconds to batch consecutive events into one state update
+                (e.g. 0.02-0.05). 0 (default) applies every event immediately.
         """
         self.upnp_client = upnp_client
         self.state_manager = state_manager
@@ -95,21 +263,37 @@ class UpnpEventer:
         # This is used for resubscription failure detection, not general health checking
         self.check_available: bool = False
 
+        # Central renewal scheduler (set when started with central_renewal=True)
+        self._renewal_manager: SubscriptionRenewalManager | None = None
+
+        # Optional micro-batching of events (one apply_diff/callback per window)
+        self._coalescer: EventCoalescer | None = None
+        if coalesce_window > 0:
+            self._coalescer = EventCoalescer(coalesce_window, self._apply_event_changes)
+
     async def start(
         self,
         callback_host: str | None = None,
         callback_port: int = 0,
+        shared_notify_server: bool = False,
+        central_renewal: bool = False,
     ) -> None:
         """Start event subscriptions (reference: dlna_dmr/media_player.py:388-391).
 
         Args:
             callback_host: Host IP for callback URL (auto-detect if None)
             callback_port: Port for callback (0 = ephemeral)
+            shared_notify_server: Use the process-wide notify server shared by all
+                devices with the same callback address (one socket for the fleet)
+            central_renewal: Renew subscriptions from the process-wide
+                SubscriptionRenewalManager (batched, jittered, retried with backoff)
+                instead of a per-device DmrDevice resubscribe loop
         """
         # Start notify server first (required before subscriptions)
         await self.upnp_client.start_notify_server(
             callback_host=callback_host,
             callback_port=callback_port,
+            shared=shared_notify_server,
         )
 
         # Reference pattern: dlna_dmr/media_player.py:388-391
@@ -147,7 +331,13 @@ class UpnpEventer:
             if self.upnp_client._dmr_device is None:
                 raise RuntimeError("DmrDevice not initialized")
             self.upnp_client._dmr_device.on_event = self._on_event
-            await self.upnp_client._dmr_device.async_subscribe_services(auto_resubscribe=True)
+            if central_renewal:
+                renew_in = await self.upnp_client._dmr_device.async_subscribe_services(auto_resubscribe=False)
+                self._renewal_manager = get_renewal_manager()
+                if renew_in is not None:
+                    self._renewal_manager.schedule(self, renew_in.total_seconds())
+            else:
+                await self.upnp_client._dmr_device.async_subscribe_services(auto_resubscribe=True)
 
             subscription_duration = time.time() - subscription_start_time
             _LOGGER.info(
@@ -177,8 +367,38 @@ class UpnpEventer:
             _LOGGER.warning("   → Application will fall back to HTTP polling")
             raise
 
+    async def async_renew_subscriptions(self) -> float | None:
+        """Renew subscriptions (called by SubscriptionRenewalManager).
+
+        If a previous renewal failed (e.g. the device rebooted and dropped its
+        SIDs), DmrDevice has no subscriptions left and this subscribes afresh.
+
+        Returns:
+            Seconds until the next renewal is due, or None if nothing is subscribed.
+
+        Raises:
+            UpnpError: If renewal/subscription fails (all subscriptions are dropped).
+        """
+        dmr_device = self.upnp_client._dmr_device
+        if dmr_device is None:
+            return None
+        renew_in = await dmr_device.async_subscribe_services(auto_resubscribe=False)
+        return renew_in.total_seconds() if renew_in is not None else None
+
+    def on_renewal_failed(self, err: Exception) -> None:
+        """Flag the device for an availability check after a failed renewal."""
+        _LOGGER.warning("UPnP subscription renewal failed for %s: %s - retrying", self.upnp_client.host, err)
+        self.check_available = True
+
     async def async_unsubscribe(self) -> None:
         """Unsubscribe from all services and stop notify server (reference pattern)."""
+        if self._renewal_manager is not None:
+            self._renewal_manager.cancel(self)
+            self._renewal_manager = None
+
+        if self._coalescer is not None:
+            self._coalescer.flush()
+
         if self.upnp_client._dmr_device:
             try:
                 self.upnp_client._dmr_device.on_event = None
@@ -369,6 +589,9 @@ class UpnpEventer:
             # Check current playback state before processing metadata
             # Only clear metadata if device is truly stopped/idle, not during transitions
             current_play_state = getattr(self.state_manager, "play_state", None)
+            if self._coalescer is not None:
+                # A play_state still waiting in the batch is newer than the applied one
+                current_play_state = self._coalescer.pending_value("play_state", current_play_state)
             is_playing_or_transitioning = current_play_state and any(
                 state in str(current_play_state).lower()
                 for state in ["play", "playing", "transitioning", "load", "loading", "buffering"]
@@ -397,6 +620,18 @@ class UpnpEventer:
             if "TrackSource" in variables_dict:
                 changes["source"] = variables_dict["TrackSource"]
 
+        if self._coalescer is not None:
+            self._coalescer.add(changes, variables_dict, service_type)
+            return
+
+        self._apply_event_changes(changes, {service_type: variables_dict})
+
+    def _apply_event_changes(self, changes: dict[str, Any], variables_by_service: dict[str, dict[str, Any]]) -> None:
+        """Apply parsed changes to state and notify the callback.
+
+        Called per event, or once per batch when coalescing (with the merged
+        changes and the merged raw variables of each service in the batch).
+        """
         # Apply diff to state (same as original)
         if changes:
             self.state_manager.apply_diff(changes)
@@ -410,7 +645,8 @@ class UpnpEventer:
 
                 sig = inspect.signature(self.state_updated_callback)
                 if len(sig.parameters) > 0:
-                    self.state_updated_callback(variables_dict, service_type)  # type: ignore[call-arg]
+                    for service_type, variables_dict in variables_by_service.items():
+                        self.state_updated_callback(variables_dict, service_type)  # type: ignore[call-arg]
                 else:
                     self.state_updated_callback()  # type: ignore[call-arg]
             except Exception as err:  # noqa: BLE001
@@ -421,130 +657,93 @@ class UpnpEventer:
         service_type: str,
         last_change_xml: str,
     ) -> dict[str, Any]:
-        """Parse LastChange XML into state changes."""
-        changes = {}
+        """Parse LastChange XML into state changes.
+
+        Simple events (Volume/Mute, TransportState, positions) are read with a
+        precompiled attribute scanner; the full ElementTree parse is only used
+        for metadata-bearing or unusually formatted events.
+        """
+        changes: dict[str, Any] = {}
 
         try:
-            from xml.etree import ElementTree as ET
-
-            root = ET.fromstring(last_change_xml)
-
-            # Parse Event XML structure
-            # Handle namespace: XML may have xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/"
-            # Try to find InstanceID elements, handling both namespaced and non-namespaced XML
-            instances = []
-            if root.tag.endswith("Event") or "Event" in root.tag:
-                # Root is the Event element - find InstanceID children
-                # Try with namespace wildcard first
-                instances = root.findall(".//{*}InstanceID")
-                if not instances:
-                    # Try direct children
-                    instances = [child for child in root if child.tag.endswith("InstanceID")]
-            else:
-                # Event is nested - find Event first, then InstanceID
-                events = root.findall(".//{*}Event")
-                if not events:
-                    events = root.findall(".//Event")
-                for event in events:
-                    instances.extend(event.findall(".//{*}InstanceID"))
-                    if not instances:
-                        instances.extend([child for child in event if child.tag.endswith("InstanceID")])
-
-            for instance in instances:
-                _ = instance.get("val", "0")  # Instance ID not currently used
-
-                # Parse AVTransport service variables
-                if service_type == "AVTransport":
-                    for var in list(instance):
-                        # Strip namespace from tag name (e.g., {urn:...}TransportState -> TransportState)
-                        var_name = var.tag.split("}")[-1] if "}" in var.tag else var.tag
-                        var_value = var.get("val", "")
-
-                        if var_name == "TransportState":
-                            changes["play_state"] = var_value.lower().replace("_", " ")
-                        elif var_name == "AbsoluteTimePosition":
-                            # Position provided in UPnP events when track starts (in LastChange event)
-                            # Not sent continuously during playback - only on track changes
-                            changes["position"] = self._parse_time_position(var_value)  # type: ignore[assignment]
-                        elif var_name == "RelativeTimePosition":
-                            # Position provided in UPnP events when track starts (in LastChange event)
-                            # Not sent continuously during playback - only on track changes
-                            changes["position"] = self._parse_time_position(var_value)  # type: ignore[assignment]
-                        elif var_name == "CurrentTrackDuration":
-                            # Duration provided in UPnP events when track starts (in LastChange event)
-                            # Not sent continuously during playback - only on track changes
-                            changes["duration"] = self._parse_time_position(var_value)  # type: ignore[assignment]
-                        elif var_name == "CurrentTrackMetaData":
-                            # Parse DIDL-Lite metadata from LastChange XML
-                            # Check if device is playing/transitioning before clearing metadata
-                            current_play_state = changes.get("play_state") or getattr(
-                                self.state_manager, "play_state", None
-                            )
-                            is_playing_or_transitioning = current_play_state and any(
-                                state in str(current_play_state).lower()
-                                for state in ["play", "playing", "transitioning", "load", "loading", "buffering"]
-                            )
-                            metadata_changes = self._parse_didl_metadata(
-                                var_value, allow_clear=not is_playing_or_transitioning
-                            )
-                            changes.update(metadata_changes)
-                        elif var_name == "AVTransportURIMetaData":
-                            # Parse DIDL-Lite metadata from LastChange XML
-                            # Check if device is playing/transitioning before clearing metadata
-                            current_play_state = changes.get("play_state") or getattr(
-                                self.state_manager, "play_state", None
-                            )
-                            is_playing_or_transitioning = current_play_state and any(
-                                state in str(current_play_state).lower()
-                                for state in ["play", "playing", "transitioning", "load", "loading", "buffering"]
-                            )
-                            metadata_changes = self._parse_didl_metadata(
-                                var_value, allow_clear=not is_playing_or_transitioning
-                            )
-                            changes.update(metadata_changes)
-                        elif var_name == "TrackSource":
-                            changes["source"] = var_value
-                        elif var_name in ("AVTransportURI", "CurrentURI"):
-                            # Extract stream URL for potential ICY metadata extraction
-                            # Store in changes but don't expose as a property (internal use)
-                            changes["_stream_uri"] = var_value
-                            _LOGGER.debug("Extracted stream URI from UPnP: %s", var_value[:100] if var_value else None)
-
-                # Parse RenderingControl service variables
-                elif service_type == "RenderingControl":
-                    for var in list(instance):
-                        # Strip namespace from tag name (e.g., {urn:...}Volume -> Volume)
-                        var_name = var.tag.split("}")[-1] if "}" in var.tag else var.tag
-                        var_value = var.get("val", "")
-                        channel = var.get("channel", "")
-
-                        if var_name == "Volume":
-                            if channel == "Master" or not channel:
-                                try:
-                                    vol_int = int(var_value)
-                                    # Keep volume scale consistent with HTTP parser (0-100).
-                                    changes["volume"] = vol_int  # type: ignore[assignment]
-                                except (ValueError, TypeError):
-                                    pass
-                        elif var_name == "Mute":
-                            if channel == "Master" or not channel:
-                                changes["muted"] = var_value.lower() == "1"  # type: ignore[assignment]
-                        # Log any other RenderingControl variables we're not parsing
-                        # (might include audio output mode changes)
-                        else:
-                            _LOGGER.debug(
-                                "Unparsed RenderingControl variable: %s = %s",
-                                var_name,
-                                var_value,
-                            )
+            variables = _scan_last_change(last_change_xml)
+            if variables is None:
+                variables = _parse_last_change_tree(last_change_xml)
+
+            # Parse AVTransport service variables
+            if service_type == "AVTransport":
+                for var_name, attrs in variables:
+                    var_value = attrs.get("val", "")
+
+                    if var_name == "TransportState":
+                        changes["play_state"] = var_value.lower().replace("_", " ")
+                    elif var_name == "AbsoluteTimePosition":
+                        # Position provided in UPnP events when track starts (in LastChange event)
+                        # Not sent continuously during playback - only on track changes
+                        changes["position"] = self._parse_time_position(var_value)
+                    elif var_name == "RelativeTimePosition":
+                        # Position provided in UPnP events when track starts (in LastChange event)
+                        # Not sent continuously during playback - only on track changes
+                        changes["position"] = self._parse_time_position(var_value)
+                    elif var_name == "CurrentTrackDuration":
+                        # Duration provided in UPnP events when track starts (in LastChange event)
+                        # Not sent continuously during playback - only on track changes
+                        changes["duration"] = self._parse_time_position(var_value)
+                    elif var_name in ("CurrentTrackMetaData", "AVTransportURIMetaData"):
+                        # Parse DIDL-Lite metadata from LastChange XML
+                        # Check if device is playing/transitioning before clearing metadata
+                        current_play_state = changes.get("play_state") or getattr(
+                            self.state_manager, "play_state", None
+                        )
+                        is_playing_or_transitioning = current_play_state and any(
+                            state in str(current_play_state).lower()
+                            for state in ["play", "playing", "transitioning", "load", "loading", "buffering"]
+                        )
+                        metadata_changes = self._parse_didl_metadata(
+                            var_value, allow_clear=not is_playing_or_transitioning
+                        )
+                        changes.update(metadata_changes)
+                    elif var_name == "TrackSource":
+                        changes["source"] = var_value
+                    elif var_name in ("AVTransportURI", "CurrentURI"):
+                        # Extract stream URL for potential ICY metadata extraction
+                        # Store in changes but don't expose as a property (internal use)
+                        changes["_stream_uri"] = var_value
+                        _LOGGER.debug("Extracted stream URI from UPnP: %s", var_value[:100] if var_value else None)
+
+            # Parse RenderingControl service variables
+            elif service_type == "RenderingControl":
+                for var_name, attrs in variables:
+                    var_value = attrs.get("val", "")
+                    channel = attrs.get("channel", "")
+
+                    if var_name == "Volume":
+                        if channel == "Master" or not channel:
+                            try:
+                                # Keep volume scale consistent with HTTP parser (0-100).
+                                changes["volume"] = int(var_value)
+                            except (ValueError, TypeError):
+                                pass
+                    elif var_name == "Mute":
+                        if channel == "Master" or not channel:
+                            changes["muted"] = var_value.lower() == "1"
+                    # Log any other RenderingControl variables we're not parsing
+                    # (might include audio output mode changes)
+                    else:
+                        _LOGGER.debug(
+                            "Unparsed RenderingControl variable: %s = %s",
+                            var_name,
+                            var_value,
+                        )
 
-                # Log any other variables we encounter (for discovering audio output mode changes)
-                else:
+            # Log any other variables we encounter (for discovering audio output mode changes)
+            else:
+                for var_name, attrs in variables:
                     _LOGGER.debug(
                         "Unparsed variable in %s service: %s = %s",
                         service_type,
                         var_name,
-                        var_value,
+                        attrs.get("val", ""),
                     )
 
         except Exception as err:  # noqa: BLE001
@@ -580,6 +779,8 @@ class UpnpEventer:
 
         Extracts title, artist, album, and image_url from DIDL-Lite XML.
         Handles both standard UPnP namespaces and LinkPlay-specific namespaces.
+        Extraction results are cached by content digest, since devices resend
+        identical metadata on every transport event.
 
         Args:
             didl_xml: DIDL-Lite XML string (may be HTML-encoded)
@@ -594,30 +795,9 @@ class UpnpEventer:
             return changes
 
         try:
-            from html import unescape
-            from xml.etree import ElementTree as ET
-
-            # Unescape HTML entities (e.g., &lt; becomes <)
-            didl_xml = unescape(didl_xml)
-
-            # Parse XML
-            root = ET.fromstring(didl_xml)
-
-            # Define namespaces (both standard and LinkPlay-specific)
-            namespaces = {
-                "dc": "http://purl.org/dc/elements/1.1/",
-                "upnp": "urn:schemas-upnp-org:metadata-1-0/upnp/",
-                "song": "www.linkplay.com/song/",
-                "": "urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/",
-            }
-
-            # Find item element (may be in root or nested)
-            item = root.find(".//item", namespaces)
-            if item is None:
-                # Try without namespace
-                item = root.find(".//item")
-
-            if item is None:
+            fields = _DIDL_METADATA_CACHE.get_or_parse(didl_xml, _extract_didl_metadata)
+
+            if fields is None:
                 _LOGGER.debug(
                     "No item element found in DIDL-Lite XML - %s metadata",
                     "clearing" if allow_clear else "preserving (device playing/transitioning)",
@@ -630,53 +810,12 @@ class UpnpEventer:
                     changes["image_url"] = None
                 return changes
 
-            # Extract title (dc:title)
-            title_elem = item.find("dc:title", namespaces)
-            if title_elem is None:
-                title_elem = item.find(".//{http://purl.org/dc/elements/1.1/}title")
-            if title_elem is not None and title_elem.text and title_elem.text.strip():
-                changes["title"] = title_elem.text.strip()
-            elif title_elem is not None and allow_clear:
-                # Element exists but is empty - clear it only if allowed
-                changes["title"] = None
-
-            # Extract artist (upnp:artist)
-            artist_elem = item.find("upnp:artist", namespaces)
-            if artist_elem is None:
-                artist_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}artist")
-            if artist_elem is not None and artist_elem.text and artist_elem.text.strip():
-                changes["artist"] = artist_elem.text.strip()
-            elif artist_elem is not None and allow_clear:
-                # Element exists but is empty - clear it only if allowed
-                changes["artist"] = None
-
-            # Extract album (upnp:album)
-            album_elem = item.find("upnp:album", namespaces)
-            if album_elem is None:
-                album_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}album")
-            if album_elem is not None and album_elem.text and album_elem.text.strip():
-                changes["album"] = album_elem.text.strip()
-            elif album_elem is not None and allow_clear:
-                # Element exists but is empty - clear it only if allowed
-                changes["album"] = None
-
-            # Extract album art URI (upnp:albumArtURI) with URL validation
-            art_elem = item.find("upnp:albumArtURI", namespaces)
-            if art_elem is None:
-                art_elem = item.find(".//{urn:schemas-upnp-org:metadata-1-0/upnp/}albumArtURI")
-            if art_elem is not None and art_elem.text:
-                image_url = art_elem.text.strip()
-                # Validate URL: must be valid http/https and not placeholder values
-                if image_url and image_url != "un_known" and _is_valid_url(image_url):
-                    changes["image_url"] = image_url
+            for field_name, value in fields.items():
+                if value is not None:
+                    changes[field_name] = value
                 elif allow_clear:
-                    # Invalid URL or placeholder - clear it only if allowed
-                    if image_url and image_url != "un_known":
-                        _LOGGER.debug("Invalid image URL in DIDL-Lite (not a valid URL): %s", image_url[:100])
-                    changes["image_url"] = None
-            elif art_elem is not None and allow_clear:
-                # Element exists but is empty - clear it only if allowed
-                changes["image_url"] = None
+                    # Element exists but is empty/invalid - clear it only if allowed
+                    changes[field_name] = None
 
             if any(v is not None for v in changes.values()):
                 _LOGGER.debug(
@@ -723,6 +862,7 @@ class UpnpEventer:
             - check_available: Whether availability check is needed
             - device_uuid: Device UUID
             - device_host: Device hostname/IP
+            - coalescing: Event batching counters (None if coalescing is disabled)
         """
         now = time.time()
         return {
@@ -732,4 +872,5 @@ class UpnpEventer:
             "check_available": self.check_available,
             "device_uuid": self.device_uuid,
             "device_host": self.upnp_client.host,
+            "coalescing": self._coalescer.statistics if self._coalescer is not None else None,
         }
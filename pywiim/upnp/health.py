@@ -166,7 +166,7 @@ class UpnpHealthTracker:
             event_data: State data from UPnP event (dict with play_state, volume, etc)
         """
         self._last_upnp_state.update(self._extract_monitored_fields(event_data))
-        self._last_upnp_event_time = time.time()
+        self._last_upnp_event_time = time.monotonic()
 
         # If we were unhealthy and now receiving events, re-evaluate
         if not self._upnp_working:
@@ -258,7 +258,7 @@ class UpnpHealthTracker:
             return False
 
         # Check if UPnP event is recent (within grace period)
-        time_since_upnp = time.time() - self._last_upnp_event_time
+        time_since_upnp = time.monotonic() - self._last_upnp_event_time
         if time_since_upnp > self._grace_period:
             # UPnP event too old, couldn't have caught this change
             return False
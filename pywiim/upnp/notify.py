@@ -0,0 +1,138 @@
+"""Process-wide shared UPnP NOTIFY server.
+
+By default every UpnpClient starts its own AiohttpNotifyServer, so a fleet of
+speakers means one listening socket, one aiohttp app and one requester per
+device. async_upnp_client's UpnpEventHandler already routes incoming NOTIFY
+requests to the subscribed service by SID, so a single server can serve any
+number of devices. This module keeps one reference-counted server per event
+loop and callback address; clients opt in with
+``UpnpClient.start_notify_server(shared=True)``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+from dataclasses import dataclass, field
+
+from aiohttp import ClientSession, TCPConnector
+from async_upnp_client.aiohttp import AiohttpNotifyServer, AiohttpSessionRequester
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "acquire_shared_notify_server",
+    "create_notify_session",
+    "release_shared_notify_server",
+    "shared_notify_server_count",
+]
+
+# (event loop, callback IP, requested port) - port 0 shares whichever ephemeral port was bound
+_ServerKey = tuple[asyncio.AbstractEventLoop, str, int]
+
+
+@dataclass
+class _SharedServer:
+    """A started notify server and the clients referencing it."""
+
+    server: AiohttpNotifyServer
+    session: ClientSession
+    refcount: int = 0
+    hosts: set[str] = field(default_factory=set)
+
+
+_SERVERS: dict[_ServerKey, _SharedServer] = {}
+_LOCKS: dict[_ServerKey, asyncio.Lock] = {}
+
+
+async def create_notify_session() -> ClientSession:
+    """Create an aiohttp session for SUBSCRIBE requests with self-signed cert support.
+
+    Returns:
+        New ClientSession (caller is responsible for closing it).
+    """
+    # Use executor to avoid blocking event loop (Python 3.13 detects blocking calls)
+    ssl_context = await asyncio.to_thread(lambda: ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT))
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    ssl_context.set_ciphers("ALL:@SECLEVEL=0")
+    return ClientSession(connector=TCPConnector(ssl=ssl_context))
+
+
+async def acquire_shared_notify_server(host: str, source: tuple[str, int]) -> AiohttpNotifyServer:
+    """Get (starting if needed) the shared notify server for a callback address.
+
+    The server sends SUBSCRIBE/renewal requests for every device through a
+    session it owns, so one client closing its own session cannot break
+    subscriptions of the others. The session is closed with the server.
+
+    Args:
+        host: Device host acquiring the server (for logging/diagnostics).
+        source: (callback IP, port) to listen on; port 0 binds an ephemeral port
+            once and shares it with every later caller using port 0.
+
+    Returns:
+        Started AiohttpNotifyServer shared by all clients with the same source.
+    """
+    key: _ServerKey = (asyncio.get_running_loop(), source[0], source[1])
+    lock = _LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        shared = _SERVERS.get(key)
+        if shared is None:
+            session = await create_notify_session()
+            requester = AiohttpSessionRequester(session, with_sleep=True, timeout=10)
+            server = AiohttpNotifyServer(requester=requester, source=source, loop=None)
+            try:
+                await server.async_start_server()
+            except Exception:
+                await session.close()
+                raise
+            shared = _SharedServer(server=server, session=session)
+            _SERVERS[key] = shared
+            _LOGGER.info("Started shared UPnP notify server at %s", getattr(server, "callback_url", source))
+
+        shared.refcount += 1
+        shared.hosts.add(host)
+        _LOGGER.debug(
+            "%s joined shared UPnP notify server %s (%d clients)",
+            host,
+            getattr(shared.server, "callback_url", source),
+            shared.refcount,
+        )
+        return shared.server
+
+
+async def release_shared_notify_server(server: AiohttpNotifyServer, host: str) -> None:
+    """Drop one reference to a shared notify server, stopping it with the last one.
+
+    The caller must unsubscribe its own SIDs first; stopping the server
+    unsubscribes everything still registered on its event handler.
+
+    Args:
+        server: Server returned by acquire_shared_notify_server().
+        host: Device host releasing the server.
+    """
+    for key, shared in list(_SERVERS.items()):
+        if shared.server is not server:
+            continue
+        async with _LOCKS.setdefault(key, asyncio.Lock()):
+            shared.refcount -= 1
+            shared.hosts.discard(host)
+            if shared.refcount > 0:
+                return
+            _SERVERS.pop(key, None)
+            _LOCKS.pop(key, None)
+            try:
+                await server.async_stop_server()
+            finally:
+                if not shared.session.closed:
+                    await shared.session.close()
+            _LOGGER.info("Stopped shared UPnP notify server at %s", getattr(server, "callback_url", None))
+        return
+    _LOGGER.debug("Notify server released by %s is not a shared server", host)
+
+
+def shared_notify_server_count() -> int:
+    """Number of shared notify servers currently running."""
+    return len(_SERVERS)
@@ -0,0 +1,303 @@
+"""Central timer-wheel scheduler for UPnP subscription renewals.
+
+With ``auto_resubscribe=True`` every DmrDevice runs its own resubscribe loop,
+so hundreds of subscriptions created together renew together every
+``timeout - tolerance`` seconds. SubscriptionRenewalManager replaces those loops
+with one task per event loop: renewals are bucketed into fixed-width wheel
+slots, pulled forward by a random jitter so they spread out over time, renewed
+per slot as one bounded-concurrency batch, and retried with exponential backoff
+on failure. A failed renewal (e.g. the device rebooted and no longer knows the
+SID) drops the device's subscriptions, so the first retry subscribes afresh.
+
+Example:
+    ```python
+    await eventer.start(central_renewal=True)
+    print(get_renewal_manager().statistics)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import random
+import time
+from typing import Any, Protocol
+
+_LOGGER = logging.getLogger(__name__)
+
+__all__ = [
+    "RenewalTarget",
+    "SubscriptionRenewalManager",
+    "get_renewal_manager",
+]
+
+# Width of one timer-wheel slot (renewals due within a slot are batched)
+DEFAULT_SLOT_SECONDS = 5.0
+
+# Renewals are pulled forward by up to this fraction of their delay
+DEFAULT_JITTER = 0.1
+
+# Maximum renewals in flight at once within a batch
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Retry backoff after a failed renewal: first retry is immediate (resubscribe),
+# then RETRY_BASE * 2^n seconds, capped at RETRY_MAX
+RETRY_BASE_SECONDS = 5.0
+RETRY_MAX_SECONDS = 300.0
+
+
+class RenewalTarget(Protocol):
+    """Object whose subscriptions the manager renews (e.g. UpnpEventer)."""
+
+    async def async_renew_subscriptions(self) -> float | None:
+        """Renew (or re-create) subscriptions.
+
+        Returns:
+            Seconds until the next renewal is due, or None if nothing is subscribed.
+        """
+
+    def on_renewal_failed(self, err: Exception) -> None:
+        """Called when a renewal attempt fails (before it is retried)."""
+
+
+class SubscriptionRenewalManager:
+    """Timer-wheel scheduler that batches, jitters and retries renewals."""
+
+    def __init__(
+        self,
+        slot_seconds: float = DEFAULT_SLOT_SECONDS,
+        jitter: float = DEFAULT_JITTER,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize renewal manager.
+
+        Args:
+            slot_seconds: Width of one wheel slot in seconds.
+            jitter: Fraction of each delay by which renewals may be pulled forward.
+            max_concurrency: Maximum concurrent renewals within one batch.
+
+        Raises:
+            ValueError: If slot_seconds or max_concurrency is not positive,
+                or jitter is outside [0, 1).
+        """
+        if slot_seconds <= 0:
+            raise ValueError("slot_seconds must be greater than 0")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be greater than 0")
+
+        self.slot_seconds = slot_seconds
+        self.jitter = jitter
+        self.max_concurrency = max_concurrency
+
+        self._wheel: dict[int, set[RenewalTarget]] = {}
+        self._slot_of: dict[RenewalTarget, int] = {}
+        self._failures: dict[RenewalTarget, int] = {}
+        # Targets that have not been cancelled (due targets leave the wheel while renewing)
+        self._active: set[RenewalTarget] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+        # Counters (see statistics)
+        self.renewals = 0
+        self.failures = 0
+        self.resubscribes = 0
+        self.batches = 0
+        self.largest_batch = 0
+
+    def __len__(self) -> int:
+        """Number of scheduled targets."""
+        return len(self._slot_of)
+
+    @property
+    def statistics(self) -> dict[str, Any]:
+        """Renewal counters for diagnostics."""
+        return {
+            "scheduled": len(self._slot_of),
+            "renewals": self.renewals,
+            "failures": self.failures,
+            "resubscribes": self.resubscribes,
+            "retrying": sum(1 for count in self._failures.values() if count),
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+        }
+
+    def schedule(self, target: RenewalTarget, delay: float, now: float | None = None) -> None:
+        """Schedule (or reschedule) a target's next renewal.
+
+        The renewal is pulled forward by a random jitter of up to ``jitter * delay``
+        and rounded down to its wheel slot, so it never runs later than ``delay``.
+
+        Args:
+            target: Target to renew.
+            delay: Seconds until the renewal is due.
+            now: Current monotonic time (defaults to time.monotonic()).
+        """
+        if now is None:
+            now = time.monotonic()
+        delay = max(0.0, delay)
+        due = now + delay - random.uniform(0.0, self.jitter * delay)
+        slot = max(math.floor(due / self.slot_seconds), math.floor(now / self.slot_seconds))
+
+        self._remove(target)
+        self._wheel.setdefault(slot, set()).add(target)
+        self._slot_of[target] = slot
+        self._active.add(target)
+
+        self._ensure_task()
+        self._wakeup.set()
+
+    def cancel(self, target: RenewalTarget) -> None:
+        """Stop renewing a target.
+
+        A renewal already in flight completes, but the target is not rescheduled.
+        """
+        self._active.discard(target)
+        self._remove(target)
+        self._failures.pop(target, None)
+
+    def _remove(self, target: RenewalTarget) -> None:
+        """Remove a target from its wheel slot."""
+        slot = self._slot_of.pop(target, None)
+        if slot is None:
+            return
+        bucket = self._wheel.get(slot)
+        if bucket is not None:
+            bucket.discard(target)
+            if not bucket:
+                del self._wheel[slot]
+
+    def _pop_due(self, now: float) -> list[RenewalTarget]:
+        """Remove and return all targets whose slot has started."""
+        current = math.floor(now / self.slot_seconds)
+        due: list[RenewalTarget] = []
+        for slot in sorted(s for s in self._wheel if s <= current):
+            for target in self._wheel.pop(slot):
+                self._slot_of.pop(target, None)
+                due.append(target)
+        return due
+
+    def _next_wakeup(self, now: float) -> float | None:
+        """Seconds until the earliest occupied slot starts (None if the wheel is empty)."""
+        if not self._wheel:
+            return None
+        return max(0.0, min(self._wheel) * self.slot_seconds - now)
+
+    def _retry_delay(self, failures: int) -> float:
+        """Backoff before the next attempt after ``failures`` consecutive failures."""
+        if failures <= 1:
+            return 0.0  # Immediate resubscribe (e.g. SID invalidated by device reboot)
+        return float(min(RETRY_BASE_SECONDS * 2 ** (failures - 2), RETRY_MAX_SECONDS))
+
+    async def _renew_one(self, target: RenewalTarget, semaphore: asyncio.Semaphore) -> None:
+        """Renew one target and reschedule it."""
+        async with semaphore:
+            try:
+                delay = await target.async_renew_subscriptions()
+            except asyncio.CancelledError:
+                raise
+            except Exception as err:  # noqa: BLE001
+                if target not in self._active:
+                    return  # Cancelled while renewing (e.g. unsubscribed)
+                failures = self._failures.get(target, 0) + 1
+                self._failures[target] = failures
+                self.failures += 1
+                retry = self._retry_delay(failures)
+                _LOGGER.debug("Subscription renewal failed (attempt %d), retrying in %.0fs: %s", failures, retry, err)
+                try:
+                    target.on_renewal_failed(err)
+                except Exception as cb_err:  # noqa: BLE001
+                    _LOGGER.debug("Error in renewal failure callback: %s", cb_err)
+                self._schedule_retry(target, retry)
+                return
+
+        self.renewals += 1
+        if target not in self._active:
+            return  # Cancelled while renewing - do not put it back on the wheel
+        if self._failures.pop(target, 0):
+            self.resubscribes += 1
+        if delay is not None:
+            self.schedule(target, delay)
+        else:
+            self._active.discard(target)
+
+    def _schedule_retry(self, target: RenewalTarget, delay: float) -> None:
+        """Schedule a retry exactly (no jitter) so backoff is honoured."""
+        now = time.monotonic()
+        slot = math.floor((now + delay) / self.slot_seconds)
+        self._remove(target)
+        self._wheel.setdefault(slot, set()).add(target)
+        self._slot_of[target] = slot
+        self._ensure_task()
+        self._wakeup.set()
+
+    async def run_due(self, now: float | None = None) -> int:
+        """Renew every target whose slot has started, as one batch.
+
+        Args:
+            now: Current monotonic time (defaults to time.monotonic()).
+
+        Returns:
+            Number of targets renewed (or attempted) in this batch.
+        """
+        if now is None:
+            now = time.monotonic()
+        due = self._pop_due(now)
+        if not due:
+            return 0
+
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, len(due))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        await asyncio.gather(*(self._renew_one(target, semaphore) for target in due))
+        return len(due)
+
+    def _ensure_task(self) -> None:
+        """Start the scheduler task if it is not running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name="pywiim-upnp-subscription-renewal")
+
+    async def _run(self) -> None:
+        """Scheduler loop: sleep until the next occupied slot, then renew it."""
+        while self._wheel:
+            self._wakeup.clear()
+            wait = self._next_wakeup(time.monotonic())
+            if wait:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                    continue  # Schedule changed - recompute next wakeup
+                except TimeoutError:
+                    pass
+            await self.run_due()
+
+    async def close(self) -> None:
+        """Cancel the scheduler task and forget all targets."""
+        self._wheel.clear()
+        self._slot_of.clear()
+        self._failures.clear()
+        self._active.clear()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+_MANAGERS: dict[asyncio.AbstractEventLoop, SubscriptionRenewalManager] = {}
+
+
+def get_renewal_manager() -> SubscriptionRenewalManager:
+    """Return the process-wide renewal manager for the running event loop."""
+    loop = asyncio.get_running_loop()
+    manager = _MANAGERS.get(loop)
+    if manager is None:
+        # Drop managers of closed loops (e.g. between test runs)
+        for stale in [key for key in _MANAGERS if key.is_closed()]:
+            del _MANAGERS[stale]
+        manager = _MANAGERS[loop] = SubscriptionRenewalManager()
+    return manager
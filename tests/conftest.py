@@ -261,6 +261,16 @@ def restore_capabilities_after_test():
                 pass  # Ignore if we can't restore
 
 
+@pytest.fixture(autouse=True, scope="function")
+def clear_cover_art_cache_after_test():
+    """Clear the process-wide cover art cache so cached images do not leak between tests."""
+    from pywiim.player.artcache import get_cover_art_cache
+
+    yield
+
+    get_cover_art_cache().clear()
+
+
 @pytest.fixture(autouse=True, scope="function")
 def restore_player_properties_after_test():
     """Restore Player class properties after each test to avoid affecting other tests.
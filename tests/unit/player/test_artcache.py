@@ -0,0 +1,153 @@
+"""Unit tests for the process-wide cover art cache."""
+
+import asyncio
+import os
+
+import pytest
+
+from pywiim.player.artcache import CachedArtwork, CoverArtCache, CoverArtDiskCache
+
+
+class TestCoverArtCache:
+    """Test CoverArtCache class."""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Entries are evicted oldest-use first once the byte budget is exceeded."""
+        cache = CoverArtCache(max_bytes=10)
+        cache.put("a", CachedArtwork(b"1234", "image/jpeg"))
+        cache.put("b", CachedArtwork(b"1234", "image/jpeg"))
+        assert cache.get("a") == CachedArtwork(b"1234", "image/jpeg")  # "a" is now most recently used
+
+        cache.put("c", CachedArtwork(b"1234", "image/png"))
+
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+        assert cache.size == 8
+        assert cache.statistics["evictions"] == 1
+
+        cache.put("huge", CachedArtwork(b"x" * 11, "image/jpeg"))
+        assert "huge" not in cache
+        assert cache.size == 8
+
+    def test_expired_entries_are_misses(self):
+        """Entries older than the TTL are misses but stay available for revalidation."""
+        cache = CoverArtCache(ttl=60.0)
+        cache.put("a", CachedArtwork(b"1234", "image/jpeg", etag='"v1"'), now=100.0)
+
+        assert cache.get("a", now=150.0) is not None
+        assert cache.get("a", now=160.0) is None
+        assert cache.peek("a").conditional_headers() == {"If-None-Match": '"v1"'}
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        with pytest.raises(ValueError):
+            CoverArtCache(max_bytes=0)
+
+    def test_variants_dropped_when_original_changes(self):
+        """Resized variants live next to the original and are dropped when it changes."""
+        cache = CoverArtCache()
+        cache.put("a", CachedArtwork(b"original", "image/jpeg"))
+        cache.put("a", CachedArtwork(b"thumb", "image/jpeg"), size=80)
+        assert cache.get("a", size=80) == CachedArtwork(b"thumb", "image/jpeg")
+
+        cache.put("a", CachedArtwork(b"original", "image/jpeg"))  # Revalidated, unchanged
+        assert cache.get("a", size=80) is not None
+
+        cache.put("a", CachedArtwork(b"new art", "image/jpeg"))
+        assert cache.get("a", size=80) is None
+        assert cache.size == len(b"new art")
+
+        # An image that already fits is not stored again as its own variant
+        cache.put("a", cache.peek("a"), size=200)
+        assert ("a", 200) not in cache
+        assert cache.size == len(b"new art")
+
+    @pytest.mark.asyncio
+    async def test_fetch_once_shares_concurrent_downloads(self):
+        """Players fetching the same artwork at once share one download."""
+        cache = CoverArtCache()
+        downloads = 0
+
+        async def fetcher():
+            nonlocal downloads
+            downloads += 1
+            await asyncio.sleep(0.01)
+            return CachedArtwork(b"art", "image/jpeg")
+
+        results = await asyncio.gather(*(cache.fetch_once("http://master/art.jpg", fetcher) for _ in range(3)))
+
+        assert downloads == 1
+        assert results == [CachedArtwork(b"art", "image/jpeg")] * 3
+        assert cache.get("http://master/art.jpg") == CachedArtwork(b"art", "image/jpeg")
+        assert cache.statistics["shared_fetches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_once_survives_caller_cancellation(self):
+        """A cancelled caller leaves the shared download running for the others."""
+        cache = CoverArtCache()
+        release = asyncio.Event()
+
+        async def fetcher():
+            await release.wait()
+            return CachedArtwork(b"art", "image/jpeg")
+
+        first = asyncio.create_task(cache.fetch_once("http://a", fetcher))
+        second = asyncio.create_task(cache.fetch_once("http://a", fetcher))
+        await asyncio.sleep(0)
+        assert cache.statistics["inflight"] == 1
+
+        first.cancel()
+        release.set()
+
+        assert await second == CachedArtwork(b"art", "image/jpeg")
+        assert first.cancelled()
+        assert "http://a" in cache
+        assert cache.statistics["inflight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fetch_once_failure_is_retried_by_next_caller(self):
+        """Waiters share a failed result; a later call starts a new fetch."""
+        cache = CoverArtCache()
+        results = [None, CachedArtwork(b"art", "image/jpeg")]
+
+        async def fetcher():
+            await asyncio.sleep(0)
+            return results.pop(0)
+
+        assert await asyncio.gather(cache.fetch_once("http://a", fetcher), cache.fetch_once("http://a", fetcher)) == [
+            None,
+            None,
+        ]
+        assert await cache.fetch_once("http://a", fetcher) == CachedArtwork(b"art", "image/jpeg")
+
+
+class TestCoverArtDiskCache:
+    """Test CoverArtDiskCache class."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_touch_and_prune(self, tmp_path):
+        """Images round-trip with validators; touch refreshes; old entries are pruned."""
+        disk = CoverArtDiskCache(tmp_path, max_bytes=8, ttl=60.0)
+        artwork = CachedArtwork(b"1234", "image/png", etag='"v1"', last_modified="Mon")
+
+        await disk.async_put("http://a", artwork)
+        assert await disk.async_get("http://a") == (artwork, True)
+        assert await disk.async_get("http://missing") is None
+
+        disk.ttl = 0.0
+        assert (await disk.async_get("http://a"))[1] is False
+        disk.ttl = 60.0
+        await disk.async_touch("http://a")
+        assert (await disk.async_get("http://a"))[1] is True
+
+        await disk.async_put("http://b", CachedArtwork(b"5678", "image/png"))
+        os.utime(disk._paths("http://a")[0], (0, 0))  # Make "a" the oldest
+        await disk.async_put("http://c", CachedArtwork(b"9012", "image/png"))
+        assert await disk.async_get("http://a") is None
+        assert await disk.async_get("http://c") is not None
+
+
+def test_players_share_default_cache(mock_client):
+    """Players created in the same process use one cover art cache."""
+    from pywiim.player import Player
+
+    assert Player(mock_client)._cover_art_cache is Player(mock_client)._cover_art_cache
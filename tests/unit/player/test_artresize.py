@@ -0,0 +1,33 @@
+"""Unit tests for cover art thumbnail resizing."""
+
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from pywiim.player import artresize
+from pywiim.player.artresize import pillow_resizer
+
+
+class TestPillowResizer:
+    """Test the Pillow-based default resizer."""
+
+    def test_without_pillow_keeps_original(self):
+        """Without Pillow the resizer declines and the original is served."""
+        with patch.object(artresize, "Image", None):
+            assert pillow_resizer(b"not an image", "image/jpeg", 80) is None
+
+    def test_scales_down_keeping_aspect_ratio(self):
+        """Large images are scaled to fit; small and undecodable ones are left alone."""
+        image_module = pytest.importorskip("PIL.Image")
+        source = BytesIO()
+        image_module.new("RGB", (1000, 500), "red").save(source, format="JPEG")
+
+        data, content_type = pillow_resizer(source.getvalue(), "image/jpeg", 80)
+
+        assert content_type == "image/jpeg"
+        assert len(data) < len(source.getvalue())
+        with image_module.open(BytesIO(data)) as thumbnail:
+            assert thumbnail.size == (80, 40)
+        assert pillow_resizer(data, "image/jpeg", 100) is None
+        assert pillow_resizer(b"garbage", "image/jpeg", 80) is None
@@ -0,0 +1,100 @@
+"""Unit tests for StateChangeNotifier.
+
+Tests change-only subscriptions with field-level diffs.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from pywiim.models import PlayerStatus
+
+
+class TestStateChangeNotifier:
+    """Test StateChangeNotifier and Player.subscribe_state_changes."""
+
+    @pytest.fixture
+    def player(self, mock_client):
+        """Create a Player with a populated status model."""
+        from pywiim.player import Player
+
+        player = Player(mock_client)
+        player._status_model = PlayerStatus(play_state="play", volume=30, title="Song A")
+        player._state_synchronizer.update_from_http(
+            {"play_state": "play", "volume": 30, "muted": False, "title": "Song A"}
+        )
+        return player
+
+    def test_no_subscribers_returns_plain_callback(self, player):
+        """Without subscribers the user callback is returned unchanged."""
+        callback = MagicMock()
+        player._on_state_changed = callback
+
+        assert player._on_state_changed is callback
+
+    def test_diff_delivered_for_changed_fields(self, player):
+        """Subscriber receives only the fields that changed."""
+        received = []
+        player.subscribe_state_changes(received.append, exclude=["media_position"])
+
+        player._state_synchronizer.update_from_http({"volume": 45})
+        player._on_state_changed()
+
+        assert received == [{"volume_level": (0.3, 0.45)}]
+
+    def test_suppressed_when_nothing_changed(self, player):
+        """No callback when no watched field changed."""
+        received = []
+        player.subscribe_state_changes(received.append, exclude=["media_position"])
+
+        player._on_state_changed()
+        player._on_state_changed()
+
+        assert received == []
+
+    def test_field_filter(self, player):
+        """Subscriber watching specific fields ignores other changes."""
+        received = []
+        player.subscribe_state_changes(received.append, fields=["media_title"])
+
+        player._state_synchronizer.update_from_http({"volume": 45})
+        player._on_state_changed()
+        player._state_synchronizer.update_from_http({"title": "Song B"})
+        player._on_state_changed()
+
+        assert received == [{"media_title": ("Song A", "Song B")}]
+
+    def test_user_callback_still_called(self, player):
+        """Plain callback keeps firing alongside diff subscribers."""
+        callback = MagicMock()
+        player._on_state_changed = callback
+        player.subscribe_state_changes(MagicMock())
+
+        player._on_state_changed()
+
+        callback.assert_called_once_with()
+
+    def test_subscriber_errors_are_isolated(self, player):
+        """A failing subscriber does not prevent others from being notified."""
+        received = []
+        player.subscribe_state_changes(MagicMock(side_effect=RuntimeError("boom")))
+        player.subscribe_state_changes(received.append, fields=["volume_level"])
+
+        player._state_synchronizer.update_from_http({"volume": 60})
+        player._on_state_changed()
+
+        assert received == [{"volume_level": (0.3, 0.6)}]
+
+    def test_unsubscribe(self, player):
+        """Unsubscribing restores the plain callback path."""
+        received = []
+        unsubscribe = player.subscribe_state_changes(received.append)
+        unsubscribe()
+
+        assert player._on_state_changed is None
+        assert player._change_notifier.has_subscribers is False
+
+    def test_unknown_field_rejected(self, player):
+        """Unknown field names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown state field"):
+            player.subscribe_state_changes(MagicMock(), fields=["not_a_field"])
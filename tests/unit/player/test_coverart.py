@@ -5,12 +5,23 @@ Tests cover art fetching, caching, and URL hashing.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
 
 from pywiim.api.constants import DEFAULT_WIIM_LOGO_URL
+from pywiim.player.artcache import CachedArtwork, CoverArtCache, CoverArtDiskCache
+
+
+def _body(data):
+    """Mock ``response.content.iter_chunked`` serving data in one chunk."""
+
+    async def iter_chunked(size):
+        yield data
+
+    return iter_chunked
 
 
 class TestCoverArtManager:
@@ -22,10 +33,8 @@ class TestCoverArtManager:
         from pywiim.player import Player
 
         player = Player(mock_client)
-        # Initialize cover art cache attributes
-        player._cover_art_cache = {}
-        player._cover_art_cache_ttl = 3600
-        player._cover_art_cache_max_size = 10
+        # Isolate from the process-wide cover art cache
+        player._cover_art_cache = CoverArtCache()
         return player
 
     @pytest.fixture
@@ -35,52 +44,6 @@ class TestCoverArtManager:
 
         return CoverArtManager(mock_player)
 
-    def test_get_url_hash(self, cover_art_manager):
-        """Test URL hash generation."""
-        hash1 = cover_art_manager._get_url_hash("https://example.com/image.jpg")
-        hash2 = cover_art_manager._get_url_hash("https://example.com/image.jpg")
-        hash3 = cover_art_manager._get_url_hash("https://example.com/other.jpg")
-
-        # Same URL should produce same hash
-        assert hash1 == hash2
-        # Different URLs should produce different hashes
-        assert hash1 != hash3
-        # Hash should be a hex string
-        assert len(hash1) == 32  # MD5 hex digest length
-
-    def test_cleanup_cover_art_cache_expired(self, cover_art_manager, mock_player):
-        """Test cache cleanup removes expired entries."""
-        import time
-
-        # Add expired entry
-        url_hash = cover_art_manager._get_url_hash("https://example.com/old.jpg")
-        mock_player._cover_art_cache[url_hash] = (b"image_data", "image/jpeg", time.time() - 4000)
-
-        # Add non-expired entry
-        url_hash2 = cover_art_manager._get_url_hash("https://example.com/new.jpg")
-        mock_player._cover_art_cache[url_hash2] = (b"image_data", "image/jpeg", time.time())
-
-        cover_art_manager._cleanup_cover_art_cache()
-
-        # Expired entry should be removed
-        assert url_hash not in mock_player._cover_art_cache
-        # Non-expired entry should remain
-        assert url_hash2 in mock_player._cover_art_cache
-
-    def test_cleanup_cover_art_cache_size_limit(self, cover_art_manager, mock_player):
-        """Test cache cleanup enforces size limit."""
-        import time
-
-        # Fill cache beyond max size
-        for i in range(15):
-            url_hash = cover_art_manager._get_url_hash(f"https://example.com/image{i}.jpg")
-            mock_player._cover_art_cache[url_hash] = (b"image_data", "image/jpeg", time.time() + i)
-
-        cover_art_manager._cleanup_cover_art_cache()
-
-        # Cache should be at max size
-        assert len(mock_player._cover_art_cache) <= mock_player._cover_art_cache_max_size
-
     @pytest.mark.asyncio
     async def test_fetch_cover_art_embedded_logo(self, cover_art_manager):
         """Test fetch_cover_art returns embedded logo for sentinel URL."""
@@ -92,6 +55,26 @@ class TestCoverArtManager:
         assert content_type == "image/png"
         assert len(image_bytes) > 0
 
+    @pytest.mark.asyncio
+    async def test_embedded_logo_decoded_once_with_stable_etag(self, cover_art_manager, mock_player):
+        """The fallback logo is decoded once and served as the same bytes with a stable ETag."""
+        from pywiim.player import artfetch
+
+        artfetch.get_embedded_logo.cache_clear()
+        with patch.object(artfetch.base64, "b64decode", wraps=artfetch.base64.b64decode) as decode:
+            first = await cover_art_manager.fetch_cover_art(DEFAULT_WIIM_LOGO_URL)
+            second = await cover_art_manager.fetch_cover_art("")
+        decode.assert_called_once()
+        assert first[0] is second[0]
+
+        etag = cover_art_manager.get_cover_art_etag(DEFAULT_WIIM_LOGO_URL)
+        assert etag.startswith('"') and etag == artfetch.get_embedded_logo().etag
+
+        url = "http://example.com/art.jpg"
+        assert cover_art_manager.get_cover_art_etag(url) is None
+        mock_player._cover_art_cache.put(url, CachedArtwork(b"img", "image/jpeg", etag='"abc"'))
+        assert cover_art_manager.get_cover_art_etag(url) == '"abc"'
+
     @pytest.mark.asyncio
     async def test_fetch_cover_art_none_url(self, cover_art_manager, mock_player):
         """Test fetch_cover_art with None URL uses media_image_url."""
@@ -117,12 +100,8 @@ class TestCoverArtManager:
     @pytest.mark.asyncio
     async def test_fetch_cover_art_cache_hit(self, cover_art_manager, mock_player):
         """Test fetch_cover_art returns cached entry."""
-        import time
-
         url = "https://example.com/image.jpg"
-        url_hash = cover_art_manager._get_url_hash(url)
-        cached_data = (b"cached_image", "image/jpeg", time.time())
-        mock_player._cover_art_cache[url_hash] = cached_data
+        mock_player._cover_art_cache.put(url, CachedArtwork(b"cached_image", "image/jpeg"))
 
         # Mock session to ensure we don't make HTTP call
         mock_player.client._session = None
@@ -138,7 +117,7 @@ class TestCoverArtManager:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "image/jpeg"}
-        mock_response.read = AsyncMock(return_value=b"image_data")
+        mock_response.content.iter_chunked = _body(b"image_data")
 
         mock_session = MagicMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_response)
@@ -162,7 +141,7 @@ class TestCoverArtManager:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "image/png"}
-        mock_response.read = AsyncMock(return_value=b"image_data")
+        mock_response.content.iter_chunked = _body(b"image_data")
 
         mock_session = MagicMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_response)
@@ -177,6 +156,7 @@ class TestCoverArtManager:
         image_bytes, content_type = result
         assert image_bytes == b"image_data"
         assert content_type == "image/png"
+        assert url in mock_player._cover_art_cache
 
     @pytest.mark.asyncio
     async def test_fetch_cover_art_http_error(self, cover_art_manager, mock_player):
@@ -217,7 +197,7 @@ class TestCoverArtManager:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "image/jpeg"}
-        mock_response.read = AsyncMock(return_value=b"image_data")
+        mock_response.content.iter_chunked = _body(b"image_data")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -241,7 +221,7 @@ class TestCoverArtManager:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/octet-stream"}
-        mock_response.read = AsyncMock(return_value=b"image_data")
+        mock_response.content.iter_chunked = _body(b"image_data")
 
         mock_session = MagicMock()
         mock_session.__aenter__ = AsyncMock(return_value=mock_response)
@@ -257,6 +237,279 @@ class TestCoverArtManager:
         _, content_type = result
         assert content_type == "image/jpeg"
 
+    @staticmethod
+    def _session(status, body=b"", headers=None):
+        """Mock session whose GET returns one response."""
+        response = MagicMock()
+        response.status = status
+        response.headers = headers or {}
+        response.content.iter_chunked = _body(body)
+        request = MagicMock()
+        request.__aenter__ = AsyncMock(return_value=response)
+        request.__aexit__ = AsyncMock(return_value=None)
+        session = MagicMock()
+        session.get = MagicMock(return_value=request)
+        return session
+
+    @pytest.mark.asyncio
+    async def test_fetch_cover_art_revalidates_expired_entry(self, cover_art_manager, mock_player):
+        """Expired entries are revalidated with a conditional GET; 304 reuses the cached bytes."""
+        url = "http://example.com/art.jpg"
+        mock_player._cover_art_cache.put(url, CachedArtwork(b"old", "image/jpeg", etag='"v1"'), now=0.0)
+        mock_player.client._session = self._session(304)
+
+        result = await cover_art_manager.fetch_cover_art(url)
+
+        assert result == (b"old", "image/jpeg")
+        assert mock_player.client._session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert mock_player._cover_art_cache.get(url) is not None  # Fresh again
+
+    @pytest.mark.asyncio
+    async def test_fetch_cover_art_disk_tier_survives_restart(self, mock_client, tmp_path):
+        """A new process serves fresh images from disk and revalidates stale ones."""
+        from pywiim.player import Player
+        from pywiim.player.coverart import CoverArtManager
+
+        url = "http://example.com/art.jpg"
+        disk = CoverArtDiskCache(tmp_path / "art")
+        first = Player(mock_client)
+        first._cover_art_cache = CoverArtCache(disk_cache=disk)
+        mock_client._session = self._session(200, b"image", {"Content-Type": "image/png", "Last-Modified": "Mon"})
+        assert await CoverArtManager(first).fetch_cover_art(url) == (b"image", "image/png")
+
+        # "Restart": empty memory cache, same directory
+        restarted = Player(mock_client)
+        restarted._cover_art_cache = CoverArtCache(disk_cache=CoverArtDiskCache(tmp_path / "art"))
+        mock_client._session = self._session(500)
+        assert await CoverArtManager(restarted).fetch_cover_art(url) == (b"image", "image/png")
+        mock_client._session.get.assert_not_called()
+
+        # Expired on disk: conditional GET with the stored validator
+        restarted._cover_art_cache = CoverArtCache(disk_cache=CoverArtDiskCache(tmp_path / "art", ttl=0.0))
+        mock_client._session = self._session(304)
+        assert await CoverArtManager(restarted).fetch_cover_art(url) == (b"image", "image/png")
+        assert mock_client._session.get.call_args.kwargs["headers"] == {"If-Modified-Since": "Mon"}
+
+    @pytest.mark.asyncio
+    async def test_fetch_cover_art_single_flight_across_players(self, mock_client):
+        """Concurrent fetches of one URL from several players issue a single GET."""
+        from pywiim.player import Player
+
+        cache = CoverArtCache()
+        players = [Player(mock_client) for _ in range(3)]
+        for player in players:
+            player._cover_art_cache = cache
+        session = self._session(200, b"image", {"Content-Type": "image/jpeg"})
+        response = session.get.return_value.__aenter__.return_value
+
+        async def slow_body(size):
+            await asyncio.sleep(0.01)
+            yield b"image"
+
+        response.content.iter_chunked = slow_body
+        mock_client._session = session
+
+        results = await asyncio.gather(
+            *(player.fetch_cover_art("http://master/art.jpg") for player in players for _ in range(2))
+        )
+
+        assert results == [(b"image", "image/jpeg")] * 6
+        session.get.assert_called_once()
+        assert cache.statistics["shared_fetches"] == 5
+
+    @pytest.mark.asyncio
+    async def test_track_change_prefetches_current_and_upcoming_artwork(self, cover_art_manager, mock_player):
+        """A track change downloads the new artwork and the next queue items', capped in concurrency."""
+        from pywiim.models import PlayerStatus
+        from pywiim.player import coverart
+
+        mock_player._status_model = PlayerStatus(queue_position=1, queue_count=4)
+        items = [{"position": i, "title": f"T{i}", "image_url": f"http://art/{i}.jpg"} for i in range(4)]
+        mock_player._media_ctrl._queue_cache.store_page("Q:0", 0, items, update_id=1, total=4)
+
+        active = peak = 0
+        fetched = []
+
+        async def load(url):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            fetched.append(url)
+            return CachedArtwork(b"img", "image/jpeg")
+
+        cover_art_manager._load_cover_art = load
+        cover_art_manager.check_track_changed({"title": "T0", "artist": "A"})
+        with patch.object(coverart, "ARTWORK_PREFETCH_CONCURRENCY", 1):
+            assert cover_art_manager.check_track_changed(
+                {"title": "T0", "artist": "B", "image_url": "http://art/0.jpg"}
+            )
+            await cover_art_manager._prefetch_task
+
+        assert fetched == ["http://art/0.jpg", "http://art/1.jpg", "http://art/2.jpg"]
+        assert peak == 1
+        assert mock_player._cover_art_cache.get("http://art/2.jpg") is not None
+
+    @pytest.mark.asyncio
+    async def test_prefetch_upcoming_artwork_with_queue_gaps(self, cover_art_manager, mock_player):
+        """Upcoming artwork follows queue positions even if the cached page skipped an item."""
+        from pywiim.models import PlayerStatus
+
+        # plicurr=3 (1-based) -> position 2 is playing; position 1 had no URL and was not parsed
+        mock_player._status_model = PlayerStatus(queue_position=3, queue_count=5)
+        items = [{"position": i, "title": f"T{i}", "image_url": f"http://art/{i}.jpg"} for i in (0, 2, 3, 4)]
+        mock_player._media_ctrl._queue_cache.store_page("Q:0", 0, items, update_id=1, total=5)
+
+        fetched = []
+
+        async def load(url):
+            fetched.append(url)
+            return CachedArtwork(b"img", "image/jpeg")
+
+        cover_art_manager._load_cover_art = load
+        cover_art_manager.check_track_changed({"title": "T0", "artist": "A"})
+        assert cover_art_manager.check_track_changed({"title": "T2", "artist": "A", "image_url": "http://art/2.jpg"})
+        await cover_art_manager._prefetch_task
+
+        assert fetched == ["http://art/2.jpg", "http://art/3.jpg", "http://art/4.jpg"]
+
+    def test_prefetch_skips_invalid_artwork_and_disabled(self, cover_art_manager):
+        """No prefetch without real artwork or when disabled."""
+        cover_art_manager.schedule_artwork_prefetch({"image_url": DEFAULT_WIIM_LOGO_URL})
+        assert cover_art_manager._prefetch_task is None
+
+        cover_art_manager.prefetch_enabled = False
+        cover_art_manager.schedule_artwork_prefetch({"image_url": "http://art/0.jpg"})
+        assert cover_art_manager._prefetch_task is None
+
+    @pytest.mark.asyncio
+    async def test_fetch_cover_art_resized_variants(self, cover_art_manager, mock_player):
+        """Sized requests are resized once per (url, size) from a single download."""
+        from pywiim.player import coverart
+
+        url = "http://example.com/big.jpg"
+        mock_player.client._session = self._session(200, b"x" * 1000, {"Content-Type": "image/jpeg"})
+        calls = []
+
+        def resizer(data, content_type, size):
+            calls.append(size)
+            return (data[:size], "image/jpeg")
+
+        with patch.object(coverart, "get_artwork_resizer", return_value=resizer):
+            assert await cover_art_manager.fetch_cover_art(url, size=80) == (b"x" * 80, "image/jpeg")
+            assert await cover_art_manager.get_cover_art_bytes(url, size=80) == b"x" * 80
+            assert await cover_art_manager.fetch_cover_art(url, size=200) == (b"x" * 200, "image/jpeg")
+            assert await cover_art_manager.fetch_cover_art(url) == (b"x" * 1000, "image/jpeg")
+            with pytest.raises(ValueError):
+                await cover_art_manager.fetch_cover_art(url, size=0)
+
+        assert calls == [80, 200]
+        mock_player.client._session.get.assert_called_once()
+
+        # Without a resizer the original is served
+        with patch.object(coverart, "get_artwork_resizer", return_value=None):
+            assert await cover_art_manager.fetch_cover_art(url, size=40) == (b"x" * 1000, "image/jpeg")
+
+    @staticmethod
+    def _streaming_session(chunks, headers=None):
+        """Mock session whose response body arrives in chunks."""
+
+        async def iter_chunked(size):
+            for chunk in chunks:
+                yield chunk
+
+        session = TestCoverArtManager._session(200, headers=headers or {"Content-Type": "image/png"})
+        response = session.get.return_value.__aenter__.return_value
+        response.content.iter_chunked = iter_chunked
+        return session
+
+    @pytest.mark.asyncio
+    async def test_stream_cover_art_tees_into_cache(self, cover_art_manager, mock_player):
+        """Chunks are forwarded as they arrive and the complete image is cached."""
+        url = "http://example.com/art.png"
+        mock_player.client._session = self._streaming_session([b"ab", b"cd", b"e"])
+
+        chunks = [chunk async for chunk in cover_art_manager.stream_cover_art(url)]
+
+        assert chunks == [b"ab", b"cd", b"e"]
+        assert mock_player._cover_art_cache.get(url) == CachedArtwork(b"abcde", "image/png")
+
+        # Served from the cache in chunk_size pieces
+        mock_player.client._session = None
+        assert [chunk async for chunk in cover_art_manager.stream_cover_art(url, chunk_size=2)] == [b"ab", b"cd", b"e"]
+
+    @pytest.mark.asyncio
+    async def test_stream_cover_art_aborts_oversized(self, cover_art_manager, mock_player):
+        """Oversized images are skipped via Content-Length or aborted once the limit is crossed."""
+        from pywiim.exceptions import WiiMError
+
+        url = "http://example.com/huge.png"
+        cover_art_manager.max_image_bytes = 4
+        mock_player.client._session = self._streaming_session([b"abc"], {"Content-Length": "10"})
+        assert [chunk async for chunk in cover_art_manager.stream_cover_art(url)] == []
+
+        mock_player.client._session = self._streaming_session([b"abc", b"def", b"ghi"])
+        received = []
+        with pytest.raises(WiiMError, match="exceeded 4 bytes"):
+            async for chunk in cover_art_manager.stream_cover_art(url):
+                received.append(chunk)
+        assert received == [b"abc"]
+        assert url not in mock_player._cover_art_cache
+
+        # The buffered path honours the limit too, without reading the rest of the body
+        served = []
+
+        async def iter_chunked(size):
+            for chunk in (b"xxx", b"xxx", b"xxx"):
+                served.append(chunk)
+                yield chunk
+
+        mock_player.client._session = self._session(200, headers={"Content-Type": "image/png"})
+        mock_player.client._session.get.return_value.__aenter__.return_value.content.iter_chunked = iter_chunked
+        assert await cover_art_manager.fetch_cover_art(url) is None
+        assert len(served) == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_cover_art_single_flight(self, cover_art_manager, mock_player):
+        """Concurrent streamers and fetchers of one URL share a single download."""
+        url = "http://example.com/art.png"
+        release = asyncio.Event()
+
+        async def iter_chunked(size):
+            yield b"ab"
+            await release.wait()
+            yield b"cd"
+
+        session = self._streaming_session([])
+        session.get.return_value.__aenter__.return_value.content.iter_chunked = iter_chunked
+        mock_player.client._session = session
+
+        async def stream():
+            return b"".join([chunk async for chunk in cover_art_manager.stream_cover_art(url)])
+
+        first = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(stream())
+        fetched = asyncio.create_task(cover_art_manager.fetch_cover_art(url))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert await first == await second == b"abcd"
+        assert await fetched == (b"abcd", "image/png")
+        session.get.assert_called_once()
+        assert mock_player._cover_art_cache.statistics["shared_fetches"] == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_cover_art_logo(self, cover_art_manager):
+        """Without artwork the embedded logo is streamed."""
+        from pywiim.player.artfetch import get_embedded_logo
+
+        chunks = [chunk async for chunk in cover_art_manager.stream_cover_art(DEFAULT_WIIM_LOGO_URL, chunk_size=1024)]
+
+        assert b"".join(chunks) == get_embedded_logo().data
+        assert max(len(chunk) for chunk in chunks) == 1024
+
     @pytest.mark.asyncio
     async def test_get_cover_art_bytes(self, cover_art_manager):
         """Test get_cover_art_bytes convenience method."""
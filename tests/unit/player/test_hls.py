@@ -0,0 +1,274 @@
+"""Unit tests for HLS metadata extraction (playlist caching and ranged ID3 segment reads)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pywiim.player.hls import (
+    _HLS_CACHE,
+    HLS_ID3_PROBE_BYTES,
+    _extract_station_name_from_url,
+    _fetch_hls_metadata,
+)
+from pywiim.player.stream import StreamMetadata
+
+
+@pytest.fixture(autouse=True)
+def clear_hls_cache():
+    """Start every test without cached HLS playlists."""
+    _HLS_CACHE.clear()
+    yield
+    _HLS_CACHE.clear()
+
+
+class TestExtractStationNameFromUrl:
+    """Test _extract_station_name_from_url function."""
+
+    def test_radio_canada_premiere(self):
+        """Test Radio-Canada ICI Première pattern."""
+        url = "https://example.com/rcavliveaudio/P-2QMTL0_MTL"
+        result = _extract_station_name_from_url(url)
+
+        assert result.station_name == "Radio-Canada ICI Première Montréal"
+
+    def test_radio_canada_musique(self):
+        """Test Radio-Canada ICI Musique pattern."""
+        # The pattern checks for "radio-canada" in url.lower() OR "rcavliveaudio" in url
+        # Then checks if "ICI_MUSIQUE" in url.upper()
+        url = "https://example.com/radio-canada/stream/ICI_MUSIQUE/playlist.m3u8"
+        result = _extract_station_name_from_url(url)
+
+        assert result.station_name == "Radio-Canada ICI Musique"
+
+    def test_bbc_radio_one(self):
+        """Test BBC Radio 1 pattern."""
+        url = "https://example.com/bbc/radio_one"
+        result = _extract_station_name_from_url(url)
+
+        assert result.station_name == "BBC Radio 1"
+
+    def test_bbc_radio_two(self):
+        """Test BBC Radio 2 pattern."""
+        url = "https://example.com/bbc/radio_two"
+        result = _extract_station_name_from_url(url)
+
+        assert result.station_name == "BBC Radio 2"
+
+    def test_cbc_radio_one(self):
+        """Test CBC Radio One pattern."""
+        url = "https://example.com/cbc/CBCR1"
+        result = _extract_station_name_from_url(url)
+
+        assert result.station_name == "CBC Radio One"
+
+    def test_unknown_url(self):
+        """Test unknown URL returns empty metadata."""
+        url = "https://example.com/unknown"
+        result = _extract_station_name_from_url(url)
+
+        assert result.station_name is None
+
+
+def _id3(title, artist, padding=0):
+    """Build an ID3v2.4 tag with UTF-8 TIT2/TPE1 frames."""
+
+    def syncsafe(value):
+        return bytes((value >> shift) & 0x7F for shift in (21, 14, 7, 0))
+
+    frames = b"".join(
+        frame_id + syncsafe(len(text.encode()) + 1) + b"\0\0" + b"\x03" + text.encode()
+        for frame_id, text in ((b"TIT2", title), (b"TPE1", artist))
+    )
+    frames += b"\0" * padding
+    return b"ID3\x04\x00\x00" + syncsafe(len(frames)) + frames
+
+
+class _FakeHlsServer:
+    """aiohttp session stand-in serving playlists and segments, honouring Range if enabled.
+
+    Bodies arrive in packets of packet_size bytes, so reads do not line up
+    with the sizes requested by the reader.
+    """
+
+    packet_size = 1500
+
+    def __init__(self, files, ranges=True):
+        self.files = files
+        self.ranges = ranges
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        byte_range = (headers or {}).get("Range")
+        self.requests.append((url, byte_range))
+        body = self.files[url]
+        response = MagicMock()
+        response.status = 200
+        if isinstance(body, str):
+            response.text = AsyncMock(return_value=body)
+        else:
+            if byte_range and self.ranges:
+                start, end = (int(value) for value in byte_range[len("bytes=") :].split("-"))
+                body = body[start : end + 1]
+                response.status = 206
+            response.served = 0
+
+            async def read(size):
+                packet_end = (response.served // self.packet_size + 1) * self.packet_size
+                chunk = body[response.served : min(response.served + size, packet_end)]
+                response.served += len(chunk)
+                return chunk
+
+            response.content.read = read
+        self.last_response = response
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=None)
+        return context
+
+
+def _media_playlist(first_sequence, count):
+    segments = "".join(f"#EXTINF:6.0,\nseg{first_sequence + index}.aac\n" for index in range(count))
+    return f"#EXTM3U\n#EXT-X-TARGETDURATION:6\n#EXT-X-MEDIA-SEQUENCE:{first_sequence}\n{segments}"
+
+
+class TestFetchHlsMetadata:
+    """Test _fetch_hls_metadata function."""
+
+    @pytest.mark.asyncio
+    async def test_m3u8_not_available(self):
+        """Test _fetch_hls_metadata returns None if m3u8 not available."""
+        with patch("pywiim.player.hls.m3u8", None):
+            result = await _fetch_hls_metadata("https://example.com/stream.m3u8", MagicMock(), timeout=5)
+            assert result is None
+
+    @pytest.mark.asyncio
+    async def test_mutagen_not_available(self):
+        """Test _fetch_hls_metadata returns None if mutagen not available."""
+        with patch("pywiim.player.hls.m3u8", MagicMock()):
+            with patch("pywiim.player.hls.MutagenFile", None):
+                result = await _fetch_hls_metadata("https://example.com/stream.m3u8", MagicMock(), timeout=5)
+                assert result is None
+
+    @pytest.mark.asyncio
+    async def test_master_playlist(self):
+        """Test _fetch_hls_metadata handles master playlists."""
+        url = "https://example.com/master.m3u8"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="#EXTM3U\n#EXT-X-STREAM-INF\nvariant.m3u8\n")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        mock_m3u8 = MagicMock()
+        mock_playlist = MagicMock()
+        mock_playlist.is_variant = True
+        mock_playlist.playlists = [MagicMock(uri="variant.m3u8")]
+        mock_m3u8.loads.return_value = mock_playlist
+
+        with patch("pywiim.player.hls.m3u8", mock_m3u8):
+            with patch("pywiim.player.hls._fetch_hls_metadata", return_value=StreamMetadata()) as mock_recursive:
+                await _fetch_hls_metadata(url, mock_session, timeout=5)
+
+                # Should recursively call for variant
+                assert mock_recursive.called
+
+    @pytest.mark.asyncio
+    async def test_no_segments(self):
+        """Test _fetch_hls_metadata handles playlists with no segments."""
+        url = "https://example.com/stream.m3u8"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="#EXTM3U\n")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        mock_m3u8 = MagicMock()
+        mock_playlist = MagicMock()
+        mock_playlist.is_variant = False
+        mock_playlist.segments = []
+        mock_m3u8.loads.return_value = mock_playlist
+
+        with patch("pywiim.player.hls.m3u8", mock_m3u8):
+            with patch("pywiim.player.hls._extract_station_name_from_url", return_value=StreamMetadata()):
+                result = await _fetch_hls_metadata(url, mock_session, timeout=5)
+
+                # Should try URL extraction
+                assert result is not None or result is None  # Either is valid
+
+    @pytest.mark.asyncio
+    async def test_caches_playlists_and_reads_only_new_segments(self):
+        """Variant and media playlists are reused; only new segments' ID3 headers are fetched."""
+        base = "https://radio.example/hls/"
+        audio = b"\xff\xf1" + b"\0" * 20000
+        files = {
+            base + "master.m3u8": "#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=64000\nlow/index.m3u8\n",
+            base + "low/index.m3u8": _media_playlist(100, 3),
+            **{f"{base}low/seg{seq}.aac": _id3(f"Song {seq}", "Artist") + audio for seq in range(100, 104)},
+        }
+        server = _FakeHlsServer(files)
+
+        metadata = await _fetch_hls_metadata(base + "master.m3u8", server, timeout=5)
+
+        assert (metadata.artist, metadata.title) == ("Artist", "Song 102")
+        assert server.requests[-1] == (base + "low/seg102.aac", f"bytes=0-{HLS_ID3_PROBE_BYTES - 1}")
+        assert len(server.requests) == 3
+
+        # Within the target duration nothing is requested
+        assert (await _fetch_hls_metadata(base + "master.m3u8", server, timeout=5)).title == "Song 102"
+        assert len(server.requests) == 3
+
+        # Playlist expired and advanced by one segment: variant remembered, one segment read
+        _HLS_CACHE.media[base + "low/index.m3u8"].fetched_at -= 60
+        files[base + "low/index.m3u8"] = _media_playlist(101, 3)
+
+        metadata = await _fetch_hls_metadata(base + "master.m3u8", server, timeout=5)
+
+        assert metadata.title == "Song 103"
+        assert [url for url, _ in server.requests[3:]] == [base + "low/index.m3u8", base + "low/seg103.aac"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ranges", [True, False])
+    async def test_large_id3_tag_read_to_its_end(self, ranges):
+        """Tags longer than the probe are completed; servers ignoring Range are read only up to the tag."""
+        url = "https://radio.example/live/index.m3u8"
+        tag = _id3("Long", "Tagged", padding=HLS_ID3_PROBE_BYTES * 2)
+        server = _FakeHlsServer(
+            {url: _media_playlist(1, 1), "https://radio.example/live/seg1.aac": tag + b"\0" * 100000},
+            ranges=ranges,
+        )
+
+        metadata = await _fetch_hls_metadata(url, server, timeout=5)
+
+        assert metadata.title == "Long"
+        if ranges:
+            assert server.requests[-1][1] == f"bytes={HLS_ID3_PROBE_BYTES}-{len(tag) - 1}"
+        else:
+            assert len(server.requests) == 2
+            assert server.last_response.served == len(tag)
+
+    def test_playlist_cache_bound(self):
+        """Full maps drop expired playlists first, then the oldest one."""
+        from pywiim.player.hls import HLS_MEDIA_IDLE_TTL, HLS_VARIANT_TTL, _HlsPlaylistCache
+
+        cache = _HlsPlaylistCache(max_entries=2)
+        cache.put_variant("http://a/master.m3u8", "http://a/low.m3u8", now=0.0)
+        cache.put_variant("http://b/master.m3u8", "http://b/low.m3u8", now=HLS_VARIANT_TTL)
+        cache.put_variant("http://c/master.m3u8", "http://c/low.m3u8", now=HLS_VARIANT_TTL + 1)
+        cache.put_variant("http://d/master.m3u8", "http://d/low.m3u8", now=HLS_VARIANT_TTL + 2)
+
+        assert list(cache.variants) == ["http://c/master.m3u8", "http://d/master.m3u8"]
+        assert cache.variant_for("http://c/master.m3u8", now=2 * HLS_VARIANT_TTL + 1) is None
+        assert "http://c/master.m3u8" not in cache.variants
+
+        idle = cache.add_media("http://a/low.m3u8", now=0.0)
+        cache.add_media("http://b/low.m3u8", now=1.0).fetched_at = HLS_MEDIA_IDLE_TTL
+        cache.add_media("http://c/low.m3u8", now=HLS_MEDIA_IDLE_TTL)
+
+        assert idle not in cache.media.values()
+        assert list(cache.media) == ["http://b/low.m3u8", "http://c/low.m3u8"]
@@ -0,0 +1,153 @@
+"""Unit tests for the long-lived ICY metadata reader."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pywiim.player.icy import IcyMetadataParser, IcyMetadataReader, subscribe_icy_metadata
+
+
+def _block(text):
+    """Encode one ICY metadata block with its length byte."""
+    data = text.encode()
+    padded = data + b"\0" * (-len(data) % 16)
+    return bytes([len(padded) // 16]) + padded
+
+
+def _session(chunks, metaint=8, release=None):
+    """Mock session streaming chunks from an ICY server.
+
+    If release is an asyncio.Event, the stream stays open until it is set.
+    """
+
+    async def iter_any():
+        for chunk in chunks:
+            yield chunk
+        if release is not None:
+            await release.wait()
+
+    response = MagicMock()
+    response.status = 200
+    response.headers = {"icy-metaint": str(metaint), "icy-name": "Radio X"}
+    response.content.iter_any = iter_any
+    session = MagicMock()
+    session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+    session.close = AsyncMock()
+    return session
+
+
+def _private_session(session):
+    """Patch the session readers create for themselves."""
+    return patch("pywiim.player.icy.aiohttp.ClientSession", return_value=session)
+
+
+class TestIcyMetadataParser:
+    """Test IcyMetadataParser class."""
+
+    def test_blocks_across_chunk_boundaries(self):
+        """Audio is skipped, empty blocks ignored and split blocks reassembled."""
+        stream = (
+            b"a" * 8 + _block("StreamTitle='A - One';") + b"b" * 8 + b"\0" + b"c" * 8 + _block("StreamTitle='Two';")
+        )
+        parser = IcyMetadataParser(8)
+
+        blocks = []
+        for pos in range(0, len(stream), 5):
+            blocks += parser.feed(stream[pos : pos + 5])
+
+        assert [block.rstrip(b"\0") for block in blocks] == [b"StreamTitle='A - One';", b"StreamTitle='Two';"]
+        assert IcyMetadataParser(8).feed(stream) == blocks
+
+        with pytest.raises(ValueError):
+            IcyMetadataParser(0)
+
+
+class TestIcyMetadataReader:
+    """Test IcyMetadataReader and the shared subscription registry."""
+
+    @pytest.fixture(autouse=True)
+    def no_resolve(self):
+        """Skip redirect/playlist resolution."""
+        with patch("pywiim.player.icy._resolve_stream_url", AsyncMock(side_effect=lambda url, session: url)):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_pushes_title_changes(self):
+        """Each new StreamTitle is pushed once; repeats are suppressed."""
+        release = asyncio.Event()
+        chunks = [
+            b"x" * 8 + _block("StreamTitle='Artist - Song';"),
+            b"x" * 8 + _block("StreamTitle='Artist - Song';"),
+            b"x" * 8 + _block("StreamTitle='Next';"),
+        ]
+        reader = IcyMetadataReader("http://radio/stream")
+        received = []
+
+        with _private_session(_session(chunks, release=release)):
+            unsubscribe = reader.subscribe(received.append)
+            await asyncio.sleep(0.01)
+
+        assert [(meta.artist, meta.title) for meta in received] == [("Artist", "Song"), ("Radio X", "Next")]
+        assert reader.connects == 1
+
+        late = []
+        unsubscribe_late = reader.subscribe(late.append)
+        assert late[0].title == "Next"
+
+        unsubscribe()
+        assert reader.running
+        unsubscribe_late()
+        assert not reader.running
+
+    @pytest.mark.asyncio
+    async def test_stream_without_metaint_stops(self):
+        """Streams without ICY metadata are not reconnected."""
+        session = _session([])
+        session.get.return_value.__aenter__.return_value.headers = {}
+        reader = IcyMetadataReader("http://radio/plain.mp3", reconnect_delay=0)
+
+        with _private_session(session):
+            reader.subscribe(MagicMock())
+            await asyncio.sleep(0.01)
+
+        assert not reader.running
+        assert session.get.call_count == 1
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_stream_ends(self):
+        """A dropped connection is re-established while listeners remain."""
+        session = _session([b"x" * 8 + _block("StreamTitle='Song';")])
+        reader = IcyMetadataReader("http://radio/stream", reconnect_delay=0)
+
+        with _private_session(session):
+            unsubscribe = reader.subscribe(MagicMock())
+            await asyncio.sleep(0.01)
+        unsubscribe()
+
+        assert session.get.call_count > 1
+
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_connection(self):
+        """Players on the same station share one reader (and its own session) until the last one leaves."""
+        release = asyncio.Event()
+        session = _session([b"x" * 8 + _block("StreamTitle='Song';")], release=release)
+        first, second = [], []
+
+        with _private_session(session) as create_session:
+            unsubscribe_first = subscribe_icy_metadata("http://radio/shared", first.append)
+            unsubscribe_second = subscribe_icy_metadata("http://radio/shared", second.append)
+            await asyncio.sleep(0.01)
+
+        create_session.assert_called_once_with()
+        assert session.get.call_count == 1
+        assert first[0].title == second[0].title == "Song"
+
+        unsubscribe_first()
+        unsubscribe_second()
+
+        from pywiim.player import icy
+
+        assert "http://radio/shared" not in icy._READERS
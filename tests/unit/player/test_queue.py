@@ -0,0 +1,214 @@
+"""Unit tests for paged queue browsing and the UpdateID-validated queue cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pywiim.player.queue import QueueCache
+
+
+def _didl(start, count):
+    """Build a DIDL-Lite queue page with count items starting at start."""
+    items = "".join(
+        f"<item><res>http://example.com/{index}.mp3</res><dc:title>Track {index}</dc:title></item>"
+        for index in range(start, start + count)
+    )
+    return (
+        '<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/" '
+        f'xmlns:dc="http://purl.org/dc/elements/1.1/">{items}</DIDL-Lite>'
+    )
+
+
+def _browser(total, update_id=1):
+    """Create a browse_queue stand-in for a queue of total tracks."""
+    state = {"update_id": update_id}
+
+    async def browse_queue(object_id="Q:0", starting_index=0, requested_count=0):
+        count = max(0, min(requested_count, total - starting_index))
+        return {
+            "Result": _didl(starting_index, count),
+            "NumberReturned": count,
+            "TotalMatches": total,
+            "UpdateID": state["update_id"],
+        }
+
+    return AsyncMock(side_effect=browse_queue), state
+
+
+class TestQueueCache:
+    """Test QueueCache class."""
+
+    def test_trust_rules(self):
+        """Snapshots expire with the TTL and when plicount disagrees."""
+        cache = QueueCache(page_size=2, ttl=60.0)
+        assert cache.is_trusted("Q:0") is False
+
+        assert cache.store_page("Q:0", 0, [{"position": 0}], update_id=1, total=3, now=100.0) is False
+        assert cache.is_trusted("Q:0", queue_count=3, now=120.0) is True
+        assert cache.is_trusted("Q:0", queue_count=4, now=120.0) is False
+        assert cache.is_trusted("Q:0", now=200.0) is False
+
+    def test_update_id_change_drops_pages(self):
+        """A new UpdateID discards the other cached pages; the same one keeps them."""
+        cache = QueueCache(page_size=2)
+        cache.store_page("Q:0", 0, [{"position": 0}], update_id=1, total=4)
+        cache.store_page("Q:0", 1, [{"position": 2}], update_id=1, total=4)
+
+        assert cache.store_page("Q:0", 0, [{"position": 0}], update_id=1, total=4) is False
+        assert cache.get_page("Q:0", 1) is not None
+
+        assert cache.store_page("Q:0", 0, [{"position": 0}], update_id=2, total=4) is True
+        assert cache.get_page("Q:0", 1) is None
+
+        cache.invalidate()
+        assert cache.statistics["queues"] == 0
+        assert cache.statistics["invalidations"] == 1
+
+    def test_cached_items_by_position_with_gaps(self):
+        """Items are found by their position field; positions skipped while parsing are left out."""
+        cache = QueueCache(page_size=4)
+        cache.store_page("Q:0", 0, [{"position": 0}, {"position": 2}, {"position": 3}], update_id=1, total=6)
+
+        assert cache.cached_items("Q:0", 2, 2) == [{"position": 2}, {"position": 3}]
+        assert cache.cached_items("Q:0", 0, 3) == [{"position": 0}, {"position": 2}]
+        assert cache.cached_items("Q:0", 1, 1) == []
+        # Page 1 is not cached
+        assert cache.cached_items("Q:0", 3, 3) == [{"position": 3}]
+
+
+class TestPlayerQueuePaging:
+    """Test Player.iter_queue() / get_queue(use_cache=True)."""
+
+    @staticmethod
+    def _player(mock_client, browse_queue, queue_count=None):
+        from pywiim.models import PlayerStatus
+        from pywiim.player import Player
+
+        upnp_client = MagicMock()
+        upnp_client.browse_queue = browse_queue
+        upnp_client.async_call_action = AsyncMock()
+        player = Player(mock_client, upnp_client=upnp_client)
+        player._status_model = PlayerStatus(queue_count=queue_count)
+        player._media_ctrl._queue_cache = QueueCache(page_size=10)
+        return player
+
+    @pytest.mark.asyncio
+    async def test_iter_queue_pages_and_caches(self, mock_client):
+        """Pages stream in order; a repaint is served without Browse requests."""
+        browse_queue, _ = _browser(total=25)
+        player = self._player(mock_client, browse_queue, queue_count=25)
+
+        pages = [page async for page in player.iter_queue()]
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert pages[2][-1]["position"] == 24
+        assert browse_queue.await_count == 3
+        assert browse_queue.await_args_list[1].kwargs == {
+            "object_id": "Q:0",
+            "starting_index": 10,
+            "requested_count": 10,
+        }
+
+        # Current track moved - queue contents unchanged, nothing re-browsed
+        player._status_model.queue_position = 7
+        repaint = [item async for page in player.iter_queue() for item in page]
+        assert len(repaint) == 25
+        assert browse_queue.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_revalidation_reuses_pages_with_same_update_id(self, mock_client):
+        """An untrusted snapshot re-browses one page and keeps the rest if UpdateID matches."""
+        browse_queue, state = _browser(total=25)
+        player = self._player(mock_client, browse_queue)
+        player._media_ctrl._queue_cache.ttl = 0.0  # Always revalidate
+
+        await player.get_queue(use_cache=True)
+        assert browse_queue.await_count == 3
+
+        items = await player.get_queue(use_cache=True)
+        assert len(items) == 25
+        assert browse_queue.await_count == 4  # First page only
+
+        state["update_id"] = 2
+        await player.get_queue(use_cache=True)
+        assert browse_queue.await_count == 7  # Queue changed - all pages re-browsed
+
+    @pytest.mark.asyncio
+    async def test_get_queue_cached_range_and_invalidation(self, mock_client):
+        """Cached ranges only browse the pages they need; queue commands clear the cache."""
+        browse_queue, _ = _browser(total=25)
+        player = self._player(mock_client, browse_queue, queue_count=25)
+
+        items = await player.get_queue(starting_index=12, requested_count=5, use_cache=True)
+
+        assert [item["position"] for item in items] == [12, 13, 14, 15, 16]
+        assert browse_queue.await_count == 1
+
+        await player.add_to_queue("http://example.com/new.mp3")
+        await player.get_queue(starting_index=12, requested_count=5, use_cache=True)
+        assert browse_queue.await_count == 2
+
+    def test_upcoming_queue_items_from_cache_only(self, mock_client):
+        """Upcoming items come from cached pages; plicurr is matched against the current title."""
+        browse_queue, _ = _browser(total=25)
+        player = self._player(mock_client, browse_queue, queue_count=25)
+        media = player._media_ctrl
+        player._status_model.queue_position = 3
+        assert media.upcoming_queue_items(2) == []
+
+        media._queue_cache.store_page("Q:0", 0, media._parse_queue_items(_didl(0, 10)), update_id=1, total=25)
+
+        assert [item["position"] for item in media.upcoming_queue_items(2)] == [3, 4]
+        assert [item["position"] for item in media.upcoming_queue_items(2, current_title="Track 3")] == [4, 5]
+        assert [item["position"] for item in media.upcoming_queue_items(9)] == [3, 4, 5, 6, 7, 8, 9]
+        browse_queue.assert_not_awaited()
+
+
+class TestQueueStreaming:
+    """Test incremental DIDL-Lite queue parsing."""
+
+    @pytest.mark.asyncio
+    async def test_stream_queue_yields_items_incrementally(self, mock_client):
+        """Items are yielded one by one with absolute positions; parsed items leave the tree."""
+        from pywiim.player import Player
+
+        browse_queue, _ = _browser(total=120)
+        upnp_client = MagicMock()
+        upnp_client.browse_queue = browse_queue
+        player = Player(mock_client, upnp_client=upnp_client)
+
+        stream = player.stream_queue(starting_index=0, requested_count=120)
+        first = await anext(stream)
+        assert first["position"] == 0
+        assert first["title"] == "Track 0"
+
+        rest = [item async for item in stream]
+        assert len(rest) == 119
+        assert rest[-1]["media_content_id"] == "http://example.com/119.mp3"
+        assert rest[-1]["position"] == 119
+
+    def test_iter_queue_items_matches_full_parse_and_skips_uriless(self, mock_client):
+        """Streaming and list parsing agree; items without a URI keep their slot."""
+        from pywiim.player import Player
+
+        didl = _didl(0, 2).replace("</DIDL-Lite>", "<item><dc:title>No URI</dc:title></item></DIDL-Lite>")
+        didl = didl.replace("</DIDL-Lite>", "<item><res>http://example.com/last.mp3</res></item></DIDL-Lite>")
+        media = Player(mock_client)._media_ctrl
+
+        streamed = list(media._iter_queue_items(didl, starting_index=5))
+
+        assert [item["position"] for item in streamed] == [5, 6, 8]
+        assert media._extract_queue_items(didl) == list(media._iter_queue_items(didl))
+
+    @pytest.mark.asyncio
+    async def test_stream_queue_stops_at_malformed_xml(self, mock_client):
+        """Items before malformed XML are still delivered."""
+        from pywiim.player import Player
+
+        upnp_client = MagicMock()
+        upnp_client.browse_queue = AsyncMock(return_value={"Result": _didl(0, 3).replace("</DIDL-Lite>", "<item>")})
+        player = Player(mock_client, upnp_client=upnp_client)
+
+        items = [item async for item in player.stream_queue()]
+
+        assert len(items) == 3
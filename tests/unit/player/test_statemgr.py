@@ -27,6 +27,7 @@ class TestStateManager:
         player._state_synchronizer = MagicMock()
         player._state_synchronizer.update_from_upnp = MagicMock()
         player._state_synchronizer.get_merged_state = MagicMock(return_value={})
+        player._state_synchronizer.fresh_upnp_values = MagicMock(return_value={})
         player._on_state_changed = None
         player._group = None
         # Set up coverart manager (now used for track change detection)
@@ -268,6 +269,40 @@ class TestStateManager:
         assert call_args["volume"] == 75
         assert call_args["muted"] is True
 
+    @pytest.mark.asyncio
+    async def test_refresh_skips_upnp_reads_when_events_fresh(self, state_manager, mock_player):
+        """Recent RenderingControl events replace GetVolume/GetMute polling."""
+        mock_status = PlayerStatus(play_state="play", volume=50)
+        mock_player.client.get_player_status_model = AsyncMock(return_value=mock_status)
+        TestStateManager._setup_refresh_mocks(mock_player, state_manager)
+        mock_player._upnp_client = MagicMock()
+        mock_player._upnp_client.rendering_control = MagicMock()
+        mock_player._upnp_client.get_volume = AsyncMock(return_value=75)
+        mock_player._upnp_client.get_mute = AsyncMock(return_value=True)
+        mock_player._state_synchronizer.fresh_upnp_values.return_value = {"volume": 40}
+
+        with patch("pywiim.player.groupops.GroupOperations") as mock_groupops:
+            mock_groupops.return_value._synchronize_group_state = AsyncMock()
+
+            await state_manager.refresh(full=False)
+
+        # Volume comes from the event; only mute is read
+        mock_player._upnp_client.get_volume.assert_not_awaited()
+        mock_player._upnp_client.get_mute.assert_awaited_once()
+        call_args = mock_player._state_synchronizer.update_from_http.call_args[0][0]
+        assert call_args["volume"] == 40
+        assert call_args["muted"] is True
+
+        mock_player._state_synchronizer.fresh_upnp_values.return_value = {"volume": 40, "muted": False}
+        mock_player._upnp_client.get_mute.reset_mock()
+        with patch("pywiim.player.groupops.GroupOperations") as mock_groupops:
+            mock_groupops.return_value._synchronize_group_state = AsyncMock()
+
+            await state_manager.refresh(full=False)
+
+        mock_player._upnp_client.get_volume.assert_not_awaited()
+        mock_player._upnp_client.get_mute.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_refresh_upnp_volume_fails_fallback(self, state_manager, mock_player):
         """Test refresh when UPnP volume fails, falls back to HTTP."""
@@ -417,6 +452,49 @@ class TestStateManager:
 
         mock_player.client.get_bluetooth_history.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_refresh_batches_configuration_tiers(self, state_manager, mock_player):
+        """Test batching mode pulls due-soon tiers into the same refresh pass."""
+        mock_status = PlayerStatus(play_state="stop")
+        mock_player.client.get_player_status_model = AsyncMock(return_value=mock_status)
+        TestStateManager._setup_refresh_mocks(mock_player, state_manager)
+        type(mock_player.client).capabilities = PropertyMock(
+            return_value={"supports_eq": True, "supports_presets": True, "supports_subwoofer": False}
+        )
+        now = time.monotonic()
+        mock_player._last_bt_history_check = now - 61  # Due
+        mock_player._last_eq_presets_check = now - 55  # Due soon (within 20% window)
+        mock_player._last_eq_status_check = now - 55  # Due soon
+        mock_player._last_presets_check = now - 5  # Not due
+        mock_player._eq_presets = ["flat"]
+        mock_player._metadata = {"metaData": {}}
+        mock_player.client.get_bluetooth_history = AsyncMock(return_value=[])
+        mock_player.client.get_eq_presets = AsyncMock(return_value=["flat"])
+        mock_player.client.get_eq_status = AsyncMock(return_value=True)
+        mock_player.client.get_presets = AsyncMock(return_value=[])
+        mock_player._coverart_mgr.check_track_changed = MagicMock(return_value=False)
+        state_manager.batch_periodic_fetches = True
+
+        with patch("pywiim.player.groupops.GroupOperations") as mock_groupops:
+            mock_groupops.return_value._synchronize_group_state = AsyncMock()
+
+            await state_manager.refresh(full=False)
+
+        mock_player.client.get_bluetooth_history.assert_called_once()
+        mock_player.client.get_eq_presets.assert_called_once()
+        mock_player.client.get_eq_status.assert_called_once()
+        mock_player.client.get_presets.assert_not_called()
+
+    def test_select_batched_tiers_disabled_by_default(self, state_manager, mock_player):
+        """Test batching is opt-in."""
+        from pywiim.polling import PollingStrategy
+
+        state_manager._polling_strategy = PollingStrategy({})
+        mock_player._last_bt_history_check = 0
+
+        assert state_manager.batch_periodic_fetches is False
+        assert state_manager._select_batched_tiers(False, time.monotonic()) == set()
+
     @pytest.mark.asyncio
     async def test_refresh_error_handling(self, state_manager, mock_player):
         """Test refresh error handling."""
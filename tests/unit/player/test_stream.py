@@ -1,6 +1,7 @@
 """Unit tests for stream metadata extraction.
 
-Tests Icecast, HLS, M3U/PLS parsing, and URL resolution.
+Tests Icecast metadata, stream titles and get_stream_metadata(); HLS and URL
+resolution are covered in test_hls.py and test_streamurl.py.
 """
 
 from __future__ import annotations
@@ -13,13 +14,8 @@ import pytest
 from pywiim.player.stream import (
     StreamMetadata,
     _decode_text,
-    _extract_station_name_from_url,
-    _fetch_hls_metadata,
     _fetch_icecast_metadata,
-    _parse_m3u,
-    _parse_pls,
     _parse_stream_title,
-    _resolve_stream_url,
     get_stream_metadata,
 )
 
@@ -38,11 +34,11 @@ class TestGetStreamMetadata:
         """Test get_stream_metadata with HLS URL."""
         url = "https://example.com/stream.m3u8"
 
-        with patch("pywiim.player.stream.m3u8") as mock_m3u8:
+        with patch("pywiim.player.hls.m3u8") as mock_m3u8:
             mock_m3u8.loads.return_value.is_variant = False
             mock_m3u8.loads.return_value.segments = []
-            with patch("pywiim.player.stream._fetch_hls_metadata", return_value=None):
-                with patch("pywiim.player.stream._resolve_stream_url", return_value=url):
+            with patch("pywiim.player.hls._fetch_hls_metadata", return_value=None):
+                with patch("pywiim.player.streamurl._resolve_stream_url", return_value=url):
                     with patch("pywiim.player.stream._fetch_icecast_metadata", return_value=StreamMetadata()):
                         result = await get_stream_metadata(url)
 
@@ -60,7 +56,7 @@ class TestGetStreamMetadata:
             mock_session.close = AsyncMock()
             mock_session_class.return_value = mock_session
 
-            with patch("pywiim.player.stream._resolve_stream_url", return_value=url):
+            with patch("pywiim.player.streamurl._resolve_stream_url", return_value=url):
                 with patch("pywiim.player.stream._fetch_icecast_metadata", return_value=None):
                     await get_stream_metadata(url)
 
@@ -72,7 +68,7 @@ class TestGetStreamMetadata:
         url = "https://example.com/stream.mp3"
         mock_session = MagicMock()
 
-        with patch("pywiim.player.stream._resolve_stream_url", return_value=url):
+        with patch("pywiim.player.streamurl._resolve_stream_url", return_value=url):
             with patch("pywiim.player.stream._fetch_icecast_metadata", return_value=None):
                 result = await get_stream_metadata(url, session=mock_session)
 
@@ -80,190 +76,6 @@ class TestGetStreamMetadata:
                 assert result is None
 
 
-class TestResolveStreamUrl:
-    """Test _resolve_stream_url function."""
-
-    @pytest.mark.asyncio
-    async def test_direct_url(self):
-        """Test _resolve_stream_url with direct URL."""
-        url = "https://example.com/stream.mp3"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200  # Not a redirect
-        mock_response.headers = {}  # No Location header
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.head = MagicMock(return_value=mock_response)
-
-        result = await _resolve_stream_url(url, mock_session)
-
-        assert result == url
-
-    @pytest.mark.asyncio
-    async def test_redirect(self):
-        """Test _resolve_stream_url follows redirects."""
-        url1 = "https://example.com/redirect"
-        url2 = "https://example.com/stream.mp3"
-        mock_session = MagicMock()
-        mock_response1 = MagicMock()
-        mock_response1.status = 302
-        mock_response1.headers = {"Location": url2}
-        mock_response1.__aenter__ = AsyncMock(return_value=mock_response1)
-        mock_response1.__aexit__ = AsyncMock(return_value=None)
-        mock_response2 = MagicMock()
-        mock_response2.status = 200
-        mock_response2.headers = {}
-        mock_response2.__aenter__ = AsyncMock(return_value=mock_response2)
-        mock_response2.__aexit__ = AsyncMock(return_value=None)
-        mock_session.head = MagicMock(side_effect=[mock_response1, mock_response2])
-
-        result = await _resolve_stream_url(url1, mock_session)
-
-        assert result == url2
-
-    @pytest.mark.asyncio
-    async def test_m3u_playlist(self):
-        """Test _resolve_stream_url parses M3U playlist."""
-        url = "https://example.com/playlist.m3u"
-        mock_session = MagicMock()
-
-        with patch("pywiim.player.stream._parse_m3u", return_value="https://example.com/stream.mp3"):
-            result = await _resolve_stream_url(url, mock_session)
-
-            assert result == "https://example.com/stream.mp3"
-
-    @pytest.mark.asyncio
-    async def test_pls_playlist(self):
-        """Test _resolve_stream_url parses PLS playlist."""
-        url = "https://example.com/playlist.pls"
-        mock_session = MagicMock()
-
-        with patch("pywiim.player.stream._parse_pls", return_value="https://example.com/stream.mp3"):
-            result = await _resolve_stream_url(url, mock_session)
-
-            assert result == "https://example.com/stream.mp3"
-
-    @pytest.mark.asyncio
-    async def test_max_hops(self):
-        """Test _resolve_stream_url limits redirect hops."""
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 302
-        mock_response.headers = {"Location": "https://example.com/redirect2"}
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.head = MagicMock(return_value=mock_response)
-
-        result = await _resolve_stream_url("https://example.com/redirect1", mock_session)
-
-        # Should stop after max hops
-        assert result is not None
-
-
-class TestParseM3U:
-    """Test _parse_m3u function."""
-
-    @pytest.mark.asyncio
-    async def test_parse_m3u_success(self):
-        """Test _parse_m3u parses valid M3U playlist."""
-        url = "https://example.com/playlist.m3u"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="#EXTM3U\nhttps://example.com/stream.mp3\n")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.get = MagicMock(return_value=mock_response)
-
-        result = await _parse_m3u(url, mock_session)
-
-        assert result == "https://example.com/stream.mp3"
-
-    @pytest.mark.asyncio
-    async def test_parse_m3u_skips_hls(self):
-        """Test _parse_m3u skips HLS playlists."""
-        url = "https://example.com/playlist.m3u8"
-        mock_session = MagicMock()
-
-        result = await _parse_m3u(url, mock_session)
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_parse_m3u_no_stream_url(self):
-        """Test _parse_m3u returns None if no stream URL found."""
-        url = "https://example.com/playlist.m3u"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="#EXTM3U\n# Comment only\n")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.get = MagicMock(return_value=mock_response)
-
-        result = await _parse_m3u(url, mock_session)
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_parse_m3u_error(self):
-        """Test _parse_m3u handles errors."""
-        url = "https://example.com/playlist.m3u"
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Network error"))
-
-        result = await _parse_m3u(url, mock_session)
-
-        assert result is None
-
-
-class TestParsePls:
-    """Test _parse_pls function."""
-
-    @pytest.mark.asyncio
-    async def test_parse_pls_success(self):
-        """Test _parse_pls parses valid PLS playlist."""
-        url = "https://example.com/playlist.pls"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="[playlist]\nFile1=https://example.com/stream.mp3\n")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.get = MagicMock(return_value=mock_response)
-
-        result = await _parse_pls(url, mock_session)
-
-        assert result == "https://example.com/stream.mp3"
-
-    @pytest.mark.asyncio
-    async def test_parse_pls_no_stream_url(self):
-        """Test _parse_pls returns None if no stream URL found."""
-        url = "https://example.com/playlist.pls"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="[playlist]\nTitle1=Test\n")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.get = MagicMock(return_value=mock_response)
-
-        result = await _parse_pls(url, mock_session)
-
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_parse_pls_error(self):
-        """Test _parse_pls handles errors."""
-        url = "https://example.com/playlist.pls"
-        mock_session = MagicMock()
-        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Network error"))
-
-        result = await _parse_pls(url, mock_session)
-
-        assert result is None
-
-
 class TestFetchIcecastMetadata:
     """Test _fetch_icecast_metadata function."""
 
@@ -375,54 +187,6 @@ class TestParseStreamTitle:
         assert metadata.artist is None
 
 
-class TestExtractStationNameFromUrl:
-    """Test _extract_station_name_from_url function."""
-
-    def test_radio_canada_premiere(self):
-        """Test Radio-Canada ICI Première pattern."""
-        url = "https://example.com/rcavliveaudio/P-2QMTL0_MTL"
-        result = _extract_station_name_from_url(url)
-
-        assert result.station_name == "Radio-Canada ICI Première Montréal"
-
-    def test_radio_canada_musique(self):
-        """Test Radio-Canada ICI Musique pattern."""
-        # The pattern checks for "radio-canada" in url.lower() OR "rcavliveaudio" in url
-        # Then checks if "ICI_MUSIQUE" in url.upper()
-        url = "https://example.com/radio-canada/stream/ICI_MUSIQUE/playlist.m3u8"
-        result = _extract_station_name_from_url(url)
-
-        assert result.station_name == "Radio-Canada ICI Musique"
-
-    def test_bbc_radio_one(self):
-        """Test BBC Radio 1 pattern."""
-        url = "https://example.com/bbc/radio_one"
-        result = _extract_station_name_from_url(url)
-
-        assert result.station_name == "BBC Radio 1"
-
-    def test_bbc_radio_two(self):
-        """Test BBC Radio 2 pattern."""
-        url = "https://example.com/bbc/radio_two"
-        result = _extract_station_name_from_url(url)
-
-        assert result.station_name == "BBC Radio 2"
-
-    def test_cbc_radio_one(self):
-        """Test CBC Radio One pattern."""
-        url = "https://example.com/cbc/CBCR1"
-        result = _extract_station_name_from_url(url)
-
-        assert result.station_name == "CBC Radio One"
-
-    def test_unknown_url(self):
-        """Test unknown URL returns empty metadata."""
-        url = "https://example.com/unknown"
-        result = _extract_station_name_from_url(url)
-
-        assert result.station_name is None
-
-
 class TestDecodeText:
     """Test _decode_text function."""
 
@@ -449,72 +213,3 @@ class TestDecodeText:
         result = _decode_text(invalid_bytes)
         # Should not raise, returns string representation
         assert isinstance(result, str)
-
-
-class TestFetchHlsMetadata:
-    """Test _fetch_hls_metadata function."""
-
-    @pytest.mark.asyncio
-    async def test_m3u8_not_available(self):
-        """Test _fetch_hls_metadata returns None if m3u8 not available."""
-        with patch("pywiim.player.stream.m3u8", None):
-            result = await _fetch_hls_metadata("https://example.com/stream.m3u8", MagicMock(), timeout=5)
-            assert result is None
-
-    @pytest.mark.asyncio
-    async def test_mutagen_not_available(self):
-        """Test _fetch_hls_metadata returns None if mutagen not available."""
-        with patch("pywiim.player.stream.m3u8", MagicMock()):
-            with patch("pywiim.player.stream.MutagenFile", None):
-                result = await _fetch_hls_metadata("https://example.com/stream.m3u8", MagicMock(), timeout=5)
-                assert result is None
-
-    @pytest.mark.asyncio
-    async def test_master_playlist(self):
-        """Test _fetch_hls_metadata handles master playlists."""
-        url = "https://example.com/master.m3u8"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="#EXTM3U\n#EXT-X-STREAM-INF\nvariant.m3u8\n")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.get = MagicMock(return_value=mock_response)
-
-        mock_m3u8 = MagicMock()
-        mock_playlist = MagicMock()
-        mock_playlist.is_variant = True
-        mock_playlist.playlists = [MagicMock(uri="variant.m3u8")]
-        mock_m3u8.loads.return_value = mock_playlist
-
-        with patch("pywiim.player.stream.m3u8", mock_m3u8):
-            with patch("pywiim.player.stream._fetch_hls_metadata", return_value=StreamMetadata()) as mock_recursive:
-                await _fetch_hls_metadata(url, mock_session, timeout=5)
-
-                # Should recursively call for variant
-                assert mock_recursive.called
-
-    @pytest.mark.asyncio
-    async def test_no_segments(self):
-        """Test _fetch_hls_metadata handles playlists with no segments."""
-        url = "https://example.com/stream.m3u8"
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="#EXTM3U\n")
-        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
-        mock_response.__aexit__ = AsyncMock(return_value=None)
-        mock_session.get = MagicMock(return_value=mock_response)
-
-        mock_m3u8 = MagicMock()
-        mock_playlist = MagicMock()
-        mock_playlist.is_variant = False
-        mock_playlist.segments = []
-        mock_m3u8.loads.return_value = mock_playlist
-
-        with patch("pywiim.player.stream.m3u8", mock_m3u8):
-            with patch("pywiim.player.stream._extract_station_name_from_url", return_value=StreamMetadata()):
-                result = await _fetch_hls_metadata(url, mock_session, timeout=5)
-
-                # Should try URL extraction
-                assert result is not None or result is None  # Either is valid
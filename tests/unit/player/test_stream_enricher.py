@@ -238,3 +238,59 @@ class TestStreamEnricher:
         call_args = mock_player._state_synchronizer.update_from_http.call_args
         update_dict = call_args[0][0]
         assert update_dict["artist"] == "Radio Station"
+
+    @pytest.mark.asyncio
+    async def test_live_metadata_follows_title_changes(self, stream_enricher, mock_player):
+        """With live_metadata, ICY title changes are applied and the reader is released on pause."""
+        from pywiim.player.stream import StreamMetadata
+
+        url = "http://example.com/radio.mp3"
+        unsubscribe = MagicMock()
+        mock_player._on_state_changed = MagicMock()
+        stream_enricher.live_metadata = True
+
+        with (
+            patch("pywiim.player.stream_enricher.get_stream_metadata", return_value=None),
+            patch("pywiim.player.stream_enricher.subscribe_icy_metadata", return_value=unsubscribe) as subscribe,
+        ):
+            await stream_enricher.enrich_if_needed(PlayerStatus(source="wifi", title=url, play_state="play"))
+            await stream_enricher._enrichment_task
+
+            assert subscribe.call_args[0][0] == url
+            listener = subscribe.call_args[0][1]
+            listener(StreamMetadata(title="Song", artist="Artist"))
+
+            mock_player._state_synchronizer.update_from_http.assert_called_with({"title": "Song", "artist": "Artist"})
+            mock_player._on_state_changed.assert_called_once()
+
+            await stream_enricher.enrich_if_needed(PlayerStatus(source="wifi", title=url, play_state="play"))
+            assert subscribe.call_count == 1
+
+            await stream_enricher.enrich_if_needed(PlayerStatus(source="wifi", title=url, play_state="pause"))
+            unsubscribe.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_live_metadata_released_on_new_source_and_close(self, mock_player):
+        """The reader is released when real metadata replaces the URL title and when the player closes."""
+        url = "http://example.com/radio.mp3"
+        unsubscribes = [MagicMock(), MagicMock(), MagicMock()]
+        enricher = mock_player._state_mgr._stream_enricher
+        mock_player.live_metadata = True
+        assert enricher.live_metadata
+
+        with (
+            patch("pywiim.player.stream_enricher.get_stream_metadata", return_value=None),
+            patch("pywiim.player.stream_enricher.subscribe_icy_metadata", side_effect=unsubscribes),
+        ):
+            await enricher.enrich_if_needed(PlayerStatus(source="wifi", title=url, play_state="play"))
+            await enricher.enrich_if_needed(PlayerStatus(source="wifi", title="Other Song", play_state="play"))
+            unsubscribes[0].assert_called_once()
+
+            await enricher.enrich_if_needed(PlayerStatus(source="wifi", title=url, play_state="play"))
+            await mock_player.close()
+            unsubscribes[1].assert_called_once()
+            assert enricher._enrichment_task is None
+
+            await enricher.enrich_if_needed(PlayerStatus(source="wifi", title=url, play_state="play"))
+            mock_player.live_metadata = False
+            unsubscribes[2].assert_called_once()
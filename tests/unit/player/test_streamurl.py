@@ -0,0 +1,246 @@
+"""Unit tests for stream URL resolution (redirects, M3U/PLS playlists and the resolution cache)."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from pywiim.player.streamurl import (
+    _RESOLVED_URL_CACHE,
+    STREAM_URL_NEGATIVE_TTL,
+    _parse_m3u,
+    _parse_pls,
+    _resolve_stream_url,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_resolved_urls():
+    """Start every test without resolved URLs."""
+    _RESOLVED_URL_CACHE.clear()
+    yield
+    _RESOLVED_URL_CACHE.clear()
+
+
+class TestResolveStreamUrl:
+    """Test _resolve_stream_url function."""
+
+    @pytest.mark.asyncio
+    async def test_direct_url(self):
+        """Test _resolve_stream_url with direct URL."""
+        url = "https://example.com/stream.mp3"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200  # Not a redirect
+        mock_response.headers = {}  # No Location header
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.head = MagicMock(return_value=mock_response)
+
+        result = await _resolve_stream_url(url, mock_session)
+
+        assert result == url
+
+    @pytest.mark.asyncio
+    async def test_redirect(self):
+        """Test _resolve_stream_url follows redirects."""
+        url1 = "https://example.com/redirect"
+        url2 = "https://example.com/stream.mp3"
+        mock_session = MagicMock()
+        mock_response1 = MagicMock()
+        mock_response1.status = 302
+        mock_response1.headers = {"Location": url2}
+        mock_response1.__aenter__ = AsyncMock(return_value=mock_response1)
+        mock_response1.__aexit__ = AsyncMock(return_value=None)
+        mock_response2 = MagicMock()
+        mock_response2.status = 200
+        mock_response2.headers = {}
+        mock_response2.__aenter__ = AsyncMock(return_value=mock_response2)
+        mock_response2.__aexit__ = AsyncMock(return_value=None)
+        mock_session.head = MagicMock(side_effect=[mock_response1, mock_response2])
+
+        result = await _resolve_stream_url(url1, mock_session)
+
+        assert result == url2
+
+    @pytest.mark.asyncio
+    async def test_m3u_playlist(self):
+        """Test _resolve_stream_url parses M3U playlist."""
+        url = "https://example.com/playlist.m3u"
+        mock_session = MagicMock()
+
+        with patch("pywiim.player.streamurl._parse_m3u", return_value="https://example.com/stream.mp3"):
+            result = await _resolve_stream_url(url, mock_session)
+
+            assert result == "https://example.com/stream.mp3"
+
+    @pytest.mark.asyncio
+    async def test_pls_playlist(self):
+        """Test _resolve_stream_url parses PLS playlist."""
+        url = "https://example.com/playlist.pls"
+        mock_session = MagicMock()
+
+        with patch("pywiim.player.streamurl._parse_pls", return_value="https://example.com/stream.mp3"):
+            result = await _resolve_stream_url(url, mock_session)
+
+            assert result == "https://example.com/stream.mp3"
+
+    @pytest.mark.asyncio
+    async def test_max_hops(self):
+        """Test _resolve_stream_url limits redirect hops."""
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 302
+        mock_response.headers = {"Location": "https://example.com/redirect2"}
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.head = MagicMock(return_value=mock_response)
+
+        result = await _resolve_stream_url("https://example.com/redirect1", mock_session)
+
+        # Should stop after max hops
+        assert result is not None
+
+    @pytest.mark.asyncio
+    async def test_resolution_is_cached(self):
+        """Switching back to a station reuses the resolved URL; failures are cached for a shorter time."""
+        mock_session = MagicMock()
+
+        with patch("pywiim.player.streamurl._parse_pls", return_value="https://example.com/stream.mp3") as parse_pls:
+            assert await _resolve_stream_url("https://example.com/fav.pls", mock_session) == (
+                "https://example.com/stream.mp3"
+            )
+            assert await _resolve_stream_url("https://example.com/fav.pls", mock_session) == (
+                "https://example.com/stream.mp3"
+            )
+        assert parse_pls.await_count == 1
+
+        with patch("pywiim.player.streamurl._parse_m3u", return_value=None) as parse_m3u:
+            assert await _resolve_stream_url("https://example.com/empty.m3u", mock_session) == (
+                "https://example.com/empty.m3u"
+            )
+            await _resolve_stream_url("https://example.com/empty.m3u", mock_session)
+        assert parse_m3u.await_count == 1
+
+        # Negative results expire first
+        later = time.monotonic() + STREAM_URL_NEGATIVE_TTL
+        assert _RESOLVED_URL_CACHE.get("https://example.com/fav.pls", later) == "https://example.com/stream.mp3"
+        assert _RESOLVED_URL_CACHE.get("https://example.com/empty.m3u", later) is None
+
+    def test_cache_size_bound(self):
+        """The oldest resolution is dropped when the cache is full."""
+        from pywiim.player.streamurl import _ResolvedUrlCache
+
+        cache = _ResolvedUrlCache(max_entries=2)
+        for index in range(3):
+            cache.put(f"http://example.com/{index}.pls", f"http://example.com/{index}.mp3", True, now=0.0)
+
+        assert cache.get("http://example.com/0.pls", now=1.0) is None
+        assert cache.get("http://example.com/2.pls", now=1.0) == "http://example.com/2.mp3"
+
+
+class TestParseM3U:
+    """Test _parse_m3u function."""
+
+    @pytest.mark.asyncio
+    async def test_parse_m3u_success(self):
+        """Test _parse_m3u parses valid M3U playlist."""
+        url = "https://example.com/playlist.m3u"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="#EXTM3U\nhttps://example.com/stream.mp3\n")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        result = await _parse_m3u(url, mock_session)
+
+        assert result == "https://example.com/stream.mp3"
+
+    @pytest.mark.asyncio
+    async def test_parse_m3u_skips_hls(self):
+        """Test _parse_m3u skips HLS playlists."""
+        url = "https://example.com/playlist.m3u8"
+        mock_session = MagicMock()
+
+        result = await _parse_m3u(url, mock_session)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_parse_m3u_no_stream_url(self):
+        """Test _parse_m3u returns None if no stream URL found."""
+        url = "https://example.com/playlist.m3u"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="#EXTM3U\n# Comment only\n")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        result = await _parse_m3u(url, mock_session)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_parse_m3u_error(self):
+        """Test _parse_m3u handles errors."""
+        url = "https://example.com/playlist.m3u"
+        mock_session = MagicMock()
+        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Network error"))
+
+        result = await _parse_m3u(url, mock_session)
+
+        assert result is None
+
+
+class TestParsePls:
+    """Test _parse_pls function."""
+
+    @pytest.mark.asyncio
+    async def test_parse_pls_success(self):
+        """Test _parse_pls parses valid PLS playlist."""
+        url = "https://example.com/playlist.pls"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="[playlist]\nFile1=https://example.com/stream.mp3\n")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        result = await _parse_pls(url, mock_session)
+
+        assert result == "https://example.com/stream.mp3"
+
+    @pytest.mark.asyncio
+    async def test_parse_pls_no_stream_url(self):
+        """Test _parse_pls returns None if no stream URL found."""
+        url = "https://example.com/playlist.pls"
+        mock_session = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.text = AsyncMock(return_value="[playlist]\nTitle1=Test\n")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = MagicMock(return_value=mock_response)
+
+        result = await _parse_pls(url, mock_session)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_parse_pls_error(self):
+        """Test _parse_pls handles errors."""
+        url = "https://example.com/playlist.pls"
+        mock_session = MagicMock()
+        mock_session.get = MagicMock(side_effect=aiohttp.ClientError("Network error"))
+
+        result = await _parse_pls(url, mock_session)
+
+        assert result is None
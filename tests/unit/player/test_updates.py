@@ -0,0 +1,124 @@
+"""Unit tests for async state update streams.
+
+Tests StateUpdateQueue coalescing, Player.updates() and fleet_updates().
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from pywiim.models import PlayerStatus
+
+
+class TestStateUpdateQueue:
+    """Test StateUpdateQueue class."""
+
+    @pytest.fixture
+    def player(self):
+        """Create a minimal player stand-in."""
+        player = MagicMock()
+        player.host = "192.168.1.100"
+        return player
+
+    async def test_coalesces_per_field(self, player):
+        """Pending changes for the same field keep oldest old and newest new."""
+        from pywiim.player.updates import StateUpdateQueue
+
+        queue = StateUpdateQueue()
+        queue.put(player, {"volume_level": (0.1, 0.2)})
+        queue.put(player, {"volume_level": (0.2, 0.3), "is_muted": (False, True)})
+
+        update = await queue.get()
+
+        assert update.player is player
+        assert update.changes == {"volume_level": (0.1, 0.3), "is_muted": (False, True)}
+        assert len(queue) == 0
+
+    async def test_field_reverted_is_dropped(self, player):
+        """A field that returns to its original value is not reported."""
+        from pywiim.player.updates import StateUpdateQueue
+
+        queue = StateUpdateQueue()
+        queue.put(player, {"is_muted": (False, True)})
+        queue.put(player, {"is_muted": (True, False)})
+
+        assert len(queue) == 0
+
+    def test_drop_oldest_when_full(self):
+        """Oldest pending player is dropped when maxsize is exceeded."""
+        from pywiim.player.updates import StateUpdateQueue
+
+        queue = StateUpdateQueue(maxsize=2)
+        players = [MagicMock(host=f"10.0.0.{i}") for i in range(3)]
+        for player in players:
+            queue.put(player, {"play_state": ("stop", "play")})
+
+        assert len(queue) == 2
+        assert queue.dropped == 1
+        assert players[0] not in queue._pending
+
+    def test_field_filter(self, player):
+        """Excluded fields are never queued."""
+        from pywiim.player.updates import StateUpdateQueue
+
+        queue = StateUpdateQueue(exclude=["media_position"])
+        queue.put(player, {"media_position": (1, 2)})
+
+        assert len(queue) == 0
+
+    def test_invalid_arguments(self):
+        """Invalid maxsize or unknown fields raise ValueError."""
+        from pywiim.player.updates import StateUpdateQueue
+
+        with pytest.raises(ValueError):
+            StateUpdateQueue(maxsize=0)
+        with pytest.raises(ValueError, match="Unknown state field"):
+            StateUpdateQueue(fields=["bogus"])
+
+
+class TestUpdateStreams:
+    """Test Player.updates() and fleet_updates()."""
+
+    @pytest.fixture
+    def player(self, mock_client):
+        """Create a Player with a populated status model."""
+        from pywiim.player import Player
+
+        player = Player(mock_client)
+        player._status_model = PlayerStatus(play_state="play", volume=30, title="Song A")
+        player._state_synchronizer.update_from_http({"play_state": "play", "volume": 30, "title": "Song A"})
+        return player
+
+    async def test_player_updates_stream(self, player):
+        """Player.updates() yields coalesced diffs."""
+        stream = player.updates(fields=["volume_level"])
+        next_update = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+
+        player._state_synchronizer.update_from_http({"volume": 40})
+        player._on_state_changed()
+        player._state_synchronizer.update_from_http({"volume": 50})
+        player._on_state_changed()
+
+        assert await asyncio.wait_for(next_update, 1) == {"volume_level": (0.3, 0.5)}
+        await stream.aclose()
+        assert player._change_notifier.has_subscribers is False
+
+    async def test_fleet_updates_stream(self, player):
+        """fleet_updates() yields PlayerUpdate events from any player."""
+        from pywiim.player import fleet_updates
+        from pywiim.player.changes import StateChangeNotifier
+
+        stream = fleet_updates(fields=["media_title"])
+        next_update = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+
+        player._state_synchronizer.update_from_http({"title": "Song B"})
+        player._on_state_changed()
+
+        update = await asyncio.wait_for(next_update, 1)
+        assert update.player is player
+        assert update.changes == {"media_title": ("Song A", "Song B")}
+        await stream.aclose()
+        assert not StateChangeNotifier._fleet_queues
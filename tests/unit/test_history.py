@@ -0,0 +1,130 @@
+"""Unit tests for state history ring buffer.
+
+Tests StateHistory recording, wraparound and StateSynchronizer integration.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from pywiim.history import StateHistory
+from pywiim.state import StateSynchronizer, SynchronizedState, TimestampedField
+
+
+def _state(play_state="play", volume=50, source="wifi", title="Song", source_name="http"):
+    """Build a SynchronizedState with the given values."""
+    now = time.monotonic()
+    state = SynchronizedState()
+    state.play_state = TimestampedField(value=play_state, source=source_name, timestamp=now)
+    state.volume = TimestampedField(value=volume, source=source_name, timestamp=now)
+    state.muted = TimestampedField(value=False, source=source_name, timestamp=now)
+    state.source = TimestampedField(value=source, source=source_name, timestamp=now)
+    state.title = TimestampedField(value=title, source=source_name, timestamp=now)
+    state.artist = TimestampedField(value="Artist", source=source_name, timestamp=now)
+    return state
+
+
+class TestStateHistory:
+    """Test StateHistory class."""
+
+    def test_records_transitions_only(self):
+        """Identical consecutive states are recorded once."""
+        history = StateHistory(capacity=8)
+
+        assert history.record(_state(), 1.0) is True
+        assert history.record(_state(), 2.0) is False
+        assert history.record(_state(play_state="pause"), 3.0) is True
+
+        entries = history.last()
+        assert [e["play_state"] for e in entries] == ["play", "pause"]
+        assert entries[0]["volume"] == 50
+        assert entries[0]["muted"] is False
+        assert entries[0]["source"] == "wifi"
+        assert entries[0]["track"] == "Artist - Song"
+        assert entries[0]["track_signature"] is not None
+
+    def test_records_winning_sources(self):
+        """Winning source per field is encoded and decoded."""
+        history = StateHistory(capacity=4)
+        state = _state(source_name="upnp")
+        state.source = TimestampedField(value="wifi", source="optimistic", timestamp=time.monotonic())
+
+        history.record(state, 1.0)
+
+        assert history.last(1)[0]["winners"] == {
+            "play_state": "upnp",
+            "volume": "upnp",
+            "source": "optimistic",
+            "title": "upnp",
+        }
+
+    def test_wraparound_keeps_newest(self):
+        """Oldest entries are overwritten when capacity is exceeded."""
+        history = StateHistory(capacity=3)
+        for volume in range(5):
+            history.record(_state(volume=volume), float(volume))
+
+        assert len(history) == 3
+        assert history.total_recorded == 5
+        assert [e["volume"] for e in history.last()] == [2, 3, 4]
+        assert [e["volume"] for e in history.last(2)] == [3, 4]
+
+    def test_float_volume_encoded_as_percent(self):
+        """Float volume (0.0-1.0) is stored as a percentage."""
+        history = StateHistory(capacity=2)
+        history.record(_state(volume=0.35), 1.0)
+
+        assert history.last(1)[0]["volume"] == 35
+
+    def test_empty_state(self):
+        """Empty state decodes to None values."""
+        history = StateHistory(capacity=2)
+        history.record(SynchronizedState(), 1.0)
+
+        entry = history.last(1)[0]
+        assert entry["play_state"] is None
+        assert entry["volume"] is None
+        assert entry["muted"] is None
+        assert entry["track"] is None
+
+    def test_export_and_clear(self):
+        """Export is serializable and clear resets the buffer."""
+        history = StateHistory(capacity=4)
+        history.record(_state(), 1.0)
+
+        exported = history.export()
+        assert exported["capacity"] == 4
+        assert exported["total_recorded"] == 1
+        assert len(exported["entries"]) == 1
+
+        history.clear()
+        assert history.last() == []
+
+    def test_invalid_capacity(self):
+        """Capacity must be positive."""
+        with pytest.raises(ValueError):
+            StateHistory(capacity=0)
+
+
+class TestStateSynchronizerHistory:
+    """Test history recording from StateSynchronizer merges."""
+
+    def test_merge_records_history(self):
+        """Merged-state transitions are recorded with the winning source."""
+        sync = StateSynchronizer()
+        sync.update_from_http({"play_state": "play", "volume": 40, "source": "wifi"})
+        sync.update_from_http({"play_state": "play", "volume": 40, "source": "wifi"})
+        sync.update_from_upnp({"play_state": "PAUSED_PLAYBACK"})
+
+        entries = sync.history.last()
+        assert [e["play_state"] for e in entries] == ["play", "pause"]
+        assert entries[-1]["winners"]["play_state"] == "upnp"
+
+    def test_history_disabled(self):
+        """history_size=0 disables recording."""
+        sync = StateSynchronizer(history_size=0)
+        sync.update_from_http({"play_state": "play"})
+
+        assert sync.history is None
@@ -13,6 +13,15 @@ from pywiim.exceptions import WiiMError
 from pywiim.models import DeviceInfo, PlayerStatus
 
 
+def _body(data):
+    """Mock ``response.content.iter_chunked`` serving data in one chunk."""
+
+    async def iter_chunked(size):
+        yield data
+
+    return iter_chunked
+
+
 class TestPlayerInitialization:
     """Test Player initialization."""
 
@@ -1307,6 +1316,33 @@ class TestPlayerSourceConflicts:
             requested_count=0,
         )
 
+    @pytest.mark.asyncio
+    async def test_get_queue_cached_page_positions(self, mock_client):
+        """Identical queue pages are parsed once; positions follow starting_index."""
+        from pywiim.player import Player
+        from pywiim.player.media import _QUEUE_DIDL_CACHE
+        from pywiim.upnp.client import UpnpClient
+
+        didl = (
+            '<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            "<item><res>http://example.com/cached.mp3</res><dc:title>Cached</dc:title></item>"
+            "</DIDL-Lite>"
+        )
+        mock_upnp_client = MagicMock(spec=UpnpClient)
+        mock_upnp_client.browse_queue = AsyncMock(return_value={"Result": didl, "TotalMatches": 11})
+        _QUEUE_DIDL_CACHE.clear()
+
+        player = Player(mock_client, upnp_client=mock_upnp_client)
+        first = await player.get_queue(starting_index=0)
+        first[0]["title"] = "Mutated"
+        second = await player.get_queue(starting_index=10)
+
+        assert second[0]["position"] == 10
+        assert second[0]["title"] == "Cached"
+        assert first[0]["position"] == 0
+        assert (_QUEUE_DIDL_CACHE.hits, _QUEUE_DIDL_CACHE.misses) == (1, 1)
+
     @pytest.mark.asyncio
     async def test_get_queue_with_custom_object_id(self, mock_client):
         """Test get_queue with custom object ID."""
@@ -2302,7 +2338,7 @@ class TestPlayerMediaMetadata:
         mock_headers = MagicMock()
         mock_headers.get = MagicMock(return_value="image/jpeg")
         mock_response.headers = mock_headers
-        mock_response.read = AsyncMock(return_value=b"fake_image_data")
+        mock_response.content.iter_chunked = _body(b"fake_image_data")
         # Make it work as async context manager - __aenter__ returns self
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -2340,7 +2376,7 @@ class TestPlayerMediaMetadata:
         mock_headers = MagicMock()
         mock_headers.get = MagicMock(return_value="image/png")
         mock_response.headers = mock_headers
-        mock_response.read = AsyncMock(return_value=b"track_image_data")
+        mock_response.content.iter_chunked = _body(b"track_image_data")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -2403,7 +2439,7 @@ class TestPlayerMediaMetadata:
         mock_headers = MagicMock()
         mock_headers.get = MagicMock(return_value="image/jpeg")
         mock_response.headers = mock_headers
-        mock_response.read = AsyncMock(return_value=b"cached_image_data")
+        mock_response.content.iter_chunked = _body(b"cached_image_data")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -2489,7 +2525,7 @@ class TestPlayerMediaMetadata:
         mock_headers = MagicMock()
         mock_headers.get = MagicMock(return_value="image/jpeg")
         mock_response.headers = mock_headers
-        mock_response.read = AsyncMock(return_value=b"image_data")
+        mock_response.content.iter_chunked = _body(b"image_data")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -2521,7 +2557,7 @@ class TestPlayerMediaMetadata:
         mock_headers = MagicMock()
         mock_headers.get = MagicMock(return_value="image/jpeg")
         mock_response.headers = mock_headers
-        mock_response.read = AsyncMock(return_value=b"image_bytes")
+        mock_response.content.iter_chunked = _body(b"image_bytes")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -5653,7 +5689,7 @@ class TestPlayerSourceConflictScenarios:
         from pywiim.player import Player
         from pywiim.upnp.client import UpnpClient
 
-        now = time.time()
+        now = time.monotonic()
 
         # Setup player with UPnP client
         mock_upnp_client = MagicMock(spec=UpnpClient)
@@ -5714,7 +5750,7 @@ class TestPlayerSourceConflictScenarios:
         from pywiim.player import Player
         from pywiim.upnp.client import UpnpClient
 
-        now = time.time()
+        now = time.monotonic()
 
         # Setup player with UPnP client
         mock_upnp_client = MagicMock(spec=UpnpClient)
@@ -5774,7 +5810,7 @@ class TestPlayerStateTransitions:
         from pywiim.models import DeviceInfo, PlayerStatus
         from pywiim.player import Player
 
-        now = time.time()
+        now = time.monotonic()
 
         player = Player(mock_client)
         player._status_model = PlayerStatus(play_state="play", volume=50)
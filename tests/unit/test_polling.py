@@ -6,6 +6,7 @@ Tests PollingStrategy and TrackChangeDetector.
 from __future__ import annotations
 
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -47,18 +48,30 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
         # Set last playing time to be < 30 seconds ago (within active idle window)
-        strategy._last_playing_time = time.time() - 10
+        strategy._last_playing_time = time.monotonic() - 10
 
         interval = strategy.get_optimal_interval("master", is_playing=False)
 
         assert interval == 1.0  # Fast poll during active idle window
 
+    def test_get_optimal_interval_uses_monotonic_clock(self):
+        """Active idle window is measured on the monotonic clock."""
+        capabilities = {"is_legacy_device": False}
+        strategy = PollingStrategy(capabilities)
+        strategy.get_optimal_interval("master", is_playing=True)
+
+        # A wall-clock step backwards must not extend or end the active idle window
+        with patch("pywiim.polling.time.time", return_value=0.0):
+            interval = strategy.get_optimal_interval("master", is_playing=False)
+
+        assert interval == 1.0
+
     def test_get_optimal_interval_wiim_idle(self):
         """Test optimal interval for WiiM device idle."""
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
         # Set last playing time to be > 30 seconds ago to get normal interval
-        strategy._last_playing_time = time.time() - 60
+        strategy._last_playing_time = time.monotonic() - 60
 
         interval = strategy.get_optimal_interval("master", is_playing=False)
 
@@ -112,7 +125,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 61.0  # 61 seconds ago
 
         assert strategy.should_fetch_configuration(last_fetch, now=now) is True
@@ -122,7 +135,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 30.0  # 30 seconds ago
 
         assert strategy.should_fetch_configuration(last_fetch, now=now) is False
@@ -153,7 +166,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 61.0  # 61 seconds ago
 
         assert strategy.should_fetch_configuration(last_fetch, now=now) is True
@@ -163,7 +176,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 61.0  # 61 seconds ago
 
         assert (
@@ -176,7 +189,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 10.0  # 10 seconds ago (would normally not fetch)
 
         assert (
@@ -203,7 +216,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 61.0  # 61 seconds ago
 
         assert strategy.should_fetch_eq_info(last_fetch, eq_supported=True, now=now) is True
@@ -220,7 +233,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 30.0  # 30 seconds ago
 
         assert strategy.should_fetch_eq_info(last_fetch, eq_supported=True, now=now) is False
@@ -237,7 +250,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 61.0  # 61 seconds ago
 
         assert strategy.should_fetch_device_info(last_fetch, now=now) is True
@@ -247,7 +260,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 30.0  # 30 seconds ago
 
         assert strategy.should_fetch_device_info(last_fetch, now=now) is False
@@ -264,7 +277,7 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 16.0  # 16 seconds ago (more than 15s interval)
 
         assert strategy.should_fetch_multiroom(last_fetch, now=now) is True
@@ -274,11 +287,51 @@ class TestPollingStrategy:
         capabilities = {"is_legacy_device": False}
         strategy = PollingStrategy(capabilities)
 
-        now = time.time()
+        now = time.monotonic()
         last_fetch = now - 10.0  # 10 seconds ago (less than 15s interval)
 
         assert strategy.should_fetch_multiroom(last_fetch, now=now) is False
 
+    def test_select_batched_tiers_nothing_due(self):
+        """Test batched selection is empty when no tier is due."""
+        strategy = PollingStrategy({})
+
+        now = time.monotonic()
+        tiers = {"eq_presets": now - 55.0, "presets": now - 10.0}
+
+        assert strategy.select_batched_tiers(tiers, now=now) == set()
+
+    def test_select_batched_tiers_pulls_forward_due_soon(self):
+        """Test tiers due within the batch window are pulled into the same pass."""
+        strategy = PollingStrategy({})
+
+        now = time.monotonic()
+        tiers = {
+            "bt_history": now - 61.0,  # Due
+            "eq_presets": now - 50.0,  # Due within 20% window (>= 48s)
+            "presets": now - 20.0,  # Not due soon
+        }
+
+        assert strategy.select_batched_tiers(tiers, now=now) == {"bt_history", "eq_presets"}
+
+    def test_select_batched_tiers_never_fetched(self):
+        """Test never-fetched tiers trigger a batch."""
+        strategy = PollingStrategy({})
+
+        now = time.monotonic()
+        tiers = {"subwoofer": None, "eq_status": 0, "presets": now - 50.0}
+
+        assert strategy.select_batched_tiers(tiers, now=now) == {"subwoofer", "eq_status", "presets"}
+
+    def test_select_batched_tiers_custom_window(self):
+        """Test custom look-ahead window."""
+        strategy = PollingStrategy({})
+
+        now = time.monotonic()
+        tiers = {"bt_history": now - 60.0, "presets": now - 35.0}
+
+        assert strategy.select_batched_tiers(tiers, now=now, window=0.5) == {"bt_history", "presets"}
+
 
 class TestTrackChangeDetector:
     """Test TrackChangeDetector class."""
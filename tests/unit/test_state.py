@@ -6,6 +6,7 @@ Tests StateSynchronizer and GroupStateSynchronizer for merging HTTP and UPnP dat
 from __future__ import annotations
 
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -62,25 +63,37 @@ class TestTimestampedField:
 
     def test_is_fresh(self):
         """Test checking if field is fresh."""
-        now = time.time()
+        now = time.monotonic()
         field = TimestampedField(value="test", source="http", timestamp=now - 1.0)
 
         assert field.is_fresh("play_state", now) is True  # 1s < 5s window
 
     def test_is_stale(self):
         """Test checking if field is stale."""
-        now = time.time()
+        now = time.monotonic()
         field = TimestampedField(value="test", source="http", timestamp=now - 10.0)
 
         assert field.is_fresh("play_state", now) is False  # 10s > 5s window
 
     def test_age(self):
         """Test getting field age."""
-        now = time.time()
+        now = time.monotonic()
         field = TimestampedField(value="test", source="http", timestamp=now - 5.0)
 
         assert abs(field.age(now) - 5.0) < 0.1
 
+    def test_freshness_ignores_wall_clock_steps(self):
+        """Wall-clock (NTP) steps do not change field freshness."""
+        sync = StateSynchronizer()
+        sync.update_from_http({"play_state": "play"})
+
+        with patch("pywiim.state.time.time", return_value=time.time() + 3600):
+            assert sync._http_state["play_state"].is_fresh("play_state") is True
+            sync.update_from_upnp({"play_state": "PAUSED_PLAYBACK"})
+
+        assert sync.get_merged_state()["play_state"] == "pause"
+        assert sync._merged_state.http_available is True
+
 
 class TestStateSynchronizer:
     """Test StateSynchronizer class."""
@@ -93,6 +106,16 @@ class TestStateSynchronizer:
         assert sync._upnp_state == {}
         assert sync._merged_state is not None
 
+    def test_fresh_upnp_values(self):
+        """Only recent, non-None UPnP event values are reported as fresh."""
+        sync = StateSynchronizer()
+        now = time.monotonic()
+        sync.update_from_http({"volume": 30, "muted": False})
+        sync.update_from_upnp({"volume": 45, "muted": None}, timestamp=now)
+
+        assert sync.fresh_upnp_values(("volume", "muted")) == {"volume": 45}
+        assert sync.fresh_upnp_values(("volume",), now=now + 60) == {}
+
     def test_update_from_http(self):
         """Test updating from HTTP data."""
         sync = StateSynchronizer()
@@ -151,7 +174,7 @@ class TestStateSynchronizer:
         """Test merging when both sources present, UPnP is fresh."""
         sync = StateSynchronizer()
 
-        now = time.time()
+        now = time.monotonic()
         # HTTP data is stale
         sync.update_from_http({"play_state": "pause"}, timestamp=now - 10.0)
         # UPnP data is fresh
@@ -166,7 +189,7 @@ class TestStateSynchronizer:
         """Test merging using source priority."""
         sync = StateSynchronizer()
 
-        now = time.time()
+        now = time.monotonic()
         # Both fresh, use priority
         sync.update_from_http({"play_state": "pause"}, timestamp=now)
         sync.update_from_upnp({"play_state": "play"}, timestamp=now)
@@ -180,7 +203,7 @@ class TestStateSynchronizer:
         """Test merging metadata - UPnP preferred when both fresh (fires on track changes)."""
         sync = StateSynchronizer()
 
-        now = time.time()
+        now = time.monotonic()
         # Set play state first so metadata is preserved
         sync.update_from_http({"play_state": "play", "title": "HTTP Title"}, timestamp=now)
         sync.update_from_upnp({"play_state": "play", "title": "UPnP Title"}, timestamp=now)
@@ -257,7 +280,7 @@ class TestStateSynchronizer:
         # First, set volume from UPnP (stale - older timestamp)
         import time
 
-        old_time = time.time() - 20.0  # 20 seconds ago (stale)
+        old_time = time.monotonic() - 20.0  # 20 seconds ago (stale)
         sync.update_from_upnp({"volume": 50}, timestamp=old_time)
         merged1 = sync.get_merged_state()
         assert merged1["volume"] == 50
@@ -307,7 +330,7 @@ class TestGroupStateSynchronizer:
 
         sync = GroupStateSynchronizer()
         master_state = SynchronizedState()
-        master_state.play_state = TimestampedField(value="play", source="http", timestamp=time.time())
+        master_state.play_state = TimestampedField(value="play", source="http", timestamp=time.monotonic())
 
         sync.update_master_state(master_state)
 
@@ -320,7 +343,7 @@ class TestGroupStateSynchronizer:
 
         sync = GroupStateSynchronizer()
         slave_state = SynchronizedState()
-        slave_state.volume = TimestampedField(value=0.5, source="http", timestamp=time.time())
+        slave_state.volume = TimestampedField(value=0.5, source="http", timestamp=time.monotonic())
 
         sync.update_slave_state("192.168.1.101", slave_state)
 
@@ -362,16 +385,16 @@ class TestGroupStateSynchronizer:
 
         # Create master state
         master_state = SynchronizedState()
-        master_state.play_state = TimestampedField(value="play", source="http", timestamp=time.time())
-        master_state.volume = TimestampedField(value=0.5, source="http", timestamp=time.time())
-        master_state.muted = TimestampedField(value=False, source="http", timestamp=time.time())
-        master_state.title = TimestampedField(value="Test Song", source="http", timestamp=time.time())
+        master_state.play_state = TimestampedField(value="play", source="http", timestamp=time.monotonic())
+        master_state.volume = TimestampedField(value=0.5, source="http", timestamp=time.monotonic())
+        master_state.muted = TimestampedField(value=False, source="http", timestamp=time.monotonic())
+        master_state.title = TimestampedField(value="Test Song", source="http", timestamp=time.monotonic())
         sync.update_master_state(master_state)
 
         # Create slave state
         slave_state = SynchronizedState()
-        slave_state.volume = TimestampedField(value=0.75, source="http", timestamp=time.time())
-        slave_state.muted = TimestampedField(value=True, source="http", timestamp=time.time())
+        slave_state.volume = TimestampedField(value=0.75, source="http", timestamp=time.monotonic())
+        slave_state.muted = TimestampedField(value=True, source="http", timestamp=time.monotonic())
         sync.update_slave_state("192.168.1.101", slave_state)
 
         group_state = sync.build_group_state("192.168.1.100", ["192.168.1.101"])
@@ -472,7 +495,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         # Both sources fresh with different values
         sync.update_from_http({"play_state": "pause"}, timestamp=now)
         sync.update_from_upnp({"play_state": "play"}, timestamp=now)
@@ -489,7 +512,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["audio_pro_mkii"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         # Both sources fresh with different values
         sync.update_from_http({"play_state": "pause"}, timestamp=now)
         sync.update_from_upnp({"play_state": "play"}, timestamp=now)
@@ -506,7 +529,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         sync.update_from_http({"volume": 16}, timestamp=now)
         sync.update_from_upnp({"volume": 75}, timestamp=now + 0.1)
 
@@ -520,7 +543,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         # HTTP is within freshness window (10s), but represents an older value.
         sync.update_from_http({"volume": 16}, timestamp=now - 5.0)
         # New UPnP event has the latest value.
@@ -541,7 +564,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         # Keep device in "playing" mode so UPnP availability uses the short timeout path.
         sync.update_from_http({"play_state": "play"}, timestamp=now - 1.0)
 
@@ -561,7 +584,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["audio_pro_mkii"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         # Only HTTP data available
         sync.update_from_http({"play_state": "pause"}, timestamp=now)
 
@@ -574,7 +597,7 @@ class TestStateSynchronizerWithProfile:
         """Test legacy resolution still works when no profile set."""
         sync = StateSynchronizer()  # No profile
 
-        now = time.time()
+        now = time.monotonic()
         # HTTP stale, UPnP fresh
         sync.update_from_http({"play_state": "pause"}, timestamp=now - 10.0)
         sync.update_from_upnp({"play_state": "play"}, timestamp=now)
@@ -591,7 +614,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
 
         # HTTP has empty metadata, UPnP has values
         sync.update_from_http(
@@ -622,7 +645,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]  # HTTP preferred
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
 
         sync.update_from_http(
             {
@@ -652,7 +675,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         sync.update_from_http({"play_state": "play", "title": "HTTP Title"}, timestamp=now)
         sync.update_from_upnp({"play_state": "play", "title": "Unknown"}, timestamp=now)
 
@@ -662,7 +685,7 @@ class TestStateSynchronizerWithProfile:
     def test_image_url_rejects_un_known_and_non_http_urls(self):
         """image_url should ignore known sentinels and non-http(s) values."""
         sync = StateSynchronizer()
-        now = time.time()
+        now = time.monotonic()
 
         # Establish playing so metadata isn't cleared
         sync.update_from_http({"play_state": "play"}, timestamp=now)
@@ -688,7 +711,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
 
         # First update with metadata (this sets merged state)
         sync.update_from_http(
@@ -720,7 +743,7 @@ class TestStateSynchronizerWithProfile:
         """Test that propagated source is preferred over UPnP for metadata fields."""
         sync = StateSynchronizer()
 
-        now = time.time()
+        now = time.monotonic()
         # Set play_state first so metadata is preserved
         sync.update_from_http({"play_state": "play"}, timestamp=now)
         # Master propagates metadata to slave
@@ -748,7 +771,7 @@ class TestStateSynchronizerWithProfile:
         profile = PROFILES["wiim"]
         sync = StateSynchronizer(profile=profile)
 
-        now = time.time()
+        now = time.monotonic()
         # Set play_state first so metadata is preserved
         sync.update_from_http({"play_state": "play"}, timestamp=now)
         # Master propagates metadata to slave
@@ -774,7 +797,7 @@ class TestStateSynchronizerWithProfile:
         """Test race condition: propagated state vs slave's own HTTP refresh."""
         sync = StateSynchronizer()
 
-        now = time.time()
+        now = time.monotonic()
         # Set play_state first so metadata is preserved
         sync.update_from_http({"play_state": "play"}, timestamp=now - 5.0)
         # Slave receives its own HTTP refresh (stale data)
@@ -800,7 +823,7 @@ class TestStateSynchronizerWithProfile:
         """Test that propagated empty values are handled correctly."""
         sync = StateSynchronizer()
 
-        now = time.time()
+        now = time.monotonic()
         # Set play_state first so metadata is preserved
         sync.update_from_http({"play_state": "play"}, timestamp=now - 1.0)
         # Set initial metadata from UPnP (slave's own event)
@@ -3,6 +3,7 @@
 These are basic tests that mock the async_upnp_client dependencies.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -677,3 +678,71 @@ class TestUpnpClient:
         assert "volume" in snapshot
         assert "muted" in snapshot
         assert "available_actions" in snapshot
+
+
+class TestUpnpClientConcurrentActions:
+    """Test concurrent UPnP action calls."""
+
+    @staticmethod
+    def _client(max_concurrent_actions, delay=0.01, failing=()):
+        from pywiim.upnp.client import UpnpClient
+
+        client = UpnpClient(
+            "192.168.1.100",
+            "http://192.168.1.100/description.xml",
+            None,
+            max_concurrent_actions=max_concurrent_actions,
+        )
+        stats = {"active": 0, "peak": 0}
+
+        def make_action(name):
+            async def async_call(**kwargs):
+                stats["active"] += 1
+                stats["peak"] = max(stats["peak"], stats["active"])
+                await asyncio.sleep(delay)
+                stats["active"] -= 1
+                if name in failing:
+                    raise UpnpError(f"{name} failed")
+                return {"Action": name, "CurrentVolume": 25, "CurrentMute": True, "Actions": "Play,Stop"}
+
+            action = MagicMock()
+            action.async_call = async_call
+            return action
+
+        service = MagicMock()
+        service.action = MagicMock(side_effect=make_action)
+        client._av_transport_service = service
+        client._rendering_control_service = service
+        return client, stats
+
+    @pytest.mark.asyncio
+    async def test_async_call_actions_concurrent_with_cap(self):
+        """Batched actions overlap up to the per-device cap; failures are returned in place."""
+        client, stats = self._client(max_concurrent_actions=2, failing={"GetMute"})
+
+        results = await client.async_call_actions(
+            [
+                ("av_transport", "GetTransportInfo", {"InstanceID": 0}),
+                ("rendering_control", "GetMute", {"InstanceID": 0, "Channel": "Master"}),
+                ("av_transport", "GetPositionInfo", {"InstanceID": 0}),
+            ]
+        )
+
+        assert results[0]["Action"] == "GetTransportInfo"
+        assert isinstance(results[1], UpnpError)
+        assert results[2]["Action"] == "GetPositionInfo"
+        assert stats["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_full_state_snapshot_runs_concurrently(self):
+        """All snapshot fetches are in flight together; errors are collected per key."""
+        client, stats = self._client(max_concurrent_actions=6, failing={"GetPositionInfo"})
+
+        snapshot = await client.get_full_state_snapshot()
+
+        assert stats["peak"] == 6
+        assert snapshot["volume"] == 25
+        assert snapshot["muted"] is True
+        assert snapshot["available_actions"] == ["Play", "Stop"]
+        assert snapshot["position"] is None
+        assert "GetPositionInfo failed" in snapshot["errors"]["position"]
@@ -0,0 +1,61 @@
+"""Unit tests for UPnP event coalescing."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from pywiim.upnp.coalesce import EventCoalescer
+
+
+class TestEventCoalescer:
+    """Test EventCoalescer class."""
+
+    @pytest.mark.asyncio
+    async def test_merges_events_within_window(self):
+        """Later values win per field; raw variables are merged per service."""
+        flush = MagicMock()
+        coalescer = EventCoalescer(0.01, flush)
+
+        coalescer.add({"play_state": "transitioning", "title": "Song"}, {"LastChange": "a"}, "AVTransport")
+        coalescer.add({"play_state": "play"}, {"LastChange": "b"}, "AVTransport")
+        coalescer.add({"volume": 30}, {"LastChange": "c"}, "RenderingControl")
+        assert coalescer.pending
+        assert coalescer.pending_value("play_state") == "play"
+        flush.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        flush.assert_called_once_with(
+            {"play_state": "play", "title": "Song", "volume": 30},
+            {"AVTransport": {"LastChange": "b"}, "RenderingControl": {"LastChange": "c"}},
+        )
+        assert coalescer.statistics["batches"] == 1
+        assert coalescer.statistics["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_flush_and_cancel(self):
+        """flush() delivers immediately; cancel() drops the batch."""
+        flush = MagicMock()
+        coalescer = EventCoalescer(10.0, flush)
+
+        coalescer.add({"volume": 10}, {}, "RenderingControl")
+        coalescer.flush()
+        flush.assert_called_once_with({"volume": 10}, {"RenderingControl": {}})
+
+        coalescer.add({"volume": 20}, {}, "RenderingControl")
+        coalescer.cancel()
+        await asyncio.sleep(0)
+        assert flush.call_count == 1
+        assert not coalescer.pending
+
+    def test_without_event_loop_flushes_immediately(self):
+        """Outside an event loop every event is delivered directly."""
+        flush = MagicMock()
+        coalescer = EventCoalescer(0.05, flush)
+
+        coalescer.add({"muted": True}, {}, "RenderingControl")
+
+        flush.assert_called_once()
+        with pytest.raises(ValueError):
+            EventCoalescer(0, flush)
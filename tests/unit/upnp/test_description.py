@@ -0,0 +1,178 @@
+"""Unit tests for the UPnP description/SCPD document cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from async_upnp_client.const import HttpRequest, HttpResponse
+
+from pywiim.upnp.description import (
+    DescriptionCacheRequester,
+    UpnpDescriptionCache,
+    description_cache_key,
+)
+
+DESCRIPTION_URL = "http://192.168.1.100:49152/description.xml"
+SCPD_URL = "http://192.168.1.100:49152/upnp/rendertransportSCPD.xml"
+RC_SCPD_URL = "http://192.168.1.100:49152/upnp/RenderingControlSCPD.xml"
+
+DESCRIPTION_XML = """<?xml version="1.0"?>
+<root xmlns="urn:schemas-upnp-org:device-1-0">
+  <device>
+    <deviceType>urn:schemas-upnp-org:device:MediaRenderer:1</deviceType>
+    <friendlyName>Living Room</friendlyName>
+    <UDN>uuid:FF31F09E-1A5E-4F1A-9A1B-123456789ABC</UDN>
+    <serviceList>
+      <service>
+        <serviceType>urn:schemas-upnp-org:service:AVTransport:1</serviceType>
+        <serviceId>urn:upnp-org:serviceId:AVTransport</serviceId>
+        <SCPDURL>/upnp/rendertransportSCPD.xml</SCPDURL>
+        <controlURL>/upnp/control/rendertransport1</controlURL>
+        <eventSubURL>/upnp/event/rendertransport1</eventSubURL>
+      </service>
+      <service>
+        <serviceType>urn:schemas-upnp-org:service:RenderingControl:1</serviceType>
+        <serviceId>urn:upnp-org:serviceId:RenderingControl</serviceId>
+        <SCPDURL>/upnp/RenderingControlSCPD.xml</SCPDURL>
+        <controlURL>/upnp/control/rendercontrol1</controlURL>
+        <eventSubURL>/upnp/event/rendercontrol1</eventSubURL>
+      </service>
+    </serviceList>
+  </device>
+</root>"""
+
+SCPD_XML = """<?xml version="1.0"?>
+<scpd xmlns="urn:schemas-upnp-org:service-1-0">
+  <actionList/>
+  <serviceStateTable>
+    <stateVariable sendEvents="yes">
+      <name>LastChange</name>
+      <dataType>string</dataType>
+    </stateVariable>
+  </serviceStateTable>
+</scpd>"""
+
+
+def _network(documents):
+    """Create a requester stand-in serving documents over the 'network'."""
+    requester = MagicMock()
+    requester.async_http_request = AsyncMock(
+        side_effect=lambda request: (
+            HttpResponse(200, {}, documents[request.url]) if request.url in documents else HttpResponse(404, {}, None)
+        )
+    )
+    return requester
+
+
+class TestUpnpDescriptionCache:
+    """Test UpnpDescriptionCache class."""
+
+    def test_cache_key_normalizes_uuid(self):
+        """HTTP API UUIDs and UPnP UDNs map to the same key."""
+        udn_key = description_cache_key("uuid:FF31F09E-1A5E-4F1A-9A1B-123456789ABC", "4.8.123")
+        api_key = description_cache_key("ff31f09e1a5e4f1a9a1b123456789abc", "4.8.123")
+
+        assert udn_key == api_key == "ff31f09e1a5e4f1a9a1b123456789abc/4.8.123"
+        assert description_cache_key(None) is None
+
+    def test_lookup_respects_key(self):
+        """Entries stored for another firmware are misses; no key accepts any entry."""
+        cache = UpnpDescriptionCache()
+        documents = {DESCRIPTION_URL: DESCRIPTION_XML, SCPD_URL: SCPD_XML}
+        cache.put(DESCRIPTION_URL, description_cache_key("abc", "1.0"), documents)
+
+        assert cache.lookup(DESCRIPTION_URL, description_cache_key("abc", "1.0")) == documents
+        assert cache.lookup(DESCRIPTION_URL, description_cache_key("abc", "2.0")) is None
+        assert cache.lookup(DESCRIPTION_URL) == documents
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_disk_round_trip(self, tmp_path):
+        """A disk-backed cache survives process restarts; corrupt files are ignored."""
+        path = tmp_path / "upnp" / "descriptions.json"
+        documents = {DESCRIPTION_URL: DESCRIPTION_XML, SCPD_URL: SCPD_XML}
+
+        cache = UpnpDescriptionCache(path)
+        await cache.async_load()
+        cache.put(DESCRIPTION_URL, "abc/1.0", documents)
+        await cache.async_save()
+
+        reloaded = UpnpDescriptionCache(path)
+        await reloaded.async_load()
+        assert reloaded.lookup(DESCRIPTION_URL, "abc/1.0") == documents
+
+        path.write_text("{not json", encoding="utf-8")
+        corrupt = UpnpDescriptionCache(path)
+        await corrupt.async_load()
+        assert len(corrupt) == 0
+
+
+class TestDescriptionCacheRequester:
+    """Test DescriptionCacheRequester class."""
+
+    @pytest.mark.asyncio
+    async def test_serves_cached_and_records_fetched(self):
+        """Cached URLs are answered locally; other GETs are forwarded and recorded."""
+        network = _network({SCPD_URL: SCPD_XML})
+        requester = DescriptionCacheRequester(network, {DESCRIPTION_URL: DESCRIPTION_XML})
+
+        cached = await requester.async_http_request(HttpRequest("GET", DESCRIPTION_URL, {}, None))
+        fetched = await requester.async_http_request(HttpRequest("GET", SCPD_URL, {}, None))
+
+        assert cached.body == DESCRIPTION_XML
+        assert fetched.body == SCPD_XML
+        assert network.async_http_request.await_count == 1
+        assert requester.network_fetches == 1
+        assert requester.all_documents == {DESCRIPTION_URL: DESCRIPTION_XML, SCPD_URL: SCPD_XML}
+
+
+class TestUpnpClientDescriptionCache:
+    """Test UpnpClient creation with a description cache."""
+
+    @pytest.mark.asyncio
+    async def test_create_from_cache_without_network(self):
+        """A warm cache builds the device with no requests except background revalidation."""
+        from pywiim.upnp.client import UpnpClient
+
+        cache = UpnpDescriptionCache()
+        network = _network({DESCRIPTION_URL: DESCRIPTION_XML, SCPD_URL: SCPD_XML, RC_SCPD_URL: SCPD_XML})
+
+        with patch("pywiim.upnp.client.AiohttpSessionRequester", return_value=network):
+            session = MagicMock(closed=False)
+            first = await UpnpClient.create("192.168.1.100", DESCRIPTION_URL, session, description_cache=cache)
+            assert network.async_http_request.await_count == 3
+            assert cache.lookup(DESCRIPTION_URL) is not None
+
+            network.async_http_request.reset_mock()
+            second = await UpnpClient.create(
+                "192.168.1.100",
+                DESCRIPTION_URL,
+                session,
+                description_cache=cache,
+                cache_key=description_cache_key("FF31F09E1A5E4F1A9A1B123456789ABC"),
+            )
+            # Device built from cache - only the background revalidation touches the network
+            assert network.async_http_request.await_count == 0
+            assert second.av_transport is not None
+            await second._revalidate_task
+            assert network.async_http_request.await_count == 1
+
+        await first.close()
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_revalidation_refreshes_changed_description(self):
+        """A changed description is re-fetched and stored for the next creation."""
+        from pywiim.upnp.client import UpnpClient
+
+        changed = DESCRIPTION_XML.replace("Living Room", "Kitchen")
+        cache = UpnpDescriptionCache()
+        documents = {DESCRIPTION_URL: DESCRIPTION_XML, SCPD_URL: SCPD_XML, RC_SCPD_URL: SCPD_XML}
+        cache.put(DESCRIPTION_URL, "stale/unknown", documents)
+        network = _network({**documents, DESCRIPTION_URL: changed})
+
+        with patch("pywiim.upnp.client.AiohttpSessionRequester", return_value=network):
+            client = await UpnpClient.create("192.168.1.100", DESCRIPTION_URL, MagicMock(closed=False), cache)
+            await client._revalidate_task
+
+        assert cache.lookup(DESCRIPTION_URL)[DESCRIPTION_URL] == changed
+        await client.close()
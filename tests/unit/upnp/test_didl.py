@@ -0,0 +1,59 @@
+"""Unit tests for the DIDL-Lite parse cache."""
+
+import pytest
+
+from pywiim.upnp.didl import DidlCache
+
+
+class TestDidlCache:
+    """Test DidlCache class."""
+
+    def test_parses_each_blob_once(self):
+        """Identical blobs hit the cache; distinct blobs are parsed."""
+        cache = DidlCache(maxsize=4)
+        calls = []
+
+        def parser(didl):
+            calls.append(didl)
+            return {"title": didl.upper()}
+
+        assert cache.get_or_parse("a", parser) == {"title": "A"}
+        assert cache.get_or_parse("a", parser) == {"title": "A"}
+        assert cache.get_or_parse("b", parser) == {"title": "B"}
+
+        assert calls == ["a", "b"]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_evicts_least_recently_used(self):
+        """Oldest unused entry is evicted when full."""
+        cache = DidlCache(maxsize=2)
+        cache.get_or_parse("a", str.upper)
+        cache.get_or_parse("b", str.upper)
+        cache.get_or_parse("a", str.upper)  # refresh "a"
+        cache.get_or_parse("c", str.upper)  # evicts "b"
+
+        assert len(cache) == 2
+        assert DidlCache.key("a") in cache._entries
+        assert DidlCache.key("b") not in cache._entries
+
+    def test_parser_errors_not_cached(self):
+        """A failing parse propagates and is retried next time."""
+        cache = DidlCache()
+
+        def parser(didl):
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            cache.get_or_parse("x", parser)
+        assert len(cache) == 0
+
+    def test_clear_and_invalid_size(self):
+        """clear() resets entries/counters; maxsize must be positive."""
+        cache = DidlCache()
+        cache.get_or_parse("a", str.upper)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.misses == 0
+        with pytest.raises(ValueError):
+            DidlCache(maxsize=0)
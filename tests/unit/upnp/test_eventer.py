@@ -3,11 +3,12 @@
 These are basic tests that mock the async_upnp_client dependencies.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from pywiim.upnp.eventer import UpnpEventer, _is_valid_url
+from pywiim.upnp.eventer import UpnpEventer, _is_valid_url, _parse_last_change_tree, _scan_last_change
 
 
 class TestIsValidUrl:
@@ -221,6 +222,44 @@ class TestUpnpEventer:
         assert eventer._event_count == 1
         mock_state_manager.apply_diff.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_on_event_coalesces_within_window(self):
+        """Events within the coalescing window produce one apply_diff and callback."""
+        mock_upnp_client = MagicMock()
+        mock_upnp_client.host = "192.168.1.100"
+        mock_state_manager = MagicMock()
+        mock_state_manager.apply_diff = MagicMock()
+        mock_state_manager.play_state = "stop"
+        callback = MagicMock()
+
+        mock_service = MagicMock()
+        mock_service.service_id = "AVTransport"
+
+        def _event(transport_state):
+            var = MagicMock()
+            var.name = "LastChange"
+            var.value = (
+                '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/"><InstanceID val="0">'
+                f'<TransportState val="{transport_state}"/></InstanceID></Event>'
+            )
+            return [var]
+
+        eventer = UpnpEventer(
+            mock_upnp_client, mock_state_manager, "test-uuid", state_updated_callback=callback, coalesce_window=0.01
+        )
+
+        eventer._on_event(mock_service, _event("TRANSITIONING"))
+        eventer._on_event(mock_service, _event("PLAYING"))
+        mock_state_manager.apply_diff.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        mock_state_manager.apply_diff.assert_called_once()
+        assert mock_state_manager.apply_diff.call_args[0][0]["play_state"] == "playing"
+        callback.assert_called_once()
+        assert eventer._event_count == 2
+        assert eventer.statistics["coalescing"]["coalesced"] == 1
+
     @pytest.mark.asyncio
     async def test_on_event_rendering_control(self):
         """Test parsing RenderingControl event."""
@@ -370,6 +409,60 @@ class TestUpnpEventer:
 
         assert changes == {}
 
+    def test_scan_last_change_fast_path(self):
+        """Simple Volume/Mute events are scanned without the tree parser."""
+        last_change = (
+            '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/RCS/"><InstanceID val="0">'
+            '<Volume channel="Master" val="42"/><Mute channel="LF" val="1"/>'
+            '<PresetNameList val="FactoryDefaults, Installation&amp;Setup"/>'
+            "</InstanceID></Event>"
+        )
+
+        variables = _scan_last_change(last_change)
+
+        assert variables == _parse_last_change_tree(last_change)
+        assert variables[0] == ("Volume", {"channel": "Master", "val": "42"})
+        assert variables[2][1]["val"] == "FactoryDefaults, Installation&Setup"
+
+    def test_scan_last_change_falls_back(self):
+        """Metadata-bearing or non-flat events use the full parser."""
+        metadata_event = (
+            '<Event><InstanceID val="0"><TransportState val="PLAYING"/>'
+            '<CurrentTrackMetaData val="&lt;DIDL-Lite&gt;&lt;/DIDL-Lite&gt;"/></InstanceID></Event>'
+        )
+        content_event = '<Event><InstanceID val="0"><Volume channel="Master">30</Volume></InstanceID></Event>'
+        char_ref_event = (
+            '<Event><InstanceID val="0"><TransportState val="&#80;LAYING"/>'
+            '<CurrentTrackURI val="http://x/a?b=1&#38;c=2"/></InstanceID></Event>'
+        )
+
+        assert _scan_last_change(metadata_event) is None
+        assert _scan_last_change(content_event) is None
+        assert _scan_last_change(char_ref_event) is None
+        assert _parse_last_change_tree(char_ref_event)[0] == ("TransportState", {"val": "PLAYING"})
+        assert _scan_last_change("invalid xml") is None
+
+        eventer = UpnpEventer(MagicMock(), MagicMock(), "test-uuid")
+        with patch("pywiim.upnp.eventer._parse_last_change_tree", wraps=_parse_last_change_tree) as tree:
+            changes = eventer._parse_last_change("AVTransport", metadata_event)
+        tree.assert_called_once()
+        assert changes["play_state"] == "playing"
+
+    def test_parse_last_change_namespaced_fast_path(self):
+        """Prefixed tags from the fast path match the tree parser output."""
+        eventer = UpnpEventer(MagicMock(), MagicMock(), "test-uuid")
+        last_change = (
+            '<e:Event xmlns:e="urn:schemas-upnp-org:metadata-1-0/AVT/"><e:InstanceID val="0">'
+            '<e:TransportState val="PAUSED_PLAYBACK"/><e:RelativeTimePosition val="00:01:05"/>'
+            "</e:InstanceID></e:Event>"
+        )
+
+        with patch("pywiim.upnp.eventer._parse_last_change_tree") as tree:
+            changes = eventer._parse_last_change("AVTransport", last_change)
+
+        tree.assert_not_called()
+        assert changes == {"play_state": "paused playback", "position": 65}
+
     def test_parse_time_position_seconds(self):
         """Test parsing time position as seconds."""
         from pywiim.upnp.eventer import UpnpEventer
@@ -540,6 +633,25 @@ class TestUpnpEventer:
 
         assert changes == {}
 
+    def test_parse_didl_metadata_cached(self):
+        """Repeated DIDL blobs are parsed once and allow_clear is applied per call."""
+        from pywiim.upnp.eventer import _DIDL_METADATA_CACHE
+
+        eventer = UpnpEventer(MagicMock(), MagicMock(), "test-uuid")
+        didl_xml = (
+            '<DIDL-Lite xmlns:dc="http://purl.org/dc/elements/1.1/" '
+            'xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/">'
+            "<item><dc:title>Cached Song</dc:title><upnp:artist></upnp:artist></item></DIDL-Lite>"
+        )
+        _DIDL_METADATA_CACHE.clear()
+
+        first = eventer._parse_didl_metadata(didl_xml, allow_clear=True)
+        second = eventer._parse_didl_metadata(didl_xml, allow_clear=False)
+
+        assert first == {"title": "Cached Song", "artist": None}
+        assert second == {"title": "Cached Song"}
+        assert (_DIDL_METADATA_CACHE.hits, _DIDL_METADATA_CACHE.misses) == (1, 1)
+
     def test_on_event_current_track_metadata(self):
         """Test handling CurrentTrackMetaData variable."""
         mock_upnp_client = MagicMock()
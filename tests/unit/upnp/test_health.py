@@ -123,7 +123,7 @@ class TestUpnpHealthTrackerOnPollUpdate:
         tracker = UpnpHealthTracker()
         tracker._last_poll_state = {"play_state": "stop"}
         tracker._last_upnp_state = {"play_state": "play"}
-        tracker._last_upnp_event_time = time.time()  # Recent event
+        tracker._last_upnp_event_time = time.monotonic()  # Recent event
 
         tracker.on_poll_update({"play_state": "play"})
 
@@ -148,7 +148,7 @@ class TestUpnpHealthTrackerOnPollUpdate:
         tracker._last_poll_state = {"play_state": "stop"}
         tracker._last_upnp_state = {"play_state": "play"}
         # Event 1 second ago (within grace period)
-        tracker._last_upnp_event_time = time.time() - 1.0
+        tracker._last_upnp_event_time = time.monotonic() - 1.0
 
         tracker.on_poll_update({"play_state": "play"})
 
@@ -162,7 +162,7 @@ class TestUpnpHealthTrackerOnPollUpdate:
         tracker._last_poll_state = {"play_state": "stop"}
         tracker._last_upnp_state = {"play_state": "play"}
         # Event 3 seconds ago (outside grace period)
-        tracker._last_upnp_event_time = time.time() - 3.0
+        tracker._last_upnp_event_time = time.monotonic() - 3.0
 
         tracker.on_poll_update({"play_state": "play"})
 
@@ -182,7 +182,7 @@ class TestUpnpHealthTrackerOnUpnpEvent:
 
         assert tracker._last_upnp_state == {"play_state": "play", "volume": 50}
         assert tracker._last_upnp_event_time is not None
-        assert abs(tracker._last_upnp_event_time - time.time()) < 1.0
+        assert abs(tracker._last_upnp_event_time - time.monotonic()) < 1.0
 
     def test_update_existing_state(self):
         """Test updating existing UPnP state."""
@@ -268,7 +268,7 @@ class TestUpnpHealthTrackerHealthStatus:
         # Create changes that UPnP catches (within grace period)
         for i in range(11):
             tracker._last_upnp_state = {"play_state": f"state{i}"}
-            tracker._last_upnp_event_time = time.time()
+            tracker._last_upnp_event_time = time.monotonic()
             tracker.on_poll_update({"play_state": f"state{i}"})
 
         # Should become healthy (miss rate < 20%)
@@ -286,7 +286,7 @@ class TestUpnpHealthTrackerHealthStatus:
                 import time
 
                 tracker._last_upnp_state = {"play_state": f"state{i}"}
-                tracker._last_upnp_event_time = time.time()
+                tracker._last_upnp_event_time = time.monotonic()
 
             tracker.on_poll_update({"play_state": f"state{i}"})
 
@@ -383,7 +383,7 @@ class TestUpnpHealthTrackerHelperMethods:
 
         tracker = UpnpHealthTracker()
         tracker._last_upnp_state = {"play_state": "play"}
-        tracker._last_upnp_event_time = time.time() - 1.0  # 1 second ago
+        tracker._last_upnp_event_time = time.monotonic() - 1.0  # 1 second ago
 
         result = tracker._upnp_saw_change("play_state", "play")
 
@@ -395,7 +395,7 @@ class TestUpnpHealthTrackerHelperMethods:
 
         tracker = UpnpHealthTracker()
         tracker._last_upnp_state = {"play_state": "pause"}
-        tracker._last_upnp_event_time = time.time() - 1.0
+        tracker._last_upnp_event_time = time.monotonic() - 1.0
 
         result = tracker._upnp_saw_change("play_state", "play")
 
@@ -0,0 +1,98 @@
+"""Unit tests for the shared UPnP notify server."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+class TestSharedNotifyServer:
+    """Test acquire/release of the process-wide notify server."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_shares_one_server(self):
+        """Clients with the same callback address share one started server."""
+        from pywiim.upnp.notify import (
+            acquire_shared_notify_server,
+            release_shared_notify_server,
+            shared_notify_server_count,
+        )
+
+        first = await acquire_shared_notify_server("192.168.1.100", ("127.0.0.1", 0))
+        second = await acquire_shared_notify_server("192.168.1.101", ("127.0.0.1", 0))
+
+        assert first is second
+        assert shared_notify_server_count() == 1
+        assert first.listen_port != 0
+
+        await release_shared_notify_server(first, "192.168.1.100")
+        assert shared_notify_server_count() == 1
+
+        await release_shared_notify_server(second, "192.168.1.101")
+        assert shared_notify_server_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_server_owns_its_session(self):
+        """Subscriptions survive a client closing its own session; the server's session closes with it."""
+        from pywiim.upnp.client import UpnpClient
+        from pywiim.upnp.notify import release_shared_notify_server
+
+        client_session = MagicMock(closed=False)
+        client = UpnpClient("192.168.1.100", "http://192.168.1.100/description.xml", client_session)
+        client._device = MagicMock()
+        with patch("pywiim.upnp.client.DmrDevice"):
+            server = await client.start_notify_server(callback_host="127.0.0.1", shared=True)
+
+        server_session = server.event_handler._requester._session
+        assert server_session is not client_session
+        assert not server_session.closed
+
+        await release_shared_notify_server(server, "192.168.1.100")
+        assert server_session.closed
+
+    @pytest.mark.asyncio
+    async def test_release_unknown_server(self):
+        """Releasing a non-shared server is a no-op."""
+        from pywiim.upnp.notify import release_shared_notify_server, shared_notify_server_count
+
+        await release_shared_notify_server(MagicMock(), "192.168.1.100")
+
+        assert shared_notify_server_count() == 0
+
+
+class TestUpnpClientSharedNotifyServer:
+    """Test UpnpClient integration with the shared notify server."""
+
+    @staticmethod
+    def _client(host):
+        from pywiim.upnp.client import UpnpClient
+
+        client = UpnpClient(host, f"http://{host}/description.xml", None)
+        client._device = MagicMock()
+        client._device.all_services = [MagicMock(), MagicMock()]
+        return client
+
+    @pytest.mark.asyncio
+    async def test_unwind_only_removes_own_subscriptions(self):
+        """Leaving a shared server unsubscribes only that client's SIDs."""
+        from pywiim.upnp.notify import shared_notify_server_count
+
+        client_a = self._client("192.168.1.100")
+        client_b = self._client("192.168.1.101")
+        with patch("pywiim.upnp.client.DmrDevice"):
+            server_a = await client_a.start_notify_server(callback_host="127.0.0.1", shared=True)
+            server_b = await client_b.start_notify_server(callback_host="127.0.0.1", shared=True)
+        assert server_a is server_b
+
+        event_handler = server_a.event_handler
+        for index, service in enumerate([*client_a._device.all_services, *client_b._device.all_services]):
+            event_handler._subscriptions[f"uuid:sid-{index}"] = service
+        event_handler.async_unsubscribe = AsyncMock(side_effect=lambda sid: event_handler._subscriptions.pop(sid, None))
+
+        await client_a.unwind_notify_server()
+
+        assert client_a._notify_server is None
+        assert sorted(event_handler._subscriptions) == ["uuid:sid-2", "uuid:sid-3"]
+        assert shared_notify_server_count() == 1
+
+        await client_b.unwind_notify_server()
+        assert shared_notify_server_count() == 0
@@ -0,0 +1,182 @@
+"""Unit tests for the central UPnP subscription renewal manager."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from async_upnp_client.exceptions import UpnpResponseError
+
+from pywiim.upnp.renewal import SubscriptionRenewalManager, get_renewal_manager
+
+
+def _target(delay=480.0):
+    """Create a renewal target stand-in."""
+    target = MagicMock()
+    target.async_renew_subscriptions = AsyncMock(return_value=delay)
+    return target
+
+
+class TestSubscriptionRenewalManager:
+    """Test SubscriptionRenewalManager class."""
+
+    @pytest.mark.asyncio
+    async def test_schedule_jitter_never_late(self):
+        """Jitter pulls renewals forward into earlier slots, never later."""
+        manager = SubscriptionRenewalManager(slot_seconds=5.0, jitter=0.1)
+        manager._ensure_task = MagicMock()  # Drive the wheel manually
+        target = _target()
+
+        with patch("pywiim.upnp.renewal.random.uniform", return_value=48.0):
+            manager.schedule(target, 480.0, now=1000.0)
+        assert manager._slot_of[target] == (1000 + 480 - 48) // 5
+
+        with patch("pywiim.upnp.renewal.random.uniform", return_value=0.0):
+            manager.schedule(target, 480.0, now=1000.0)
+        assert manager._slot_of[target] == (1000 + 480) // 5
+        assert len(manager) == 1
+
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_due_targets_renewed_as_one_batch(self):
+        """Targets in elapsed slots are renewed together and rescheduled."""
+        manager = SubscriptionRenewalManager(slot_seconds=5.0, jitter=0.0)
+        targets = [_target() for _ in range(3)]
+        manager._ensure_task = MagicMock()  # Drive the wheel manually
+        for target in targets[:2]:
+            manager.schedule(target, 10.0, now=0.0)
+        manager.schedule(targets[2], 100.0, now=0.0)
+
+        renewed = await manager.run_due(now=12.0)
+
+        assert renewed == 2
+        for target in targets[:2]:
+            target.async_renew_subscriptions.assert_awaited_once()
+        targets[2].async_renew_subscriptions.assert_not_awaited()
+        assert manager.statistics["batches"] == 1
+        assert manager.statistics["largest_batch"] == 2
+        assert manager.statistics["renewals"] == 2
+        assert len(manager) == 3  # Renewed targets are rescheduled
+
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_resubscribes_then_backs_off(self):
+        """First retry is immediate (resubscribe); later retries back off."""
+        manager = SubscriptionRenewalManager(slot_seconds=1.0, jitter=0.0)
+        manager._ensure_task = MagicMock()  # Drive the wheel manually
+        target = _target()
+        target.async_renew_subscriptions.side_effect = UpnpResponseError(status=412)
+        manager.schedule(target, 0.0)
+
+        await manager.run_due()
+        target.on_renewal_failed.assert_called_once()
+        assert manager._failures[target] == 1
+        assert manager._retry_delay(1) == 0.0
+        assert manager._retry_delay(2) == 5.0
+        assert manager._retry_delay(20) == 300.0
+
+        # Device came back with a fresh subscription
+        target.async_renew_subscriptions.side_effect = None
+        await manager.run_due()
+
+        stats = manager.statistics
+        assert stats["failures"] == 1
+        assert stats["resubscribes"] == 1
+        assert stats["retrying"] == 0
+
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_scheduler_task_runs_renewals(self):
+        """The background task renews targets when their slot starts."""
+        manager = SubscriptionRenewalManager(slot_seconds=0.01, jitter=0.0)
+        target = _target(delay=None)
+        manager.schedule(target, 0.02)
+
+        await asyncio.sleep(0.1)
+
+        target.async_renew_subscriptions.assert_awaited_once()
+        assert len(manager) == 0
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_cancel_and_shared_instance(self):
+        """Cancelled targets are not renewed; the manager is shared per loop."""
+        manager = get_renewal_manager()
+        target = _target()
+        manager.schedule(target, 0.0)
+        manager.cancel(target)
+
+        assert await manager.run_due() == 0
+        assert get_renewal_manager() is manager
+        await manager.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fails", [False, True])
+    async def test_cancel_during_renewal_is_not_rescheduled(self, fails):
+        """A target unsubscribed while its renewal is in flight stays off the wheel."""
+        manager = SubscriptionRenewalManager(slot_seconds=1.0, jitter=0.0)
+        manager._ensure_task = MagicMock()  # Drive the wheel manually
+        started = asyncio.Event()
+        release = asyncio.Event()
+        target = _target()
+
+        async def renew():
+            started.set()
+            await release.wait()
+            if fails:
+                raise UpnpResponseError(status=412)
+            return 480.0
+
+        target.async_renew_subscriptions.side_effect = renew
+        manager.schedule(target, 0.0)
+        batch = asyncio.create_task(manager.run_due())
+        await started.wait()
+
+        manager.cancel(target)
+        release.set()
+        await batch
+
+        assert len(manager) == 0
+        assert manager.statistics["retrying"] == 0
+        target.on_renewal_failed.assert_not_called()
+        await manager.close()
+
+    def test_invalid_arguments(self):
+        """Invalid configuration raises ValueError."""
+        with pytest.raises(ValueError):
+            SubscriptionRenewalManager(slot_seconds=0)
+        with pytest.raises(ValueError):
+            SubscriptionRenewalManager(jitter=1.0)
+        with pytest.raises(ValueError):
+            SubscriptionRenewalManager(max_concurrency=0)
+
+
+class TestEventerCentralRenewal:
+    """Test UpnpEventer integration with the renewal manager."""
+
+    @pytest.mark.asyncio
+    async def test_start_registers_with_manager(self):
+        """central_renewal subscribes without auto_resubscribe and schedules renewal."""
+        from datetime import timedelta
+
+        from pywiim.upnp.eventer import UpnpEventer
+
+        upnp_client = MagicMock()
+        upnp_client.start_notify_server = AsyncMock()
+        upnp_client.unwind_notify_server = AsyncMock()
+        upnp_client._dmr_device.async_subscribe_services = AsyncMock(return_value=timedelta(seconds=480))
+        upnp_client._dmr_device.async_unsubscribe_services = AsyncMock()
+        eventer = UpnpEventer(upnp_client, MagicMock(), "test-uuid")
+
+        await eventer.start(central_renewal=True)
+
+        upnp_client._dmr_device.async_subscribe_services.assert_awaited_once_with(auto_resubscribe=False)
+        manager = get_renewal_manager()
+        assert eventer in manager._slot_of
+        assert await eventer.async_renew_subscriptions() == 480.0
+
+        await eventer.async_unsubscribe()
+        assert eventer not in manager._slot_of
+        await manager.close()